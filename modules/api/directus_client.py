@@ -8,9 +8,15 @@ from typing import Any, Dict, Optional
 
 import requests
 
+from modules.utils import get_limiter, http_request
+from modules.utils.concurrency import observe
+from modules.utils.latency import adaptive_timeout
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30
+# Writes keep DEFAULT_TIMEOUT, see modules.data.directus_client
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
 
 
 class DirectusClient:
@@ -41,16 +47,22 @@ class DirectusClient:
 
     def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any] | None:
         url = f"{self.base_url.rstrip('/')}/{path.lstrip('/')}"
+        if method.upper() in READ_METHODS:
+            tracker, timeout = "directus", adaptive_timeout("directus", DEFAULT_TIMEOUT)
+        else:
+            tracker, timeout = "directus_write", DEFAULT_TIMEOUT
         try:
             logger.debug("Directus request %s %s", method, url)
-            resp = requests.request(
-                method,
-                url,
-                headers=self._headers(),
-                timeout=DEFAULT_TIMEOUT,
-                **kwargs,
-            )
-            resp.raise_for_status()
+            get_limiter("directus").acquire()
+            with observe(tracker, timeout=timeout):
+                resp = http_request(
+                    method,
+                    url,
+                    headers=self._headers(),
+                    timeout=timeout,
+                    **kwargs,
+                )
+                resp.raise_for_status()
         except requests.RequestException as exc:
             logger.error("Directus request failed: %s", exc)
             return None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from dotenv import load_dotenv
 
@@ -17,6 +19,8 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 ENV_PATH = CONFIG_DIR / ".env"
 ROOT_ENV_PATH = PROJECT_ROOT / ".env"
 SETTINGS_PATH = CONFIG_DIR / "settings.json"
+# Local on-disk caches (fetch cache, job journals, ...) live here
+CACHE_DIR = PROJECT_ROOT / "cache"
 
 # Load environment variables from config/.env if present.
 # Fall back to a project-level .env to support older setups.
@@ -26,22 +30,46 @@ elif ROOT_ENV_PATH.exists():
     load_dotenv(dotenv_path=ROOT_ENV_PATH)
 
 
+# Parsed settings keyed by (path, mtime, size) so hot paths calling
+# load_settings() per request do not re-read the file
+_settings_cache: Tuple[Tuple[str, int, int], Dict[str, Any]] | None = None
+_settings_lock = threading.Lock()
+
+
 def load_settings() -> Dict[str, Any]:
-    """Return settings dictionary loaded from config/settings.json if it exists."""
-    if SETTINGS_PATH.exists():
+    """Return settings dictionary loaded from config/settings.json if it exists.
+
+    The parsed file is cached until its modification time or size changes;
+    every call returns a fresh copy that callers may modify.
+    """
+    global _settings_cache
+    try:
+        stat = SETTINGS_PATH.stat()
+    except OSError:
+        return {}
+    key = (str(SETTINGS_PATH), stat.st_mtime_ns, stat.st_size)
+    with _settings_lock:
+        cached = _settings_cache
+    if cached is None or cached[0] != key:
         try:
             with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
         except Exception:
-            pass
-    return {}
+            return {}
+        cached = (key, data)
+        with _settings_lock:
+            _settings_cache = cached
+    return copy.deepcopy(cached[1])
 
 
 def save_settings(data: Dict[str, Any]) -> None:
     """Persist the provided settings dictionary to ``config/settings.json``."""
+    global _settings_cache
     SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    with _settings_lock:
+        _settings_cache = None
 
 
 def load_env() -> Dict[str, str]:
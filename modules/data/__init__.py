@@ -11,7 +11,9 @@ from .directus_client import (
     list_fields,
     fetch_items,
     fetch_items_filtered,
+    fetch_items_query,
     insert_items,
+    update_items,
     create_field,
     create_collection_if_missing,
     directus_request,
@@ -28,11 +30,23 @@ from .directus_mapper import (
     ensure_field_mapping,
     add_missing_mappings,
 )
-from .unified_fetcher import fetch_company_data, fetch_and_store
+from .unified_fetcher import (
+    fetch_company_data,
+    fetch_and_store,
+    fetch_company_data_batch,
+    fetch_and_store_batch,
+)
+from .merge import merge_sources, provenance_summary
+from .statement_store import StatementStore, fiscal_date, get_statement_store
+from .panel import StatementPanel, build_statement_panel
 from .financials import (
     fetch_statements,
+    fetch_statements_batch,
     store_statements,
+    upsert_statements,
+    upsert_report,
     fetch_and_store_statements,
+    fetch_and_store_statements_job,
 )
 
 __all__ = [
@@ -42,7 +56,9 @@ __all__ = [
     "list_fields",
     "fetch_items",
     "fetch_items_filtered",
+    "fetch_items_query",
     "insert_items",
+    "update_items",
     "create_field",
     "create_collection_if_missing",
     "directus_request",
@@ -62,7 +78,20 @@ __all__ = [
     "add_missing_mappings",
     "fetch_company_data",
     "fetch_and_store",
+    "fetch_company_data_batch",
+    "fetch_and_store_batch",
+    "merge_sources",
+    "provenance_summary",
+    "StatementStore",
+    "fiscal_date",
+    "get_statement_store",
+    "StatementPanel",
+    "build_statement_panel",
     "fetch_statements",
+    "fetch_statements_batch",
     "store_statements",
+    "upsert_statements",
+    "upsert_report",
     "fetch_and_store_statements",
+    "fetch_and_store_statements_job",
 ]
@@ -4,34 +4,102 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Dict, Tuple, Any
+from typing import Any, Dict, Iterable, Tuple
 
 import pandas as pd
 import yfinance as yf
 
-from modules.utils import get_openbb
+from modules.utils import get_limiter, get_openbb
+from modules.utils.circuit_breaker import get_breaker
 
 logger = logging.getLogger(__name__)
 
 ESSENTIAL_COLS = ["longName", "sector", "industry", "marketCap", "website"]
 
 
+# Symbols per multi-symbol OpenBB profile request
+OPENBB_PROFILE_CHUNK = 50
+
+
+def _request_profile_openbb(obb, symbols: str) -> pd.DataFrame:
+    """Return ``obb.equity.profile`` for comma-joined ``symbols``."""
+
+    def _profile() -> pd.DataFrame:
+        get_limiter("openbb").acquire()
+        return obb.equity.profile(symbol=symbols).to_df()
+
+    return get_breaker("openbb").call(_profile)
+
+
 def fetch_profile_openbb(symbol: str) -> pd.DataFrame:
     """Return company profile data via OpenBB or an empty DataFrame on error."""
 
     try:
-        obb = get_openbb()
-        obj = obb.equity.profile(symbol=symbol)
-        return obj.to_df()
+        return _request_profile_openbb(get_openbb(), symbol)
     except Exception as exc:  # pragma: no cover - network errors
         logger.error("OpenBB profile fetch error for %s: %s", symbol, exc)
         return pd.DataFrame()
 
 
+def _split_profiles(df: pd.DataFrame, symbols: list[str]) -> Dict[str, pd.DataFrame]:
+    """Split a multi-symbol profile frame into one frame per symbol."""
+
+    if df is None or df.empty:
+        return {}
+    if "symbol" not in df.columns:
+        # Without a symbol column only a single-symbol response can be attributed
+        return {symbols[0]: df.reset_index(drop=True)} if len(symbols) == 1 else {}
+    keys = df["symbol"].astype(str).str.upper()
+    return {
+        sym: df[keys == sym].reset_index(drop=True)
+        for sym in symbols
+        if (keys == sym).any()
+    }
+
+
+def fetch_profiles_openbb(
+    symbols: Iterable[str], *, chunk_size: int = OPENBB_PROFILE_CHUNK
+) -> Dict[str, pd.DataFrame]:
+    """Return OpenBB profiles for many ``symbols`` keyed by upper-case symbol.
+
+    Symbols are requested ``chunk_size`` at a time as one comma-joined
+    ``obb.equity.profile`` call and the result is split back per symbol.
+    Symbols missing from a chunk's response are retried one by one with
+    :func:`fetch_profile_openbb`; symbols without data map to an empty
+    DataFrame.
+    """
+
+    symbols = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+    found: Dict[str, pd.DataFrame] = {}
+    try:
+        obb = get_openbb()
+    except Exception as exc:  # pragma: no cover - OpenBB unavailable
+        logger.error("OpenBB unavailable: %s", exc)
+        return {sym: pd.DataFrame() for sym in symbols}
+
+    size = max(1, int(chunk_size))
+    for start in range(0, len(symbols), size):
+        chunk = symbols[start : start + size]
+        try:
+            df = _request_profile_openbb(obb, ",".join(chunk))
+        except Exception as exc:
+            logger.warning("OpenBB profile request failed for %s: %s", ",".join(chunk), exc)
+            df = pd.DataFrame()
+        found.update(_split_profiles(df, chunk))
+
+    missing = [sym for sym in symbols if sym not in found]
+    if missing:
+        logger.info("Fetching %d OpenBB profiles individually", len(missing))
+    for sym in missing:
+        found[sym] = fetch_profile_openbb(sym)
+    return {sym: found[sym] for sym in symbols}
+
+
 def fetch_profile_yf(symbol: str) -> pd.DataFrame:
     """Return company profile via yfinance or an empty DataFrame on error."""
 
     ticker = yf.Ticker(symbol)
+    get_limiter("yf").acquire()
     try:
         info = ticker.get_info()
     except Exception as exc:  # pragma: no cover - network errors
@@ -8,13 +8,18 @@ JSON dictionaries to keep them simple to test.
 
 from __future__ import annotations
 
+import json
 import logging
-import math
 import os
+from itertools import repeat
 from typing import Any, Dict, List, Iterable
 
+import numpy as np
+import pandas as pd
 import requests
-from modules.utils import parse_number
+from modules.utils import get_limiter, http_request, parse_number_series
+from modules.utils.concurrency import observe
+from modules.utils.latency import adaptive_timeout
 
 from modules.config_utils import load_settings  # noqa: E402
 
@@ -36,6 +41,16 @@ CF_ACCESS_CLIENT_SECRET = os.getenv("CF_ACCESS_CLIENT_SECRET") or os.getenv(
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30  # seconds
+# Only reads adapt their timeout to the recorded latency; bulk inserts and
+# updates take far longer than a GET and keep DEFAULT_TIMEOUT
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _timeout(method: str) -> tuple[str, float]:
+    """Return the latency tracker name and timeout for a ``method`` request."""
+    if method.upper() in READ_METHODS:
+        return "directus", adaptive_timeout("directus", DEFAULT_TIMEOUT)
+    return "directus_write", DEFAULT_TIMEOUT
 
 
 def _build_url(path: str) -> str:
@@ -62,15 +77,18 @@ def _make_request(method: str, url: str, **kwargs) -> Dict[str, Any] | None:
         **_headers(),
     }
 
+    tracker, timeout = _timeout(method)
     try:
-        resp = requests.request(
-            method,
-            url,
-            headers=headers,
-            timeout=DEFAULT_TIMEOUT,
-            **kwargs,
-        )
-        resp.raise_for_status()
+        get_limiter("directus").acquire()
+        with observe(tracker, timeout=timeout):
+            resp = http_request(
+                method,
+                url,
+                headers=headers,
+                timeout=timeout,
+                **kwargs,
+            )
+            resp.raise_for_status()
         logger.info(
             "Directus response %s %s status=%s content=%.200s",
             method,
@@ -129,13 +147,27 @@ def clean_record(record: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         A copy of ``record`` with problematic floats replaced by ``None``.
     """
-    cleaned = {}
-    for key, value in record.items():
-        val = parse_number(value)
-        if isinstance(val, float) and (math.isnan(val) or math.isinf(val)):
-            cleaned[key] = None
-        else:
-            cleaned[key] = val
+    return clean_records([record])[0]
+
+
+def clean_records(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Return sanitized copies of ``records`` as :func:`clean_record` would.
+
+    The values of all records are parsed in one vectorized pass.
+    """
+    records = list(records)
+    values = parse_number_series(
+        pd.Series([v for r in records for v in r.values()], dtype=object), infer=False
+    ).to_numpy()
+    is_float = np.fromiter(map(isinstance, values, repeat(float)), dtype=bool, count=len(values))
+    floats = np.flatnonzero(is_float)
+    bad = floats[~np.isfinite(values[floats].astype(float))]
+    values[bad] = None
+    cleaned = []
+    start = 0
+    for record in records:
+        cleaned.append(dict(zip(record, values[start : start + len(record)])))
+        start += len(record)
     return cleaned
 
 
@@ -177,7 +209,7 @@ def directus_request(method: str, path: str, **kwargs) -> Dict[str, Any] | None:
     Args:
         method: HTTP verb such as ``"GET"`` or ``"POST"``.
         path: API path relative to the Directus base URL.
-        **kwargs: Additional options forwarded to ``requests.request``.
+        **kwargs: Additional options forwarded to :func:`modules.utils.http_request`.
 
     Returns:
         Parsed JSON from the response or ``None`` if an error occurred.
@@ -225,6 +257,31 @@ def fetch_items_filtered(collection: str, params: Dict[str, Any]) -> list[Dict[s
     return _extract_data(result)
 
 
+def fetch_items_query(
+    collection: str,
+    *,
+    filter: Dict[str, Any] | None = None,
+    fields: Iterable[str] | None = None,
+    limit: int = -1,
+) -> list[Dict[str, Any]] | None:
+    """Fetch items from ``collection`` matching ``filter``.
+
+    The filter is sent JSON encoded and only ``fields`` are returned.  The
+    default ``limit=-1`` returns every match instead of the first page.
+    Returns ``None`` if the request failed, so callers can tell a failed
+    read from an empty result.
+    """
+    params: Dict[str, Any] = {"limit": limit}
+    if filter:
+        params["filter"] = json.dumps(filter)
+    if fields:
+        params["fields"] = ",".join(fields)
+    result = directus_request("GET", f"items/{collection}", params=params)
+    if result is None:
+        return None
+    return _extract_data(result)
+
+
 def insert_items(collection: str, items):
     """Insert one or more items into a Directus collection.
 
@@ -238,12 +295,9 @@ def insert_items(collection: str, items):
     if isinstance(items, dict):
         items = [items]
 
-    cleaned = []
-    for item in items:
-        if isinstance(item, dict):
-            cleaned.append(clean_record(item))
-        else:
-            cleaned.append(item)
+    items = list(items)
+    records = iter(clean_records(item for item in items if isinstance(item, dict)))
+    cleaned = [next(records) if isinstance(item, dict) else item for item in items]
 
     fields = cleaned[0].keys() if isinstance(cleaned[0], dict) else None
     create_collection_if_missing(collection, fields)
@@ -306,6 +360,23 @@ def update_item(collection: str, item_id: Any, updates: Dict[str, Any]):
     return data if data else None
 
 
+def update_items(collection: str, items: Iterable[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    """Update several items of ``collection`` in one request.
+
+    Every item is a partial record including its primary key ``id``.
+    """
+    items = clean_records(items)
+    if not items:
+        return []
+    result = directus_request("PATCH", f"items/{collection}", json=items)
+    data = _extract_data(result)
+    if not data:
+        logger.warning(
+            "Update returned no data for %s | status/content: %s", collection, result
+        )
+    return data
+
+
 def delete_item(collection: str, item_id: Any) -> bool:
     """Delete an item by ``item_id`` from ``collection``."""
     result = directus_request("DELETE", f"items/{collection}/{item_id}")
@@ -0,0 +1,509 @@
+"""Disk-backed cache for provider responses used by :mod:`modules.data.fetching`.
+
+Rows are stored in a small SQLite database keyed by ``(provider, ticker)``.
+Every field is additionally recorded with the source and time it was fetched
+so refreshes can be planned per field.  Each provider has its own
+time-to-live.  When ``stale_while_revalidate`` is
+enabled an expired row younger than ``max_stale`` seconds is returned at once
+and refreshed on a background thread.
+
+Configuration is read from the ``fetch_cache`` section of
+``config/settings.json``::
+
+    {
+      "fetch_cache": {
+        "enabled": true,
+        "ttl": {"yf": 900, "fmp": 3600},
+        "stale_while_revalidate": true,
+        "max_stale": 86400
+      }
+    }
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping
+
+import pandas as pd
+
+from modules.config_utils import CACHE_DIR, load_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = CACHE_DIR / "fetch_cache.sqlite"
+DEFAULT_TTL = 900  # seconds
+DEFAULT_MAX_STALE = 24 * 3600  # seconds
+# Backoff for tickers that failed: base delay doubled per failure, capped
+DEFAULT_NEGATIVE_TTL = 3600  # seconds
+DEFAULT_NEGATIVE_MAX_TTL = 7 * 24 * 3600  # seconds
+
+
+@dataclass
+class CacheEntry:
+    """Cached provider row with its age in seconds."""
+
+    provider: str
+    data: Dict[str, Any]
+    fetched_at: float
+    age: float
+
+
+@dataclass
+class FieldEntry:
+    """Last known value of one field with its source and age in seconds."""
+
+    value: Any
+    source: str
+    fetched_at: float
+    age: float
+
+
+@dataclass
+class FailureEntry:
+    """Negative cache record for a ticker that could not be fetched."""
+
+    provider: str
+    ticker: str
+    reason: str
+    failures: int
+    last_failed: float
+    retry_at: float
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the ticker may be retried (``0`` if it may now)."""
+        return max(0.0, self.retry_at - time.time())
+
+    @property
+    def blocked(self) -> bool:
+        """``True`` while the backoff period has not elapsed."""
+        return self.retry_in > 0
+
+
+def _encode(data: Mapping[str, Any]) -> str:
+    """Return JSON for ``data`` with missing values stored as ``null``."""
+
+    return json.dumps({k: _clean(v) for k, v in data.items()})
+
+
+def _clean(val: Any) -> Any:
+    """Return a JSON-serializable version of a scalar ``val``."""
+    if val is None or val is pd.NA:
+        return None
+    if isinstance(val, float) and math.isnan(val):
+        return None
+    if hasattr(val, "item"):  # numpy scalars
+        return val.item()
+    return val
+
+
+def _decode(text: str) -> Dict[str, Any]:
+    """Inverse of :func:`_encode` restoring ``pd.NA`` for missing values."""
+    return {k: (pd.NA if v is None else v) for k, v in json.loads(text).items()}
+
+
+class FetchCache:
+    """SQLite cache of provider rows with per-provider TTLs.
+
+    Parameters
+    ----------
+    path:
+        Location of the SQLite database file.
+    ttl:
+        Mapping of provider name to time-to-live in seconds.
+    default_ttl:
+        TTL used for providers missing from ``ttl``.
+    stale_while_revalidate:
+        Serve expired rows immediately and refresh them in the background.
+    max_stale:
+        Rows older than this many seconds are never served.
+    negative_ttl:
+        Backoff after the first failure of a ticker; doubled per failure.
+    negative_max_ttl:
+        Upper bound for the failure backoff.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_PATH,
+        *,
+        ttl: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL,
+        stale_while_revalidate: bool = False,
+        max_stale: float = DEFAULT_MAX_STALE,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        negative_max_ttl: float = DEFAULT_NEGATIVE_MAX_TTL,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_stale = max_stale
+        self.negative_ttl = negative_ttl
+        self.negative_max_ttl = negative_max_ttl
+        self._lock = threading.Lock()
+        self._refreshing: set[tuple[str, str]] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "negative_hits": 0,
+        }
+        # Running aggregates of the ages of served rows
+        self._age_count = 0
+        self._age_total = 0.0
+        self._age_max = 0.0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "provider TEXT NOT NULL, ticker TEXT NOT NULL, data TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, PRIMARY KEY (provider, ticker))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fields ("
+            "ticker TEXT NOT NULL, field TEXT NOT NULL, value TEXT, "
+            "source TEXT NOT NULL, fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (ticker, field))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS failures ("
+            "provider TEXT NOT NULL, ticker TEXT NOT NULL, reason TEXT NOT NULL, "
+            "failures INTEGER NOT NULL, last_failed REAL NOT NULL, "
+            "retry_at REAL NOT NULL, PRIMARY KEY (provider, ticker))"
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Basic storage
+    # ------------------------------------------------------------------
+    def ttl_for(self, provider: str) -> float:
+        """Return the TTL in seconds configured for ``provider``."""
+        return float(self.ttl.get(provider, self.default_ttl))
+
+    def get(self, provider: str, ticker: str) -> CacheEntry | None:
+        """Return the cached entry for ``(provider, ticker)`` regardless of age."""
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT data, fetched_at FROM rows WHERE provider = ? AND ticker = ?",
+                (provider, ticker.upper()),
+            )
+            found = cur.fetchone()
+        if found is None:
+            return None
+        data, fetched_at = found
+        return CacheEntry(provider, _decode(data), fetched_at, time.time() - fetched_at)
+
+    def set(
+        self,
+        provider: str,
+        ticker: str,
+        data: Mapping[str, Any],
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """Store ``data`` for ``(provider, ticker)`` stamped with the current time.
+
+        The individual ``fields`` (default: all keys of ``data``) are also
+        recorded in the field store with ``provider`` as their source.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rows (provider, ticker, data, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (provider, ticker.upper(), _encode(data), now),
+            )
+            self._write_fields(ticker, data, provider, fields, now)
+            self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # Field store
+    # ------------------------------------------------------------------
+    def _write_fields(
+        self,
+        ticker: str,
+        data: Mapping[str, Any],
+        source: str,
+        fields: Iterable[str] | None,
+        now: float,
+    ) -> None:
+        names = list(data) if fields is None else [f for f in fields if f in data]
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO fields (ticker, field, value, source, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (ticker.upper(), name, json.dumps(_clean(data[name])), source, now)
+                for name in names
+            ],
+        )
+
+    def set_fields(
+        self,
+        ticker: str,
+        data: Mapping[str, Any],
+        source: str,
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """Record ``fields`` of ``data`` (default: all) as fetched from ``source``."""
+        with self._lock:
+            self._write_fields(ticker, data, source, fields, time.time())
+            self._conn.commit()
+
+    def get_fields(self, ticker: str) -> Dict[str, FieldEntry]:
+        """Return the stored fields of ``ticker`` keyed by field name."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT field, value, source, fetched_at FROM fields WHERE ticker = ?",
+                (ticker.upper(),),
+            ).fetchall()
+        now = time.time()
+        result = {}
+        for field, value, source, fetched_at in found:
+            val = json.loads(value) if value is not None else None
+            result[field] = FieldEntry(
+                pd.NA if val is None else val, source, fetched_at, now - fetched_at
+            )
+        return result
+
+    def field_values(self, ticker: str) -> Dict[str, Any]:
+        """Return the stored field values of ``ticker`` without metadata."""
+        return {name: entry.value for name, entry in self.get_fields(ticker).items()}
+
+    def delete(self, provider: str, ticker: str) -> None:
+        """Remove a single cached row."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM rows WHERE provider = ? AND ticker = ?",
+                (provider, ticker.upper()),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached rows and reset statistics."""
+        with self._lock:
+            self._conn.execute("DELETE FROM rows")
+            self._conn.execute("DELETE FROM fields")
+            self._conn.execute("DELETE FROM failures")
+            self._conn.commit()
+            self._counters = dict.fromkeys(self._counters, 0)
+            self._age_count, self._age_total, self._age_max = 0, 0.0, 0.0
+
+    # ------------------------------------------------------------------
+    # Negative cache
+    # ------------------------------------------------------------------
+    def get_failure(self, provider: str, ticker: str) -> FailureEntry | None:
+        """Return the failure record for ``(provider, ticker)`` if any."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT reason, failures, last_failed, retry_at FROM failures "
+                "WHERE provider = ? AND ticker = ?",
+                (provider, ticker.upper()),
+            ).fetchone()
+        if found is None:
+            return None
+        return FailureEntry(provider, ticker.upper(), *found)
+
+    def record_failure(self, provider: str, ticker: str, reason: str) -> FailureEntry:
+        """Remember a failed fetch and back off exponentially before the next try."""
+        previous = self.get_failure(provider, ticker)
+        failures = (previous.failures if previous else 0) + 1
+        delay = min(self.negative_max_ttl, self.negative_ttl * 2 ** (failures - 1))
+        now = time.time()
+        entry = FailureEntry(provider, ticker.upper(), reason, failures, now, now + delay)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO failures "
+                "(provider, ticker, reason, failures, last_failed, retry_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (provider, entry.ticker, reason, failures, now, entry.retry_at),
+            )
+            self._conn.commit()
+        logger.info(
+            "Negative-cached %s/%s after %d failure(s); retry in %.0fs",
+            provider,
+            entry.ticker,
+            failures,
+            delay,
+        )
+        return entry
+
+    def clear_failure(self, provider: str, ticker: str) -> None:
+        """Forget the failure record for ``(provider, ticker)``."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM failures WHERE provider = ? AND ticker = ?",
+                (provider, ticker.upper()),
+            )
+            self._conn.commit()
+
+    def list_failures(self) -> list[FailureEntry]:
+        """Return every failure record, most recent first."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT provider, ticker, reason, failures, last_failed, retry_at "
+                "FROM failures ORDER BY last_failed DESC"
+            ).fetchall()
+        return [FailureEntry(*row) for row in found]
+
+    def record_negative_hit(self) -> None:
+        """Count a lookup answered by the negative cache."""
+        self._record("negative_hits")
+
+    # ------------------------------------------------------------------
+    # Lookup with TTL handling
+    # ------------------------------------------------------------------
+    def lookup(
+        self,
+        providers: Iterable[str],
+        ticker: str,
+        refresh: Mapping[str, Callable[[str], Dict[str, Any] | None]] | None = None,
+    ) -> Dict[str, Any] | None:
+        """Return a usable cached row for ``ticker`` or ``None`` on a miss.
+
+        ``providers`` are checked in order and the first fresh row wins.  If
+        none is fresh and stale-while-revalidate is enabled, the first stale
+        row within ``max_stale`` is returned and refreshed in the background
+        using the matching callable from ``refresh``.
+        """
+        stale: CacheEntry | None = None
+        for provider in providers:
+            entry = self.get(provider, ticker)
+            if entry is None:
+                continue
+            if entry.age <= self.ttl_for(provider):
+                self._record("hits", entry.age)
+                return entry.data
+            if stale is None and entry.age <= self.max_stale:
+                stale = entry
+
+        if stale is not None and self.stale_while_revalidate:
+            self._record("stale_hits", stale.age)
+            fetch = (refresh or {}).get(stale.provider)
+            if fetch is not None:
+                self._schedule_refresh(stale.provider, ticker, fetch)
+            return stale.data
+
+        self._record("misses")
+        return None
+
+    def _record(self, counter: str, age: float | None = None) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+            if age is not None:
+                self._age_count += 1
+                self._age_total += age
+                self._age_max = max(self._age_max, age)
+
+    def _schedule_refresh(
+        self, provider: str, ticker: str, fetch: Callable[[str], Dict[str, Any] | None]
+    ) -> None:
+        key = (provider, ticker.upper())
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="fetch-cache"
+                )
+            self._counters["refreshes"] += 1
+        self._executor.submit(self._refresh, provider, ticker, fetch)
+
+    def _refresh(
+        self, provider: str, ticker: str, fetch: Callable[[str], Dict[str, Any] | None]
+    ) -> None:
+        try:
+            data = fetch(ticker)
+            if data:
+                self.set(provider, ticker, data)
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.info("Background refresh of %s/%s failed: %s", provider, ticker, exc)
+        finally:
+            with self._lock:
+                self._refreshing.discard((provider, ticker.upper()))
+
+    def wait_for_refreshes(self) -> None:
+        """Block until all scheduled background refreshes have finished."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, served-row ages and the number of entries."""
+        with self._lock:
+            counters = dict(self._counters)
+            count, total, oldest = self._age_count, self._age_total, self._age_max
+            entries = self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+            failures = self._conn.execute("SELECT COUNT(*) FROM failures").fetchone()[0]
+        lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+        served = counters["hits"] + counters["stale_hits"]
+        return {
+            **counters,
+            "lookups": lookups,
+            "hit_rate": served / lookups if lookups else 0.0,
+            "mean_age": total / count if count else 0.0,
+            "max_age": oldest,
+            "entries": entries,
+            "failed_tickers": failures,
+        }
+
+
+_cache: FetchCache | None = None
+_cache_lock = threading.Lock()
+
+
+def _cache_settings() -> Dict[str, Any]:
+    return load_settings().get("fetch_cache", {}) or {}
+
+
+def cache_enabled() -> bool:
+    """Return ``True`` if ``fetch_cache.enabled`` is set in the settings."""
+    return bool(_cache_settings().get("enabled", False))
+
+
+def get_cache() -> FetchCache:
+    """Return the process-wide :class:`FetchCache` configured from settings."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            conf = _cache_settings()
+            _cache = FetchCache(
+                conf.get("path", DEFAULT_CACHE_PATH),
+                ttl=conf.get("ttl"),
+                default_ttl=conf.get("default_ttl", DEFAULT_TTL),
+                stale_while_revalidate=conf.get("stale_while_revalidate", False),
+                max_stale=conf.get("max_stale", DEFAULT_MAX_STALE),
+                negative_ttl=conf.get("negative_ttl", DEFAULT_NEGATIVE_TTL),
+                negative_max_ttl=conf.get("negative_max_ttl", DEFAULT_NEGATIVE_MAX_TTL),
+            )
+        return _cache
+
+
+def set_cache(cache: FetchCache | None) -> None:
+    """Replace the process-wide cache (``None`` rebuilds it from settings)."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return :meth:`FetchCache.stats` for the process-wide cache."""
+    return get_cache().stats()
@@ -2,18 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Sequence
 
 import pandas as pd
 import requests
 import yfinance as yf
+from yfinance.exceptions import YFRateLimitError
 
-from modules.config_utils import add_fmp_api_key
+from modules.config_utils import add_fmp_api_key, load_settings
 from modules.utils.progress_utils import progress_iter
-from modules.utils import parse_number
+from modules.utils.singleflight import SingleFlight
+from modules.utils import get_limiter, http_get, parse_number
+from modules.utils.circuit_breaker import CircuitOpenError, get_breaker, is_outage
+from modules.utils.concurrency import get_concurrency, observe
+from modules.utils.latency import adaptive_timeout, get_tracker
 
+from .fetch_cache import cache_enabled, get_cache
+from .jobs import JobReport, run_job
+from .providers import Provider, auto_providers, get_provider, provider_names, register_provider
 from .term_mapper import resolve_term
 
+logger = logging.getLogger(__name__)
+
 BASIC_FIELDS = [
     "Ticker",
     "Name",
@@ -29,7 +43,51 @@ BASIC_FIELDS = [
 FMP_PROFILE_URL = "https://financialmodelingprep.com/api/v3/profile/{symbol}"
 FMP_TIMEOUT = 10
 
-_PROVIDERS = {"auto", "yf", "fmp"}
+# yfinance quote endpoint accepting comma-separated symbol lists
+YF_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+YF_BULK_CHUNK = 200
+# Symbols per multi-symbol FMP profile request
+FMP_BATCH_SIZE = 50
+
+# Hedged lookups fire FMP once yfinance is slower than this latency percentile
+HEDGE_PERCENTILE = 95
+HEDGE_DEFAULT_DELAY = 2.0  # seconds, used until enough latencies are recorded
+HEDGE_MIN_SAMPLES = 20
+
+# Fields that rarely change and are not part of the yfinance quote response
+STATIC_FIELDS = ("Name", "Sector", "Industry")
+# Fields refreshed by the lightweight quote endpoint
+VOLATILE_FIELDS = ("Current Price", "Market Cap", "PE Ratio", "Dividend Yield")
+# Cache source name for rows produced by the quote endpoint
+QUOTE_SOURCE = "yf_quote"
+
+# Default maximum age in seconds of each field before it is refetched
+FIELD_TTLS = {
+    "Name": 30 * 24 * 3600,
+    "Sector": 30 * 24 * 3600,
+    "Industry": 30 * 24 * 3600,
+    "Current Price": 60,
+    "Market Cap": 60,
+    "PE Ratio": 3600,
+    "Dividend Yield": 24 * 3600,
+}
+
+
+class ProviderUnavailableError(ValueError):
+    """Raised when no row was returned because a provider was unreachable.
+
+    Unlike a plain :class:`ValueError` for tickers without data, these
+    failures are not recorded in the negative cache.
+    """
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` means the provider, not the ticker, failed.
+
+    :func:`modules.utils.circuit_breaker.is_outage` plus yfinance's rate
+    limit error; a 404 or a ticker without data is not an outage.
+    """
+    return isinstance(exc, YFRateLimitError) or is_outage(exc)
 
 
 def _parse_yf_info(info: Mapping[str, Any], ticker: str) -> dict[str, Any]:
@@ -46,15 +104,37 @@ def _parse_yf_info(info: Mapping[str, Any], ticker: str) -> dict[str, Any]:
     }
 
 
-def _fetch_from_fmp(ticker: str) -> dict[str, Any]:
-    """Return :data:`BASIC_FIELDS` information using the FMP profile endpoint."""
-    url = add_fmp_api_key(FMP_PROFILE_URL.format(symbol=ticker))
-    resp = requests.get(url, timeout=FMP_TIMEOUT)
-    resp.raise_for_status()
-    data = resp.json()
-    if not data or not isinstance(data, list):
-        return {}
-    row = data[0]
+def _parse_yf_quote(quote: Mapping[str, Any], ticker: str) -> dict[str, Any]:
+    """Convert a yfinance ``v7/finance/quote`` result into :data:`BASIC_FIELDS`."""
+    dividend = quote.get("dividendYield", quote.get("trailingAnnualDividendYield", pd.NA))
+    return {
+        "Ticker": ticker.upper(),
+        "Name": quote.get("longName") or quote.get("shortName") or "",
+        "Sector": resolve_term(quote.get("sector", "")),
+        "Industry": resolve_term(quote.get("industry", "")),
+        "Current Price": parse_number(quote.get("regularMarketPrice", pd.NA)),
+        "Market Cap": parse_number(quote.get("marketCap", pd.NA)),
+        "PE Ratio": parse_number(quote.get("trailingPE", pd.NA)),
+        "Dividend Yield": parse_number(dividend),
+    }
+
+
+def _is_missing(val: Any) -> bool:
+    """Return ``True`` for empty strings, ``None``, ``pd.NA`` and ``NaN``."""
+    if val is None or val is pd.NA or val == "":
+        return True
+    return isinstance(val, float) and val != val
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[list[str]]:
+    """Yield successive ``size``-sized lists from ``items``."""
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+def _parse_fmp_profile(row: Mapping[str, Any], ticker: str) -> dict[str, Any]:
+    """Convert one FMP profile entry into the :data:`BASIC_FIELDS` format."""
     return {
         "Ticker": ticker.upper(),
         "Name": row.get("companyName", ""),
@@ -67,23 +147,360 @@ def _fetch_from_fmp(ticker: str) -> dict[str, Any]:
     }
 
 
+def _request_fmp_profile(symbols: str) -> Any:
+    """Return the decoded FMP profile response for ``symbols``.
+
+    The request goes through the FMP rate limiter and circuit breaker;
+    :class:`CircuitOpenError` is raised while FMP is being skipped.
+    """
+
+    def _get() -> Any:
+        url = add_fmp_api_key(FMP_PROFILE_URL.format(symbol=symbols))
+        get_limiter("fmp").acquire()
+        timeout = adaptive_timeout("fmp", FMP_TIMEOUT)
+        with observe("fmp", timeout=timeout):
+            resp = http_get(url, timeout=timeout)
+            resp.raise_for_status()
+        return resp.json()
+
+    return get_breaker("fmp").call(_get)
+
+
+def _fetch_from_fmp(ticker: str) -> dict[str, Any]:
+    """Return :data:`BASIC_FIELDS` information using the FMP profile endpoint."""
+    data = _request_fmp_profile(ticker)
+    if not data or not isinstance(data, list):
+        return {}
+    return _parse_fmp_profile(data[0], ticker)
+
+
+def _fetch_many_from_fmp(tickers: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Return :data:`BASIC_FIELDS` rows for ``tickers`` from one FMP request.
+
+    The profile endpoint accepts comma-separated symbols.  Tickers missing
+    from the response are omitted from the result.
+    """
+    data = _request_fmp_profile(",".join(tickers))
+    if not data or not isinstance(data, list):
+        return {}
+    by_symbol = {str(row.get("symbol", "")).upper(): row for row in data}
+    return {
+        tk: _parse_fmp_profile(by_symbol[tk.upper()], tk)
+        for tk in tickers
+        if tk.upper() in by_symbol
+    }
+
+
 def _fetch_from_yf(ticker: str) -> dict[str, Any] | None:
-    """Return :data:`BASIC_FIELDS` information from yfinance or ``None``."""
+    """Return :data:`BASIC_FIELDS` information from yfinance or ``None``.
+
+    Outages (see :func:`_is_outage`) are raised instead of returning ``None``.
+    """
     ticker_obj = yf.Ticker(ticker)
+
+    def _get_info() -> Mapping[str, Any]:
+        get_limiter("yf").acquire()
+        with observe("yf"):
+            return ticker_obj.get_info()
+
     try:
-        info = ticker_obj.get_info()
-    except Exception:
+        info = get_breaker("yf").call(_get_info, is_failure=_is_outage)
+    except Exception as exc:
+        if _is_outage(exc):
+            raise
         return None
     if info and info.get("longName") is not None:
         return _parse_yf_info(info, ticker)
     return None
 
 
+def _yf_quote_many(symbols: Sequence[str]) -> dict[str, Mapping[str, Any]]:
+    """Return raw yfinance quote results keyed by upper-case symbol.
+
+    Uses yfinance's shared session (cookie and crumb handling included) to
+    request every symbol in one call.
+    """
+    from yfinance.data import YfData
+
+    def _get() -> Any:
+        get_limiter("yf").acquire()
+        return YfData().get_raw_json(
+            YF_QUOTE_URL, params={"symbols": ",".join(symbols), "formatted": "false"}
+        )
+
+    data = get_breaker("yf").call(_get, is_failure=_is_outage)
+    results = (data or {}).get("quoteResponse", {}).get("result") or []
+    return {str(q["symbol"]).upper(): q for q in results if q.get("symbol")}
+
+
+def _fill_static_from_cache(cache, row: dict[str, Any], ticker: str) -> dict[str, Any]:
+    """Fill empty :data:`STATIC_FIELDS` of ``row`` from any cached row."""
+    for source in ("yf", "fmp"):
+        if not any(_is_missing(row.get(f)) for f in STATIC_FIELDS):
+            break
+        entry = cache.get(source, ticker)
+        if entry is None:
+            continue
+        for field in STATIC_FIELDS:
+            if _is_missing(row.get(field)) and not _is_missing(entry.data.get(field)):
+                row[field] = entry.data[field]
+    return row
+
+
+def _has_cached_static(cache, ticker: str) -> bool:
+    """Return ``True`` if the fetch cache can supply every :data:`STATIC_FIELDS` of ``ticker``."""
+    row = _fill_static_from_cache(cache, {}, ticker)
+    return not any(_is_missing(row.get(f)) for f in STATIC_FIELDS)
+
+
+def _fetch_yf_bulk(
+    tickers: Sequence[str],
+    *,
+    chunk_size: int = YF_BULK_CHUNK,
+) -> dict[str, dict[str, Any]]:
+    """Return complete rows for ``tickers`` using chunked multi-symbol quotes.
+
+    The quote endpoint carries prices and valuation figures but no sector or
+    industry, so only tickers whose :data:`STATIC_FIELDS` are in the fetch
+    cache are requested; the quote fills the rest.  Every other ticker is
+    left out so the caller fetches it through the normal per-ticker path
+    instead of paying for a quote it would have to refetch anyway.
+    """
+    cache = get_cache()
+    tickers = list(dict.fromkeys(tickers))
+    warm = [tk for tk in tickers if _has_cached_static(cache, tk)]
+    rows: dict[str, dict[str, Any]] = {}
+    for chunk in _chunks(warm, chunk_size):
+        try:
+            quotes = _yf_quote_many(chunk)
+        except Exception as exc:
+            logger.warning("yfinance bulk quote failed for %d symbols: %s", len(chunk), exc)
+            continue
+        for tk in chunk:
+            quote = quotes.get(tk.upper())
+            if not quote:
+                continue
+            row = _fill_static_from_cache(cache, _parse_yf_quote(quote, tk), tk)
+            if any(_is_missing(row.get(f)) for f in STATIC_FIELDS):
+                continue
+            rows[tk] = row
+            cache.set(QUOTE_SOURCE, tk, row, fields=VOLATILE_FIELDS)
+    logger.info(
+        "yfinance bulk quotes completed %d of %d tickers (%d without cached static fields)",
+        len(rows),
+        len(tickers),
+        len(tickers) - len(warm),
+    )
+    return rows
+
+
+def _fetch_grouped(
+    name: str,
+    tickers: Sequence[str],
+    *,
+    batch_size: int | None = None,
+    use_cache: bool = False,
+    unavailable: set[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Return rows for ``tickers`` from provider ``name`` using multi-symbol requests.
+
+    Cached rows are served first; the rest is requested ``batch_size``
+    (default: the provider's own batch size) symbols at a time.  Tickers the
+    provider has no data for are omitted; those of failed requests are also
+    added to ``unavailable``.
+    """
+    source = get_provider(name)
+    cache = get_cache() if use_cache else None
+    rows: dict[str, dict[str, Any]] = {}
+    todo: list[str] = []
+    for tk in dict.fromkeys(tickers):
+        cached = None
+        if cache is not None:
+            cached = cache.lookup([name], tk, refresh={name: source.get})
+        if cached is not None:
+            rows[tk] = cached
+        else:
+            todo.append(tk)
+
+    for chunk in _chunks(todo, batch_size or source.batch_size):
+        try:
+            found = source.get_many(chunk)
+        except (requests.RequestException, CircuitOpenError) as exc:
+            logger.warning("%s request failed for %s: %s", source.label, ",".join(chunk), exc)
+            if unavailable is not None:
+                unavailable.update(chunk)
+            continue
+        for tk, row in found.items():
+            rows[tk] = row
+            if cache is not None:
+                cache.set(name, tk, row)
+    return rows
+
+
+def _fetch_each(
+    name: str,
+    tickers: Sequence[str],
+    *,
+    use_cache: bool = False,
+    unavailable: set[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Return rows for ``tickers`` from provider ``name`` one request at a time.
+
+    Tickers that failed because the provider was unavailable are added to
+    ``unavailable``.
+    """
+    rows = {}
+    for tk in dict.fromkeys(tickers):
+        try:
+            rows[tk] = fetch_basic_stock_data(
+                tk, provider=name, use_cache=use_cache, hedge=False
+            )
+        except ProviderUnavailableError:
+            if unavailable is not None:
+                unavailable.add(tk)
+        except ValueError:
+            continue
+    return rows
+
+
+_hedge_lock = threading.Lock()
+_hedge_counters = {"calls": 0, "hedged": 0, "primary_wins": 0, "secondary_wins": 0}
+_hedge_executor: ThreadPoolExecutor | None = None
+
+
+def _hedge_settings() -> dict[str, Any]:
+    return load_settings().get("hedging", {}) or {}
+
+
+def hedging_enabled() -> bool:
+    """Return ``True`` if ``hedging.enabled`` is set in the settings."""
+    return bool(_hedge_settings().get("enabled", False))
+
+
+def _hedge_count(counter: str) -> None:
+    with _hedge_lock:
+        _hedge_counters[counter] += 1
+
+
+def _hedge_delay() -> float:
+    """Return how long to wait for yfinance before also asking FMP."""
+    conf = _hedge_settings()
+    tracker = get_tracker("yf")
+    if len(tracker) < int(conf.get("min_samples", HEDGE_MIN_SAMPLES)):
+        return float(conf.get("default_delay", HEDGE_DEFAULT_DELAY))
+    return tracker.percentile(float(conf.get("percentile", HEDGE_PERCENTILE)))
+
+
+def _attempt(
+    label: str, fetch, ticker: str
+) -> tuple[dict[str, Any] | None, BaseException | None]:
+    """Return ``(row, outage)`` from ``fetch(ticker)`` without raising.
+
+    ``outage`` is the exception if the provider was unavailable; other
+    errors are logged and give ``(None, None)``.
+    """
+    try:
+        return fetch(ticker) or None, None
+    except Exception as exc:
+        logger.info("%s fetch failed for %s: %s", label, ticker, exc)
+        return None, exc if _is_outage(exc) else None
+
+
+def _fetch_hedged(ticker: str) -> tuple[str, dict[str, Any]] | None:
+    """Return ``(source, row)`` from yfinance, hedged with FMP.
+
+    yfinance is queried first.  If it has not answered within the configured
+    latency percentile, FMP is queried as well and the first complete answer
+    wins.  The slower request is left to finish in the background.  Returns
+    ``None`` if neither has data and raises :class:`ProviderUnavailableError`
+    if that is because one of them was unavailable.
+    """
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hedge")
+        ex = _hedge_executor
+    _hedge_count("calls")
+
+    primary = ex.submit(_attempt, "yfinance", _fetch_from_yf, ticker)
+    try:
+        row, outage = primary.result(timeout=_hedge_delay())
+    except FutureTimeout:
+        pass
+    else:
+        if row is not None:
+            _hedge_count("primary_wins")
+            return "yf", row
+        row, fmp_outage = _attempt("FMP", _fetch_from_fmp, ticker)
+        if row:
+            return "fmp", row
+        return _hedge_unavailable(ticker, outage or fmp_outage)
+
+    _hedge_count("hedged")
+    logger.info("yfinance slow for %s; hedging with FMP", ticker)
+    futures = {primary: "yf", ex.submit(_attempt, "FMP", _fetch_from_fmp, ticker): "fmp"}
+    outage = None
+    for fut in as_completed(futures):
+        row, exc = fut.result()
+        if row:
+            source = futures[fut]
+            _hedge_count("primary_wins" if source == "yf" else "secondary_wins")
+            return source, row
+        outage = outage or exc
+    return _hedge_unavailable(ticker, outage)
+
+
+def _hedge_unavailable(ticker: str, outage: BaseException | None) -> None:
+    if outage is not None:
+        raise ProviderUnavailableError(
+            f"yfinance or FMP unavailable for {ticker.upper()}: {outage}"
+        ) from outage
+    return None
+
+
+def hedge_stats() -> dict[str, Any]:
+    """Return hedged-call counters and the share of hedges won by FMP."""
+    with _hedge_lock:
+        stats: dict[str, Any] = dict(_hedge_counters)
+    stats["hedge_rate"] = stats["hedged"] / stats["calls"] if stats["calls"] else 0.0
+    stats["secondary_win_rate"] = (
+        stats["secondary_wins"] / stats["hedged"] if stats["hedged"] else 0.0
+    )
+    return stats
+
+
+def _validate_provider(provider: str) -> str:
+    """Return ``provider`` lower-cased or raise ``ValueError`` if unknown."""
+    provider = provider.lower()
+    names = provider_names()
+    if provider != "auto" and provider not in names:
+        raise ValueError(f"provider must be 'auto' or one of: {', '.join(names)}")
+    return provider
+
+
+def _provider_order(provider: str, fallback: bool) -> list[str]:
+    """Return the concrete sources consulted for ``provider`` in order.
+
+    ``"auto"`` follows the registered ``auto`` chain (yfinance, then FMP by
+    default), limited to its first entry without ``fallback``.
+    """
+    if provider != "auto":
+        return [provider]
+    chain = [p.name for p in auto_providers()]
+    return chain if fallback else chain[:1]
+
+
+_inflight = SingleFlight("fetch_basic_stock_data")
+
+
 def fetch_basic_stock_data(
     ticker: str,
     *,
     fallback: bool = True,
     provider: str = "auto",
+    use_cache: bool | None = None,
+    hedge: bool | None = None,
+    force: bool = False,
 ) -> dict:
     """Fetch key fundamental data for a ticker.
 
@@ -95,30 +512,124 @@ def fetch_basic_stock_data(
         When ``provider='auto'`` and yfinance returns incomplete data,
         query FMP as a secondary source.
     provider:
-        ``'yf'`` to use yfinance only, ``'fmp'`` for FMP only,
-        or ``'auto'`` (default) to try yfinance then FMP if ``fallback``.
+        Name of a registered provider (``'yf'``, ``'fmp'`` or one declared
+        in ``config/finance_api.yaml``, see :mod:`modules.data.providers`),
+        or ``'auto'`` (default) to try the ``auto`` chain, yfinance then
+        FMP, moving on only if ``fallback``.
+    use_cache:
+        Serve and store rows through :mod:`modules.data.fetch_cache`.
+        ``None`` (default) follows the ``fetch_cache.enabled`` setting.
+    hedge:
+        With ``provider='auto'``, also query FMP when yfinance has not
+        answered within its recent latency percentile and return whichever
+        completes first.  ``None`` (default) follows ``hedging.enabled``.
+    force:
+        Retry a ticker even if the negative cache says it failed recently.
+        Tickers for which every provider fails are remembered (when the
+        cache is used) and skipped with exponential backoff.
+
+    Concurrent calls for the same ticker and options share one request.
     """
 
-    provider = provider.lower()
+    provider = _validate_provider(provider)
 
-    if provider not in _PROVIDERS:
-        raise ValueError("provider must be 'auto', 'yf', or 'fmp'")
+    if hedge is None:
+        hedge = hedging_enabled()
+    key = (ticker.upper(), provider, fallback, use_cache, hedge, force)
+    return dict(
+        _inflight.do(
+            key,
+            _fetch_basic_stock_data,
+            ticker,
+            fallback=fallback,
+            provider=provider,
+            use_cache=use_cache,
+            hedge=hedge,
+            force=force,
+        )
+    )
 
-    if provider in {"auto", "yf"}:
-        yf_data = _fetch_from_yf(ticker)
-        if yf_data is not None:
-            return yf_data
-        if provider == "yf":
-            raise ValueError("No valid data returned by yfinance.")
 
-    if provider in {"auto", "fmp"} and fallback:
-        fmp_data = _fetch_from_fmp(ticker)
-        if fmp_data:
-            return fmp_data
-        if provider == "fmp":
-            raise ValueError("No valid data returned by FMP.")
+def _fetch_basic_stock_data(
+    ticker: str,
+    *,
+    fallback: bool,
+    provider: str,
+    use_cache: bool | None,
+    hedge: bool = False,
+    force: bool = False,
+) -> dict:
+    """Uncoalesced implementation of :func:`fetch_basic_stock_data`."""
+    if use_cache is None:
+        use_cache = cache_enabled()
+    if not use_cache:
+        return _fetch_from_providers(ticker, fallback=fallback, provider=provider, hedge=hedge)[1]
+
+    cache = get_cache()
+    order = _provider_order(provider, fallback)
+    cached = cache.lookup(
+        order, ticker, refresh={name: get_provider(name).get for name in order}
+    )
+    if cached is not None:
+        return cached
+
+    failure = cache.get_failure(provider, ticker)
+    if failure is not None and failure.blocked and not force:
+        cache.record_negative_hit()
+        raise ValueError(
+            f"{ticker.upper()} failed {failure.failures} time(s) ({failure.reason}); "
+            f"next retry in {failure.retry_in:.0f}s."
+        )
+
+    try:
+        source, row = _fetch_from_providers(
+            ticker, fallback=fallback, provider=provider, hedge=hedge
+        )
+    except ProviderUnavailableError:
+        raise
+    except ValueError as exc:
+        cache.record_failure(provider, ticker, str(exc))
+        raise
+    cache.set(source, ticker, row)
+    if failure is not None:
+        cache.clear_failure(provider, ticker)
+    return row
 
-    raise ValueError("No valid data returned by yfinance or FMP.")
+
+def _fetch_from_providers(
+    ticker: str, *, fallback: bool, provider: str, hedge: bool
+) -> tuple[str, dict[str, Any]]:
+    """Return ``(source, row)`` from the providers or raise ``ValueError``.
+
+    :class:`ProviderUnavailableError` is raised instead when a provider
+    failed with an outage and none of the others had data.
+    """
+    order = _provider_order(provider, fallback)
+    labels = " or ".join(get_provider(name).label for name in order)
+    outage = None
+    if hedge and order[:2] == ["yf", "fmp"]:
+        try:
+            result = _fetch_hedged(ticker)
+        except ProviderUnavailableError as exc:
+            outage, result = exc, None
+        if result is not None:
+            return result
+        order = order[2:]
+
+    for name in order:
+        try:
+            row = get_provider(name).get(ticker)
+        except Exception as exc:
+            if not _is_outage(exc):
+                raise
+            logger.info("%s unavailable for %s: %s", get_provider(name).label, ticker, exc)
+            outage, row = exc, None
+        if row:
+            return name, row
+
+    if outage is not None:
+        raise ProviderUnavailableError(f"{labels} unavailable: {outage}") from outage
+    raise ValueError(f"No valid data returned by {labels}.")
 
 
 def fetch_basic_stock_data_batch(
@@ -128,7 +639,12 @@ def fetch_basic_stock_data_batch(
     provider: str = "auto",
     dedup: bool = False,
     progress: bool = False,
-    max_workers: int | None = None,
+    max_workers: int | str | None = None,
+    use_cache: bool | None = None,
+    bulk: bool = False,
+    chunk_size: int = YF_BULK_CHUNK,
+    fmp_batch_size: int = FMP_BATCH_SIZE,
+    delta: bool = False,
 ) -> pd.DataFrame:
     """Fetch :func:`fetch_basic_stock_data` for multiple tickers.
 
@@ -148,6 +664,32 @@ def fetch_basic_stock_data_batch(
         both sequential and parallel execution.
     max_workers:
         If greater than 1, fetch tickers in parallel using ``ThreadPoolExecutor``.
+        ``"auto"`` adapts the number of requests in flight to the first
+        provider's observed latency and error rate, see
+        :mod:`modules.utils.concurrency`.
+    use_cache:
+        Passed through to :func:`fetch_basic_stock_data`.
+    bulk:
+        When ``True``, ``provider`` is ``"auto"`` or ``"yf"`` and the fetch
+        cache is used, tickers whose :data:`STATIC_FIELDS` are cached get
+        their prices from quote requests of ``chunk_size`` symbols; the
+        others take the normal per-ticker path.  A cold cache therefore gains
+        nothing, and without the cache ``bulk`` is ignored.
+    chunk_size:
+        Number of symbols per bulk quote request.
+    fmp_batch_size:
+        Number of symbols per FMP profile request.  Lookups from providers
+        with a multi-symbol endpoint (FMP, or the fallbacks of ``"auto"``)
+        are grouped into requests of the provider's ``batch_size`` instead
+        of one request per ticker.
+    delta:
+        Only refetch fields that are stale under the per-field TTLs, as
+        planned by :func:`plan_refresh` and executed by
+        :func:`refresh_quotes`.  Duplicates are dropped and tickers that
+        cannot be refreshed are omitted instead of raising.  ``provider``,
+        ``fallback``, ``progress``, ``chunk_size`` and ``max_workers`` apply;
+        ``bulk`` and ``fmp_batch_size`` do not.  Delta mode always uses the
+        fetch cache, so ``use_cache=False`` raises ``ValueError``.
 
     Returns
     -------
@@ -162,29 +704,433 @@ def fetch_basic_stock_data_batch(
     if not tickers:
         return pd.DataFrame(columns=BASIC_FIELDS)
 
+    provider = _validate_provider(provider)
+    if delta:
+        if use_cache is False:
+            raise ValueError("delta=True reads the fetch cache and needs use_cache")
+        return refresh_quotes(
+            tickers,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            provider=provider,
+            fallback=fallback,
+            progress=progress,
+        )
+    if use_cache is None:
+        use_cache = cache_enabled()
+    order = _provider_order(provider, fallback)
+    batch_sizes = {"fmp": fmp_batch_size}
+    # With fallback enabled, misses of the first provider are collected and
+    # resolved together by the rest of the chain.
+    group_fallback = len(order) > 1
+    # A ticker every provider failed for recently fails the batch up front
+    if group_fallback and use_cache:
+        cache = get_cache()
+        for tk in dict.fromkeys(tickers):
+            failure = cache.get_failure(provider, tk)
+            if failure is not None and failure.blocked:
+                cache.record_negative_hit()
+                raise ValueError(
+                    f"{tk.upper()} failed {failure.failures} time(s) ({failure.reason}); "
+                    f"next retry in {failure.retry_in:.0f}s."
+                )
+    unavailable: set[str] = set()
+
+    prefetched: dict[str, dict[str, Any]] = {}
+    if bulk and order[:1] == ["yf"] and use_cache:
+        prefetched = _fetch_yf_bulk(tickers, chunk_size=chunk_size)
+    elif len(order) == 1 and get_provider(order[0]).fetch_many is not None:
+        prefetched = _fetch_grouped(
+            order[0], tickers, batch_size=batch_sizes.get(order[0]), use_cache=use_cache
+        )
+    # Tickers still missing are fetched one by one (and fail individually)
+    pending = [tk for tk in tickers if tk not in prefetched]
+
     rows: list[dict[str, Any]] = []
-    total = len(tickers)
+    total = len(pending)
+
+    adaptive = get_concurrency(order[0]) if max_workers == "auto" else None
+    if adaptive is not None:
+        max_workers = adaptive.maximum
 
-    def _worker(args: tuple[int, str]) -> dict[str, Any]:
+    def _worker(args: tuple[int, str]) -> dict[str, Any] | None:
+        if adaptive is not None:
+            with adaptive.slot():
+                return _fetch_one(args)
+        return _fetch_one(args)
+
+    def _fetch_one(args: tuple[int, str]) -> dict[str, Any] | None:
         idx, tk = args
         if progress and max_workers in (None, 0, 1):
             print(f"[{idx}/{total}] Fetching {tk}...")
-        return fetch_basic_stock_data(tk, fallback=fallback, provider=provider)
+        if group_fallback:
+            try:
+                return fetch_basic_stock_data(
+                    tk, provider=order[0], use_cache=use_cache, hedge=False
+                )
+            except ProviderUnavailableError:
+                unavailable.add(tk)
+                return None
+            except ValueError:
+                return None
+        return fetch_basic_stock_data(
+            tk, fallback=fallback, provider=provider, use_cache=use_cache, hedge=False
+        )
 
     if max_workers and max_workers > 1:
-        from concurrent.futures import ThreadPoolExecutor
-
-        iterator: Iterable[tuple[int, str]] = enumerate(tickers, start=1)
+        iterator: Iterable[tuple[int, str]] = enumerate(pending, start=1)
         if progress:
             iterator = progress_iter(iterator, description="Tickers")
 
         with ThreadPoolExecutor(max_workers=max_workers) as ex:
             rows = list(ex.map(_worker, iterator))
     else:
-        iterator: Iterable[tuple[int, str]] = enumerate(tickers, start=1)
+        iterator: Iterable[tuple[int, str]] = enumerate(pending, start=1)
         if progress:
             iterator = progress_iter(iterator, description="Tickers")
         for item in iterator:
             rows.append(_worker(item))
 
+    if group_fallback:
+        found = {tk: row for tk, row in zip(pending, rows) if row is not None}
+        for name in order[1:]:
+            missing = [tk for tk in pending if tk not in found]
+            if not missing:
+                break
+            found.update(
+                _fetch_grouped(
+                    name,
+                    missing,
+                    batch_size=batch_sizes.get(name),
+                    use_cache=use_cache,
+                    unavailable=unavailable,
+                )
+                if get_provider(name).fetch_many is not None
+                else _fetch_each(name, missing, use_cache=use_cache, unavailable=unavailable)
+            )
+        for tk in pending:
+            if tk not in found:
+                labels = " or ".join(get_provider(name).label for name in order)
+                if tk in unavailable:
+                    raise ProviderUnavailableError(f"{labels} unavailable for {tk}.")
+                reason = f"No valid data returned by {labels} for {tk}."
+                if use_cache:
+                    get_cache().record_failure(provider, tk, reason)
+                raise ValueError(reason)
+        rows = [found[tk] for tk in pending]
+
+    fetched = iter(rows)
+    rows = [prefetched[tk] if tk in prefetched else next(fetched) for tk in tickers]
     return pd.DataFrame(rows, columns=BASIC_FIELDS)
+
+
+class FetchResult(NamedTuple):
+    """Outcome of fetching one ticker in :func:`iter_basic_stock_data`."""
+
+    ticker: str
+    row: dict[str, Any] | None
+    error: Exception | None
+    elapsed: float
+
+
+def iter_basic_stock_data(
+    tickers: Iterable[str],
+    *,
+    fallback: bool = True,
+    provider: str = "auto",
+    dedup: bool = False,
+    max_workers: int | str | None = None,
+    use_cache: bool | None = None,
+) -> Iterator[FetchResult]:
+    """Yield a :class:`FetchResult` for each ticker as soon as it completes.
+
+    Unlike :func:`fetch_basic_stock_data_batch` a failing ticker does not
+    abort the run; its exception is reported in ``FetchResult.error``.  With
+    ``max_workers`` greater than 1 (or ``"auto"``, see
+    :func:`fetch_basic_stock_data_batch`) results arrive in completion order.
+    """
+    tickers = list(tickers)
+    if dedup:
+        tickers = list(dict.fromkeys(tickers))
+    adaptive = None
+    if max_workers == "auto":
+        adaptive = get_concurrency(_provider_order(_validate_provider(provider), fallback)[0])
+        max_workers = adaptive.maximum
+
+    def _timed(tk: str) -> FetchResult:
+        if adaptive is not None:
+            with adaptive.slot():
+                return _fetch_timed(tk)
+        return _fetch_timed(tk)
+
+    def _fetch_timed(tk: str) -> FetchResult:
+        start = time.perf_counter()
+        try:
+            row = fetch_basic_stock_data(
+                tk, fallback=fallback, provider=provider, use_cache=use_cache, hedge=False
+            )
+            return FetchResult(tk, row, None, time.perf_counter() - start)
+        except Exception as exc:
+            return FetchResult(tk, None, exc, time.perf_counter() - start)
+
+    if not max_workers or max_workers <= 1:
+        for tk in tickers:
+            yield _timed(tk)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [ex.submit(_timed, tk) for tk in tickers]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def fetch_basic_stock_data_frames(
+    tickers: Iterable[str],
+    *,
+    progress: bool = False,
+    **kwargs: Any,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Collect :func:`iter_basic_stock_data` into result and error frames.
+
+    Parameters
+    ----------
+    tickers:
+        Iterable of ticker symbols.
+    progress:
+        Display a progress bar while results arrive.
+    **kwargs:
+        Passed through to :func:`iter_basic_stock_data`.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, pandas.DataFrame]
+        Successful rows in input order with :data:`BASIC_FIELDS` columns, and
+        one row per failed ticker with ``Ticker``, ``Error`` and ``Elapsed``.
+    """
+    tickers = list(tickers)
+    results: Iterable[FetchResult] = iter_basic_stock_data(tickers, **kwargs)
+    if progress:
+        results = progress_iter(results, description="Tickers")
+
+    rows: dict[str, dict[str, Any]] = {}
+    errors: list[dict[str, Any]] = []
+    for res in results:
+        if res.error is None:
+            rows[res.ticker] = res.row
+        else:
+            errors.append(
+                {"Ticker": res.ticker, "Error": str(res.error), "Elapsed": res.elapsed}
+            )
+            logger.warning("Fetching %s failed: %s", res.ticker, res.error)
+
+    ordered = [rows[tk] for tk in dict.fromkeys(tickers) if tk in rows]
+    return (
+        pd.DataFrame(ordered, columns=BASIC_FIELDS),
+        pd.DataFrame(errors, columns=["Ticker", "Error", "Elapsed"]),
+    )
+
+
+def fetch_basic_stock_data_job(
+    tickers: Iterable[str],
+    *,
+    name: str = "basic_stock_data",
+    fresh_for: float | None = None,
+    max_workers: int | None = None,
+    progress: bool = False,
+    journal_dir: str | None = None,
+    **kwargs: Any,
+) -> tuple[pd.DataFrame, JobReport]:
+    """Resumable :func:`fetch_basic_stock_data` over many tickers.
+
+    Every finished ticker is journaled by :func:`modules.data.jobs.run_job`,
+    so rerunning after a crash or Ctrl+C only fetches what is left.  Tickers
+    fetched within ``fresh_for`` seconds (default: any time) are skipped.
+    Remaining keyword arguments are passed to :func:`fetch_basic_stock_data`.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, JobReport]
+        Rows of all completed and skipped tickers in input order, and the
+        job report listing failed and remaining tickers.
+    """
+    tickers = [t.strip().upper() for t in tickers]
+    kwargs.setdefault("hedge", False)
+    report = run_job(
+        name,
+        tickers,
+        lambda tk: fetch_basic_stock_data(tk, **kwargs),
+        fresh_for=fresh_for,
+        max_workers=max_workers,
+        progress=progress,
+        journal_dir=journal_dir,
+    )
+    rows = [
+        {f: pd.NA if _is_missing(row.get(f)) else row[f] for f in BASIC_FIELDS}
+        for tk in dict.fromkeys(tickers)
+        if (row := report.results.get(tk)) is not None
+    ]
+    return pd.DataFrame(rows, columns=BASIC_FIELDS), report
+
+
+def field_ttls(overrides: Mapping[str, float] | None = None) -> dict[str, float]:
+    """Return per-field TTLs: defaults, then ``fetch_cache.field_ttls``, then ``overrides``."""
+    conf = load_settings().get("fetch_cache", {}) or {}
+    return {**FIELD_TTLS, **(conf.get("field_ttls") or {}), **(overrides or {})}
+
+
+class RefreshPlan(NamedTuple):
+    """Provider calls needed to bring tickers up to date, see :func:`plan_refresh`."""
+
+    fresh: list[str]
+    quote: list[str]
+    full: list[str]
+    stale: dict[str, list[str]]
+
+    def summary(self) -> dict[str, int]:
+        """Return the number of tickers per refresh path."""
+        return {"fresh": len(self.fresh), "quote": len(self.quote), "full": len(self.full)}
+
+
+def plan_refresh(
+    tickers: Iterable[str], *, ttls: Mapping[str, float] | None = None
+) -> RefreshPlan:
+    """Work out which fields of ``tickers`` are stale and how to refetch them.
+
+    Each field in the fetch cache's field store is compared against its TTL
+    (see :func:`field_ttls`).  Tickers with nothing stale need no call,
+    tickers with only stale :data:`VOLATILE_FIELDS` go through the chunked
+    quote endpoint and anything else (a stale or unknown static field) needs
+    the full profile path.
+    """
+    ttl = field_ttls(ttls)
+    cache = get_cache()
+    plan = RefreshPlan([], [], [], {})
+    for tk in dict.fromkeys(tickers):
+        entries = cache.get_fields(tk)
+        stale = [
+            f for f in BASIC_FIELDS[1:] if f not in entries or entries[f].age > ttl[f]
+        ]
+        if not stale:
+            plan.fresh.append(tk)
+            continue
+        plan.stale[tk] = stale
+        if all(f in VOLATILE_FIELDS for f in stale):
+            plan.quote.append(tk)
+        else:
+            plan.full.append(tk)
+    return plan
+
+
+def _stored_row(cache, ticker: str) -> dict[str, Any]:
+    """Return a :data:`BASIC_FIELDS` row assembled from the field store."""
+    values = cache.field_values(ticker)
+    row = {f: values.get(f, pd.NA) for f in BASIC_FIELDS}
+    row["Ticker"] = ticker.upper()
+    return row
+
+
+def refresh_quotes(
+    tickers: Iterable[str],
+    *,
+    ttls: Mapping[str, float] | None = None,
+    chunk_size: int = YF_BULK_CHUNK,
+    max_workers: int | str | None = None,
+    provider: str = "auto",
+    fallback: bool = True,
+    progress: bool = False,
+) -> pd.DataFrame:
+    """Return :data:`BASIC_FIELDS` rows refreshing only what has expired.
+
+    The work is split by :func:`plan_refresh`: fresh tickers are served from
+    the field store, tickers with only expired :data:`VOLATILE_FIELDS` are
+    refreshed through chunked yfinance quote requests and the remaining
+    tickers take the full profile path.  Tickers that fail are logged and
+    omitted.  The quote requests are only used when yfinance is the first
+    source for ``provider``; otherwise those tickers take the full path too.
+
+    Parameters
+    ----------
+    tickers:
+        Iterable of ticker symbols.
+    ttls:
+        Per-field TTL overrides in seconds (see :func:`field_ttls`).
+    chunk_size:
+        Number of symbols per quote request.
+    max_workers:
+        Worker threads for tickers that need the full profile path.
+    provider, fallback:
+        Sources of the full profile path, as for
+        :func:`fetch_basic_stock_data`.
+    progress:
+        Display a progress bar while full profiles arrive.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return pd.DataFrame(columns=BASIC_FIELDS)
+
+    provider = _validate_provider(provider)
+    order = _provider_order(provider, fallback)
+    cache = get_cache()
+    plan = plan_refresh(tickers, ttls=ttls)
+    rows = {tk: _stored_row(cache, tk) for tk in plan.fresh}
+    need_full = list(plan.full)
+    quoted = list(plan.quote)
+    if order[:1] != ["yf"]:
+        need_full, quoted = need_full + quoted, []
+
+    for chunk in _chunks(quoted, chunk_size):
+        try:
+            quotes = _yf_quote_many(chunk)
+        except Exception as exc:
+            logger.warning("yfinance quote refresh failed for %d symbols: %s", len(chunk), exc)
+            quotes = {}
+        for tk in chunk:
+            quote = quotes.get(tk.upper())
+            if not quote:
+                need_full.append(tk)
+                continue
+            row = _stored_row(cache, tk)
+            fresh = _parse_yf_quote(quote, tk)
+            row.update({f: fresh[f] for f in VOLATILE_FIELDS})
+            cache.set(QUOTE_SOURCE, tk, row, fields=VOLATILE_FIELDS)
+            rows[tk] = row
+
+    logger.info(
+        "Quote refresh: %d from cache, %d via quotes, %d via full profile",
+        len(plan.fresh),
+        len(rows) - len(plan.fresh),
+        len(need_full),
+    )
+    if need_full:
+        # Drop cached rows so the profile path really refetches stale fields
+        for tk in need_full:
+            for source in order:
+                cache.delete(source, tk)
+        full, _ = fetch_basic_stock_data_frames(
+            need_full,
+            progress=progress,
+            provider=provider,
+            fallback=fallback,
+            max_workers=max_workers,
+            use_cache=True,
+        )
+        rows.update({row["Ticker"]: row for row in full.to_dict(orient="records")})
+
+    ordered = [rows.get(tk) or rows.get(tk.upper()) for tk in tickers]
+    return pd.DataFrame([r for r in ordered if r], columns=BASIC_FIELDS)
+
+
+register_provider(
+    Provider("yf", lambda tk: _fetch_from_yf(tk), label="yfinance", auto=True, priority=0)
+)
+register_provider(
+    Provider(
+        "fmp",
+        lambda tk: _fetch_from_fmp(tk),
+        lambda tickers: _fetch_many_from_fmp(tickers),
+        label="FMP",
+        batch_size=FMP_BATCH_SIZE,
+        auto=True,
+        priority=10,
+    )
+)
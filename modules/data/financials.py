@@ -1,20 +1,54 @@
 from __future__ import annotations
 
-"""Fetch financial statements and insert them into Directus."""
+"""Fetch financial statements and insert them into Directus.
+
+Every statement/period combination is a separate OpenBB request.  They run
+on one shared worker pool (``financials.max_workers`` in
+``config/settings.json``, default :data:`STATEMENT_WORKERS`) behind the
+``openbb`` rate limiter, so fetching many tickers is bounded by what the
+provider allows rather than by the sum of the request latencies.
+
+:func:`store_statements` inserts every row it is given.
+:func:`upsert_statements` instead keys each row on ticker, period type and
+fiscal date, compares a content hash with the row already in Directus and
+sends only new rows (one bulk insert) and changed rows (one bulk update), so
+rerunning a load neither duplicates rows nor resends unchanged data.  Set
+``financials.upsert`` to use it in :func:`fetch_and_store_statements`.
+"""
 
 import os
 import logging
-from typing import Iterable, Dict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, Iterable, Dict, List, NamedTuple, Tuple
 
 import pandas as pd
 
-from modules.utils import get_openbb, parse_number
-from .directus_client import insert_items
+from modules.config_utils import load_settings
+from modules.utils import get_limiter, get_openbb, parse_number_frame, progress_iter
+from modules.utils.circuit_breaker import get_breaker
+from modules.utils.concurrency import observe
+from .directus_client import (
+    create_collection_if_missing,
+    create_field,
+    fetch_items_query,
+    insert_items,
+    list_fields,
+    update_items,
+)
 from .directus_mapper import prepare_records
+from .jobs import JobReport, run_job
+from .statement_store import (
+    fiscal_dates,
+    get_statement_store,
+    row_hashes,
+    statement_store_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_STATEMENTS = ("income", "balance", "cash")
+PERIODS = ("annual", "quarter")
 
 COLLECTION_MAP = {
     "income": "income_statement",
@@ -22,32 +56,95 @@ COLLECTION_MAP = {
     "cash": "cash_flow",
 }
 
+# Concurrent OpenBB statement requests, Directus inserts and tickers per job
+STATEMENT_WORKERS = 8
+INSERT_WORKERS = 6
+JOB_WORKERS = 4
+
+# Fields identifying an upserted row within a statement collection
+UPSERT_KEY_FIELDS = ("ticker", "period_type", "fiscal_date")
+HASH_FIELD = "row_hash"
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _statement_executor() -> ThreadPoolExecutor:
+    """Return the pool shared by all statement requests."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            conf = load_settings().get("financials", {}) or {}
+            _executor = ThreadPoolExecutor(
+                max_workers=int(conf.get("max_workers", STATEMENT_WORKERS)),
+                thread_name_prefix="statements",
+            )
+        return _executor
+
 
 def _fetch_statement(obb, ticker: str, stmt: str, period: str) -> pd.DataFrame:
     """Return statement DataFrame from OpenBB or empty DataFrame."""
     try:
         fn = getattr(obb.equity.fundamental, stmt)
-        df = fn(symbol=ticker, period=period).to_df()
+
+        def _statement() -> pd.DataFrame:
+            get_limiter("openbb").acquire()
+            with observe("openbb"):
+                return fn(symbol=ticker, period=period).to_df()
+
+        df = get_breaker("openbb").call(_statement)
         if isinstance(df, pd.DataFrame):
             # Normalize numeric values
-            return df.applymap(parse_number)
+            return parse_number_frame(df)
     except Exception as exc:  # pragma: no cover - network errors
         logger.warning("%s %s fetch failed for %s: %s", stmt, period, ticker, exc)
     return pd.DataFrame()
 
 
 def fetch_statements(ticker: str, statements: Iterable[str] | None = None) -> Dict[str, Dict[str, pd.DataFrame]]:
-    """Return financial statements for ``ticker`` grouped by statement and period."""
-    if statements is None:
-        statements = DEFAULT_STATEMENTS
+    """Return financial statements for ``ticker`` grouped by statement and period.
+
+    All statement/period requests run concurrently.
+    """
+    return fetch_statements_batch([ticker], statements)[ticker]
+
+
+def fetch_statements_batch(
+    tickers: Iterable[str],
+    statements: Iterable[str] | None = None,
+    *,
+    progress: bool = False,
+) -> Dict[str, Dict[str, Dict[str, pd.DataFrame]]]:
+    """Return :func:`fetch_statements` for many tickers.
+
+    Every ticker/statement/period combination is submitted to the shared
+    statement pool at once.  The result is keyed by ticker in input order;
+    failed requests yield empty frames.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    statements = list(statements) if statements is not None else list(DEFAULT_STATEMENTS)
     obb = get_openbb()
-    data: Dict[str, Dict[str, pd.DataFrame]] = {}
-    for stmt in statements:
-        data[stmt] = {
-            "annual": _fetch_statement(obb, ticker, stmt, "annual"),
-            "quarter": _fetch_statement(obb, ticker, stmt, "quarter"),
-        }
-    return data
+    ex = _statement_executor()
+    futures: Dict[Future, Tuple[str, str, str]] = {
+        ex.submit(_fetch_statement, obb, tk, stmt, period): (tk, stmt, period)
+        for tk in tickers
+        for stmt in statements
+        for period in PERIODS
+    }
+    data: Dict[str, Dict[str, Dict[str, pd.DataFrame]]] = {
+        tk: {stmt: {} for stmt in statements} for tk in tickers
+    }
+    done: Iterable[Future] = as_completed(futures)
+    if progress:
+        done = progress_iter(done, description="Statements")
+    for fut in done:
+        tk, stmt, period = futures[fut]
+        data[tk][stmt][period] = fut.result()
+    # Keep the period order stable regardless of completion order
+    return {
+        tk: {stmt: {p: periods[p] for p in PERIODS} for stmt, periods in stmts.items()}
+        for tk, stmts in data.items()
+    }
 
 
 def _insert_dataframe(df: pd.DataFrame, collection: str) -> None:
@@ -61,22 +158,248 @@ def _insert_dataframe(df: pd.DataFrame, collection: str) -> None:
         logger.error("Directus insertion failed for %s: %s", collection, exc)
 
 
+def _insert_dataframes(dfs: List[pd.DataFrame], collection: str) -> None:
+    """Insert several frames into one collection, one after the other."""
+    for df in dfs:
+        _insert_dataframe(df, collection)
+
+
 def store_statements(data: Dict[str, Dict[str, pd.DataFrame]]) -> None:
-    """Insert fetched statements into Directus using environment collection names."""
+    """Insert fetched statements into Directus using environment collection names.
+
+    Collections are filled in parallel, the periods of one collection in
+    sequence: every insert may create its collection, and two concurrent
+    creations of the same collection would race.
+    """
+    frames: Dict[str, List[pd.DataFrame]] = {}
     for stmt, periods in data.items():
-        base = COLLECTION_MAP.get(stmt, stmt)
-        collection = os.getenv(f"DIRECTUS_{base.upper()}_COLLECTION", base)
+        collection = _statement_collection(stmt)
         for period, df in periods.items():
             if not df.empty:
                 df = df.copy()
                 df.insert(0, "period", df.index)
-                _insert_dataframe(df, collection)
+                frames.setdefault(collection, []).append(df)
+    if len(frames) <= 1:
+        for collection, dfs in frames.items():
+            _insert_dataframes(dfs, collection)
+        return
+    with ThreadPoolExecutor(max_workers=min(INSERT_WORKERS, len(frames))) as ex:
+        for fut in [ex.submit(_insert_dataframes, dfs, col) for col, dfs in frames.items()]:
+            fut.result()
+
+
+class UpsertResult(NamedTuple):
+    """Outcome of upserting one statement frame into Directus."""
+
+    inserted: int
+    updated: int
+    unchanged: int
+
+    def summary(self) -> Dict[str, int]:
+        return {"inserted": self.inserted, "updated": self.updated, "unchanged": self.unchanged}
+
+
+_upsert_ready: set[str] = set()
+_upsert_lock = threading.Lock()
+
+
+def _statement_collection(stmt: str) -> str:
+    base = COLLECTION_MAP.get(stmt, stmt)
+    return os.getenv(f"DIRECTUS_{base.upper()}_COLLECTION", base)
+
+
+def _ensure_upsert_fields(collection: str) -> None:
+    """Create ``collection`` and its key and hash fields once per process."""
+    with _upsert_lock:
+        if collection in _upsert_ready:
+            return
+        fields = [*UPSERT_KEY_FIELDS, HASH_FIELD]
+        if not create_collection_if_missing(collection, fields):
+            existing = set(list_fields(collection))
+            for field in fields:
+                if field not in existing:
+                    create_field(collection, field)
+        _upsert_ready.add(collection)
+
+
+def _stored_rows(
+    collection: str, ticker: str, period_type: str
+) -> Dict[str, Tuple[Any, str]] | None:
+    """Return ``fiscal_date -> (id, row_hash)`` of the rows already stored.
+
+    ``None`` means the read failed and nothing is known about stored rows.
+    """
+    items = fetch_items_query(
+        collection,
+        filter={"ticker": {"_eq": ticker}, "period_type": {"_eq": period_type}},
+        fields=["id", "fiscal_date", HASH_FIELD],
+    )
+    if items is None:
+        return None
+    return {str(item["fiscal_date"]): (item["id"], item.get(HASH_FIELD)) for item in items}
+
+
+def _upsert_dataframe(
+    df: pd.DataFrame, collection: str, ticker: str, period_type: str
+) -> UpsertResult | None:
+    """Insert new and update changed rows of one statement frame.
+
+    Returns ``None`` without writing anything if the stored rows could not
+    be read, since inserting blindly would duplicate them.
+    """
+    if df.empty:
+        return UpsertResult(0, 0, 0)
+    dates = fiscal_dates(df)
+    keep = ~pd.Index(dates).duplicated(keep="last")
+    df, dates = df[keep], [d for d, k in zip(dates, keep) if k]
+    hashes = [format(h, "016x") for h in row_hashes(df)]
+    _ensure_upsert_fields(collection)
+    stored = _stored_rows(collection, ticker, period_type)
+    if stored is None:
+        logger.error(
+            "Skipping upsert of %s %s into %s: stored rows could not be read",
+            ticker,
+            period_type,
+            collection,
+        )
+        return None
+
+    frame = df.copy()
+    frame.insert(0, "period", frame.index)
+    records = prepare_records(collection, frame.reset_index().to_dict(orient="records"))
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    for record, day, row_hash in zip(records, dates, hashes):
+        record.update(ticker=ticker, period_type=period_type, fiscal_date=day, row_hash=row_hash)
+        if day not in stored:
+            inserts.append(record)
+        elif stored[day][1] != row_hash:
+            updates.append({**record, "id": stored[day][0]})
+    if inserts:
+        insert_items(collection, inserts)
+    if updates:
+        update_items(collection, updates)
+    result = UpsertResult(len(inserts), len(updates), len(records) - len(inserts) - len(updates))
+    logger.info("Upserted %s %s into %s: %s", ticker, period_type, collection, result.summary())
+    return result
+
+
+def upsert_statements(
+    ticker: str, data: Dict[str, Dict[str, pd.DataFrame]]
+) -> Dict[str, Dict[str, UpsertResult]]:
+    """Idempotently store :func:`fetch_statements` output for ``ticker``.
+
+    Rows are keyed on :data:`UPSERT_KEY_FIELDS` within the statement's
+    collection.  Only fiscal dates missing from Directus are inserted and
+    only rows whose content hash differs from the stored ``row_hash`` are
+    updated, each in one bulk request per statement and period.
+
+    Returns the inserted, updated and unchanged counts per statement and
+    period (see :func:`upsert_report`).  Statements whose stored rows could
+    not be read from Directus are skipped and left out of the result.
+    """
+    ticker = ticker.upper()
+    jobs = [
+        (stmt, period, df, _statement_collection(stmt))
+        for stmt, periods in data.items()
+        for period, df in periods.items()
+    ]
+    results: Dict[str, Dict[str, UpsertResult]] = {stmt: {} for stmt in data}
+    with ThreadPoolExecutor(max_workers=max(1, min(INSERT_WORKERS, len(jobs)))) as ex:
+        futures = {
+            (stmt, period): ex.submit(_upsert_dataframe, df, col, ticker, period)
+            for stmt, period, df, col in jobs
+        }
+        for (stmt, period), fut in futures.items():
+            result = fut.result()
+            if result is not None:
+                results[stmt][period] = result
+    return results
+
+
+def upsert_report(results: Dict[str, Dict[str, UpsertResult]]) -> pd.DataFrame:
+    """Return :func:`upsert_statements` counts as one row per statement and period."""
+    rows = [
+        {"statement": stmt, "period": period, **result.summary()}
+        for stmt, periods in results.items()
+        for period, result in periods.items()
+    ]
+    return pd.DataFrame(rows, columns=["statement", "period", *UpsertResult._fields])
+
+
+def upsert_enabled() -> bool:
+    """Return ``True`` if ``financials.upsert`` is set in the settings."""
+    return bool((load_settings().get("financials", {}) or {}).get("upsert", False))
 
 
 def fetch_and_store_statements(
-    ticker: str, *, statements: Iterable[str] | None = None
+    ticker: str,
+    *,
+    statements: Iterable[str] | None = None,
+    upsert: bool | None = None,
 ) -> Dict[str, Dict[str, pd.DataFrame]]:
-    """Fetch financial statements for ``ticker`` and store them in Directus."""
+    """Fetch financial statements for ``ticker`` and store them in Directus.
+
+    With the local statement store enabled (``statement_store.enabled``) the
+    statements are loaded into it first and only fiscal dates that are new or
+    changed are sent to Directus.  ``upsert`` (default: the
+    ``financials.upsert`` setting) stores them with :func:`upsert_statements`
+    instead of plain inserts.
+    """
     data = fetch_statements(ticker, statements)
-    store_statements(data)
+    to_store = data
+    if statement_store_enabled():
+        loaded = get_statement_store().ingest_statements(ticker, data)
+        to_store = {
+            stmt: {period: result.delta for period, result in periods.items()}
+            for stmt, periods in loaded.items()
+        }
+    if upsert is None:
+        upsert = upsert_enabled()
+    if upsert:
+        upsert_statements(ticker, to_store)
+    else:
+        store_statements(to_store)
     return data
+
+
+def fetch_and_store_statements_job(
+    tickers: Iterable[str],
+    *,
+    statements: Iterable[str] | None = None,
+    name: str = "statements",
+    fresh_for: float | None = None,
+    max_workers: int | None = None,
+    progress: bool = False,
+    journal_dir: str | None = None,
+) -> JobReport:
+    """Resumable :func:`fetch_and_store_statements` over many tickers.
+
+    The number of rows stored per statement and period is journaled for each
+    ticker; rerunning the job skips tickers already stored within
+    ``fresh_for`` seconds (default: any time).  Tickers without any
+    statement data are reported as failed.  With ``max_workers`` several
+    tickers are processed at once; their requests still share the statement
+    pool, so OpenBB sees at most ``financials.max_workers`` calls in flight.
+    """
+    statements = list(statements) if statements is not None else None
+
+    def _one(ticker: str) -> Dict[str, Dict[str, int]]:
+        data = fetch_and_store_statements(ticker, statements=statements)
+        counts = {
+            stmt: {period: len(df) for period, df in periods.items()}
+            for stmt, periods in data.items()
+        }
+        if not any(n for periods in counts.values() for n in periods.values()):
+            raise ValueError("No statement data returned")
+        return counts
+
+    return run_job(
+        name,
+        tickers,
+        _one,
+        fresh_for=fresh_for,
+        max_workers=max_workers,
+        progress=progress,
+        journal_dir=journal_dir,
+    )
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+"""Checkpointed bulk jobs that can resume after an interruption.
+
+Each job appends one JSON line per finished ticker to
+``cache/jobs/<name>.jsonl``.  Running the same job again skips tickers that
+already succeeded (optionally only within a freshness window) and retries
+failed ones, so a crash or Ctrl+C at ticker 1,800 of 2,000 only costs the
+tickers that were in flight.
+
+Example::
+
+    from modules.data.jobs import run_job
+
+    report = run_job("prices", tickers, lambda tk: {"price": 1.0}, fresh_for=3600)
+    report.remaining  # tickers still to do
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+import pandas as pd
+
+from modules.config_utils import CACHE_DIR
+from modules.utils.progress_utils import progress_iter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_DIR = CACHE_DIR / "jobs"
+
+
+def _json_default(val: Any) -> Any:
+    """Encode missing values as ``null`` and numpy scalars as Python numbers."""
+    if val is pd.NA or val is pd.NaT:
+        return None
+    if hasattr(val, "item"):
+        return val.item()
+    return str(val)
+
+
+@dataclass
+class JournalEntry:
+    """Outcome of one ticker as recorded in the journal."""
+
+    ticker: str
+    result: Any
+    error: str | None
+    finished_at: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class JobJournal:
+    """Append-only JSON-lines journal of finished tickers.
+
+    Only the latest entry per ticker counts.  A truncated last line, as left
+    behind by a crash mid-write, is ignored.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_job(cls, name: str, directory: str | Path | None = None) -> "JobJournal":
+        """Return the journal for job ``name`` inside ``directory``."""
+        return cls(Path(directory or DEFAULT_JOB_DIR) / f"{name}.jsonl")
+
+    def entries(self) -> Dict[str, JournalEntry]:
+        """Return the latest entry per ticker."""
+        if not self.path.exists():
+            return {}
+        latest: Dict[str, JournalEntry] = {}
+        with self._lock, self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    raw = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring corrupt line in %s", self.path)
+                    continue
+                latest[raw["ticker"]] = JournalEntry(
+                    raw["ticker"], raw.get("result"), raw.get("error"), raw["finished_at"]
+                )
+        return latest
+
+    def record(self, ticker: str, *, result: Any = None, error: str | None = None) -> None:
+        """Append the outcome for ``ticker`` and flush it to disk."""
+        line = json.dumps(
+            {
+                "ticker": ticker.upper(),
+                "result": result,
+                "error": error,
+                "finished_at": time.time(),
+            },
+            default=_json_default,
+        )
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+                fh.flush()
+
+    def completed(self, fresh_for: float | None = None) -> Dict[str, JournalEntry]:
+        """Return successful entries, limited to the last ``fresh_for`` seconds."""
+        now = time.time()
+        return {
+            tk: entry
+            for tk, entry in self.entries().items()
+            if entry.ok and (fresh_for is None or now - entry.finished_at <= fresh_for)
+        }
+
+    def clear(self) -> None:
+        """Delete the journal so the next run starts from scratch."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class JobReport:
+    """Progress of a job over the requested tickers."""
+
+    name: str
+    completed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    remaining: List[str] = field(default_factory=list)
+    results: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, int]:
+        """Return the number of tickers in each state."""
+        return {
+            "completed": len(self.completed),
+            "skipped": len(self.skipped),
+            "failed": len(self.failed),
+            "remaining": len(self.remaining),
+        }
+
+
+def _normalize(tickers: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+
+
+def job_status(
+    name: str,
+    tickers: Iterable[str],
+    *,
+    fresh_for: float | None = None,
+    journal_dir: str | Path | None = None,
+) -> JobReport:
+    """Return what a run of job ``name`` over ``tickers`` would skip and still do."""
+    journal = JobJournal.for_job(name, journal_dir)
+    tickers = _normalize(tickers)
+    done = journal.completed(fresh_for)
+    entries = journal.entries()
+    report = JobReport(name)
+    for tk in tickers:
+        if tk in done:
+            report.skipped.append(tk)
+            report.results[tk] = done[tk].result
+        else:
+            report.remaining.append(tk)
+            if tk in entries and not entries[tk].ok:
+                report.failed[tk] = entries[tk].error
+    return report
+
+
+def run_job(
+    name: str,
+    tickers: Iterable[str],
+    fn: Callable[[str], Any],
+    *,
+    fresh_for: float | None = None,
+    max_workers: int | None = None,
+    progress: bool = False,
+    journal_dir: str | Path | None = None,
+) -> JobReport:
+    """Run ``fn`` for every ticker not yet completed and journal each outcome.
+
+    Parameters
+    ----------
+    name:
+        Job name; also the journal file name.
+    tickers:
+        Ticker symbols to process.
+    fn:
+        Called with one ticker.  Its JSON-serializable return value is
+        journaled as the ticker's result; exceptions mark the ticker failed.
+    fresh_for:
+        Seconds a successful result stays valid.  ``None`` (default) reuses
+        every journaled success, i.e. resumes exactly where the job stopped.
+    max_workers:
+        If greater than 1, process tickers in parallel.
+    progress:
+        Show a progress bar.
+    journal_dir:
+        Directory holding the journal (default ``cache/jobs``).
+
+    Returns
+    -------
+    JobReport
+        Completed, skipped, failed and remaining tickers plus the results of
+        all completed and skipped tickers.  On ``KeyboardInterrupt`` the
+        journal keeps every finished ticker and the interrupt is re-raised.
+    """
+    journal = JobJournal.for_job(name, journal_dir)
+    report = job_status(name, tickers, fresh_for=fresh_for, journal_dir=journal_dir)
+    todo = list(report.remaining)
+    logger.info(
+        "Job %s: %d to do, %d already done", name, len(todo), len(report.skipped)
+    )
+
+    def _run(tk: str) -> None:
+        try:
+            result = fn(tk)
+        except Exception as exc:
+            journal.record(tk, error=str(exc))
+            report.failed[tk] = str(exc)
+            logger.warning("Job %s: %s failed: %s", name, tk, exc)
+            return
+        journal.record(tk, result=result)
+        report.failed.pop(tk, None)
+        report.completed.append(tk)
+        report.results[tk] = result
+
+    try:
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                futures = [ex.submit(_run, tk) for tk in todo]
+                done = as_completed(futures)
+                if progress:
+                    done = progress_iter(done, description=name)
+                try:
+                    for fut in done:
+                        fut.result()
+                except KeyboardInterrupt:
+                    for fut in futures:
+                        fut.cancel()
+                    raise
+        else:
+            iterator: Iterable[str] = todo
+            if progress:
+                iterator = progress_iter(iterator, description=name)
+            for tk in iterator:
+                _run(tk)
+    except KeyboardInterrupt:
+        logger.warning("Job %s interrupted; rerun to resume", name)
+        raise
+    finally:
+        finished = set(report.completed)
+        report.remaining = [tk for tk in todo if tk not in finished]
+        logger.info("Job %s: %s", name, report.summary())
+    return report
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+"""Merge company data from several sources with field-level provenance.
+
+Each source supplies one frame with a ``Ticker`` column and any of the
+:data:`~modules.data.fetching.BASIC_FIELDS`.  For every field the first
+source in its priority order that has a value wins; empty strings count as
+missing.  The merge works column by column, so thousands of tickers merge
+in milliseconds.
+
+Besides the merged frame, :func:`merge_sources` returns a provenance frame
+of the same shape whose cells name the source of each value (categorical,
+``NaN`` where no source had one)::
+
+    result = merge_sources({"openbb": obb_df, "yf": yf_df, "fmp": fmp_df})
+    result.provenance.loc[result.provenance["Ticker"] == "AAPL"]
+    provenance_summary(result.provenance)  # values per field and source
+
+The default order is the order of the frames.  Per-field overrides are
+passed as ``priority`` or set in ``config/settings.json``::
+
+    {
+      "merge": {"priority": {"PE Ratio": ["fmp", "yf"]}}
+    }
+"""
+
+import logging
+from typing import Dict, Mapping, NamedTuple, Sequence
+
+import numpy as np
+import pandas as pd
+
+from modules.config_utils import load_settings
+
+logger = logging.getLogger(__name__)
+
+
+class MergeResult(NamedTuple):
+    """Merged values and the source of every cell."""
+
+    data: pd.DataFrame
+    provenance: pd.DataFrame
+
+
+def _missing(values: pd.Series) -> np.ndarray:
+    """Return a boolean mask of missing values (NA, ``None`` or ``""``)."""
+    mask = values.isna().to_numpy()
+    if not pd.api.types.is_numeric_dtype(values):
+        mask |= values.isin([""]).to_numpy()
+    return mask
+
+
+def _indexed(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """Return ``df`` indexed by upper-case ``key``, keeping the first duplicate."""
+    df = df.set_index(df[key].astype(str).str.upper()).drop(columns=key)
+    return df[~df.index.duplicated()]
+
+
+def _field_order(
+    field: str, sources: Sequence[str], priority: Mapping[str, Sequence[str]]
+) -> list[str]:
+    preferred = [s for s in priority.get(field, ()) if s in sources]
+    return preferred + [s for s in sources if s not in preferred]
+
+
+def merge_sources(
+    frames: Mapping[str, pd.DataFrame],
+    *,
+    priority: Mapping[str, Sequence[str]] | None = None,
+    columns: Sequence[str] | None = None,
+    key: str = "Ticker",
+) -> MergeResult:
+    """Merge one frame per source into one row per ticker.
+
+    Parameters
+    ----------
+    frames:
+        Source name to frame with a ``key`` column.  Insertion order is the
+        default priority, highest first.
+    priority:
+        Field name to source names tried first for that field; sources not
+        listed follow in the default order.  Defaults to the ``merge.priority``
+        setting.
+    columns:
+        Fields of the result.  Defaults to every column of the frames in
+        order of appearance.
+    key:
+        Column identifying the ticker.  Values are compared upper-case.
+
+    Returns
+    -------
+    MergeResult
+        ``data`` and ``provenance`` frames with the ``key`` column followed by
+        ``columns``, one row per ticker in order of first appearance.  Where
+        no source has a value, ``data`` keeps the value of the lowest
+        priority source.
+
+    Raises
+    ------
+    ValueError
+        If ``frames`` is empty or a frame lacks the ``key`` column.
+    """
+    if not frames:
+        raise ValueError("At least one source frame is required")
+    for name, df in frames.items():
+        if key not in df.columns:
+            raise ValueError(f"Frame for source {name!r} has no {key!r} column")
+    if priority is None:
+        priority = (load_settings().get("merge", {}) or {}).get("priority") or {}
+
+    sources = list(frames)
+    indexed = {name: _indexed(df, key) for name, df in frames.items()}
+    index = pd.Index(
+        pd.unique(np.concatenate([df.index.to_numpy() for df in indexed.values()])),
+        name=key,
+    )
+    if columns is None:
+        columns = list(dict.fromkeys(c for df in indexed.values() for c in df.columns))
+    aligned = {name: df.reindex(index) for name, df in indexed.items()}
+
+    merged: Dict[str, pd.Series] = {}
+    codes = np.full((len(index), len(columns)), -1, dtype=np.int8)
+    for j, field in enumerate(columns):
+        out = None
+        # Walk from lowest to highest priority so better sources overwrite
+        for name in reversed(_field_order(field, sources, priority)):
+            df = aligned[name]
+            if field not in df.columns:
+                continue
+            values = df[field]
+            present = ~_missing(values)
+            out = values if out is None else values.where(present, out)
+            codes[present, j] = sources.index(name)
+        merged[field] = (
+            out if out is not None else pd.Series(pd.NA, index=index, dtype=object)
+        )
+
+    data = pd.DataFrame(merged, index=index, columns=list(columns)).reset_index()
+    provenance = pd.DataFrame(
+        {
+            field: pd.Categorical.from_codes(codes[:, j], categories=sources)
+            for j, field in enumerate(columns)
+        },
+        index=index,
+        columns=list(columns),
+    ).reset_index()
+    logger.debug("Merged %d tickers from %s", len(index), ", ".join(sources))
+    return MergeResult(data, provenance)
+
+
+def merge_records(
+    records: Mapping[str, Mapping[str, object] | None],
+    *,
+    priority: Mapping[str, Sequence[str]] | None = None,
+    key: str = "Ticker",
+) -> tuple[Dict[str, object], Dict[str, str | None]]:
+    """Merge single-ticker rows from several sources.
+
+    Convenience wrapper around :func:`merge_sources`; ``None`` or empty
+    records are ignored.  Returns the merged row and a mapping of field to
+    source name (``None`` where no source had a value).
+
+    Raises
+    ------
+    ValueError
+        If every record is empty.
+    """
+    frames = {name: pd.DataFrame([rec]) for name, rec in records.items() if rec}
+    result = merge_sources(frames, priority=priority, key=key)
+    # Read cell by cell: ``to_dict`` would turn ``pd.NA`` into ``None``
+    row = {col: result.data[col].iat[0] for col in result.data.columns}
+    sources = {
+        field: (None if pd.isna(src) else src)
+        for field, src in result.provenance.iloc[0].drop(key).items()
+    }
+    return row, sources
+
+
+def provenance_summary(provenance: pd.DataFrame, *, key: str = "Ticker") -> pd.DataFrame:
+    """Return the number of values each source supplied per field.
+
+    Rows are fields, columns are sources plus ``missing`` for cells no
+    source could fill.
+    """
+    fields = provenance.drop(columns=key, errors="ignore")
+    counts = {field: fields[field].value_counts(sort=False) for field in fields.columns}
+    summary = pd.DataFrame(counts).T.fillna(0).astype(int)
+    summary["missing"] = fields.isna().sum()
+    return summary
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+"""Aligned multi-ticker statement panel.
+
+:func:`build_statement_panel` turns :func:`~modules.data.financials.fetch_statements_batch`
+output (or a ``{ticker: fetch_statements(ticker)}`` mapping) into one
+:class:`StatementPanel`: a ``float64`` array of shape
+``(tickers, fiscal periods, line items)`` with ``NaN`` for values a ticker
+did not report.  Cross-sectional work then runs on the array instead of
+looping over frames::
+
+    panel = build_statement_panel(fetch_statements_batch(tickers, ["income"]))
+    margins = panel.ratio("gross_profit", "revenue")   # tickers x periods
+    panel.period_frame("2024-FY")                      # tickers x items
+
+Fiscal periods are aligned on ``fiscal_year``/``fiscal_period`` when the
+provider reports them (``"2024-FY"``, ``"2024-Q3"``) so companies with
+different fiscal year ends line up; statements of the same ticker without
+those columns take the label of the matching fiscal date.  Otherwise, or
+with ``align="date"``, periods are fiscal dates (``"2024-09-28"``) taken
+from ``period_ending``/``date`` when present, else from the frame index.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .statement_store import DATE_COLUMNS, fiscal_dates
+
+logger = logging.getLogger(__name__)
+
+# Provider columns describing the period rather than a line item
+PERIOD_COLUMNS = ("fiscal_year", "fiscal_period", *DATE_COLUMNS)
+
+
+class StatementPanel:
+    """Statement values of many tickers on common period and item axes.
+
+    Parameters
+    ----------
+    values:
+        Array of shape ``(len(tickers), len(periods), len(items))``.
+    tickers, periods, items:
+        Labels of the three axes.
+
+    Raises
+    ------
+    ValueError
+        If the shape of ``values`` does not match the labels.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        tickers: Sequence[str],
+        periods: Sequence[str],
+        items: Sequence[str],
+    ) -> None:
+        self.values = np.asarray(values, dtype=float)
+        self.tickers = pd.Index(tickers, name="ticker")
+        self.periods = pd.Index(periods, name="period")
+        self.items = pd.Index(items, name="item")
+        shape = (len(self.tickers), len(self.periods), len(self.items))
+        if self.values.shape != shape:
+            raise ValueError(f"values have shape {self.values.shape}, labels give {shape}")
+
+    def __repr__(self) -> str:
+        t, p, i = self.values.shape
+        return f"StatementPanel({t} tickers x {p} periods x {i} items)"
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.values.shape  # type: ignore[return-value]
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean array marking missing values."""
+        return np.isnan(self.values)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def ticker_index(self, ticker: str) -> int:
+        return self.tickers.get_loc(ticker.upper())
+
+    def period_index(self, period: str) -> int:
+        return self.periods.get_loc(period)
+
+    def item_index(self, item: str) -> int:
+        return self.items.get_loc(item)
+
+    def get(self, ticker: str, period: str, item: str) -> float:
+        """Return one value (``NaN`` if missing)."""
+        return float(
+            self.values[self.ticker_index(ticker), self.period_index(period), self.item_index(item)]
+        )
+
+    def select(
+        self,
+        tickers: Iterable[str] | None = None,
+        periods: Iterable[str] | None = None,
+        items: Iterable[str] | None = None,
+    ) -> "StatementPanel":
+        """Return a panel restricted to the given labels, in the given order.
+
+        Raises ``KeyError`` for unknown labels.
+        """
+        axes = []
+        for index, labels in (
+            (self.tickers, None if tickers is None else [t.upper() for t in tickers]),
+            (self.periods, periods),
+            (self.items, items),
+        ):
+            if labels is None:
+                axes.append((index, slice(None)))
+                continue
+            labels = list(labels)
+            pos = index.get_indexer(labels)
+            if (pos < 0).any():
+                missing = [l for l, p in zip(labels, pos) if p < 0]
+                raise KeyError(f"Unknown {index.name}: {', '.join(map(str, missing))}")
+            axes.append((index[pos], pos))
+        (tickers_, t), (periods_, p), (items_, i) = axes
+        values = self.values[t][:, p][:, :, i]
+        return StatementPanel(values, tickers_, periods_, items_)
+
+    # ------------------------------------------------------------------
+    # DataFrame slices
+    # ------------------------------------------------------------------
+    def ticker_frame(self, ticker: str) -> pd.DataFrame:
+        """Return periods x items for one ticker."""
+        return pd.DataFrame(
+            self.values[self.ticker_index(ticker)], index=self.periods, columns=self.items
+        )
+
+    def period_frame(self, period: str) -> pd.DataFrame:
+        """Return tickers x items for one fiscal period."""
+        return pd.DataFrame(
+            self.values[:, self.period_index(period)], index=self.tickers, columns=self.items
+        )
+
+    def item_frame(self, item: str) -> pd.DataFrame:
+        """Return tickers x periods for one line item."""
+        return pd.DataFrame(
+            self.values[:, :, self.item_index(item)], index=self.tickers, columns=self.periods
+        )
+
+    def to_frame(self, *, dropna: bool = True) -> pd.DataFrame:
+        """Return the panel in long form indexed by ticker and period."""
+        index = pd.MultiIndex.from_product([self.tickers, self.periods])
+        df = pd.DataFrame(
+            self.values.reshape(-1, len(self.items)), index=index, columns=self.items
+        )
+        return df.dropna(how="all") if dropna else df
+
+    # ------------------------------------------------------------------
+    # Vectorized helpers
+    # ------------------------------------------------------------------
+    def ratio(self, numerator: str, denominator: str) -> pd.DataFrame:
+        """Return ``numerator / denominator`` as tickers x periods.
+
+        Zero or missing denominators give ``NaN``.
+        """
+        num = self.values[:, :, self.item_index(numerator)]
+        den = self.values[:, :, self.item_index(denominator)]
+        out = np.full(num.shape, np.nan)
+        np.divide(num, den, out=out, where=(den != 0) & ~np.isnan(den))
+        return pd.DataFrame(out, index=self.tickers, columns=self.periods)
+
+    def latest(self, item: str) -> pd.Series:
+        """Return the value of ``item`` in each ticker's latest reported period."""
+        values = self.values[:, :, self.item_index(item)]
+        present = ~np.isnan(values)
+        last = len(self.periods) - 1 - np.argmax(present[:, ::-1], axis=1)
+        out = np.where(present.any(axis=1), values[np.arange(len(values)), last], np.nan)
+        return pd.Series(out, index=self.tickers, name=item)
+
+    def coverage(self) -> pd.Series:
+        """Return the share of ticker/period cells holding a value, per item."""
+        if not self.values.size:
+            return pd.Series(0.0, index=self.items, name="coverage")
+        return pd.Series(
+            (~self.mask).mean(axis=(0, 1)), index=self.items, name="coverage"
+        )
+
+
+def _period_labels(df: pd.DataFrame, dates: list[str], align: str) -> list[str]:
+    """Return the aligned period label of every row of ``df``."""
+    if align != "fiscal" or not {"fiscal_year", "fiscal_period"} <= set(df.columns):
+        return dates
+    years = pd.to_numeric(df["fiscal_year"], errors="coerce").to_numpy()
+    kinds = df["fiscal_period"].to_numpy()
+    return [
+        f"{int(y)}-{k}" if not np.isnan(y) and isinstance(k, str) and k else d
+        for y, k, d in zip(years, kinds, dates)
+    ]
+
+
+def _numeric_items(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the numeric line item columns of one statement frame."""
+    numeric = df.select_dtypes("number")
+    return numeric.drop(columns=[c for c in PERIOD_COLUMNS if c in numeric.columns]).astype(float)
+
+
+def _ticker_frames(
+    statements: Mapping[str, Mapping[str, pd.DataFrame]],
+    names: Sequence[str],
+    period: str,
+    align: str,
+) -> List[pd.DataFrame]:
+    """Return one ticker's statement frames as periods x items."""
+    frames = [(statements.get(stmt) or {}).get(period) for stmt in names]
+    frames = [df for df in frames if df is not None and not df.empty]
+    dates = [fiscal_dates(df) for df in frames]
+    # Statements without fiscal columns take the label another statement
+    # reported for the same fiscal date
+    by_date: Dict[str, str] = {}
+    for df, days in zip(frames, dates):
+        for day, label in zip(days, _period_labels(df, days, align)):
+            by_date.setdefault(day, label)
+    out = []
+    for df, days in zip(frames, dates):
+        items = _numeric_items(df).set_axis([by_date[day] for day in days], axis=0)
+        out.append(items[~items.index.duplicated(keep="last")])
+    return out
+
+
+def build_statement_panel(
+    data: Mapping[str, Mapping[str, Mapping[str, pd.DataFrame]]],
+    *,
+    period: str = "annual",
+    statements: Iterable[str] | None = None,
+    items: Iterable[str] | None = None,
+    align: str = "fiscal",
+) -> StatementPanel:
+    """Align statements of many tickers into a :class:`StatementPanel`.
+
+    Parameters
+    ----------
+    data:
+        ``ticker -> statement -> period type -> frame`` as returned by
+        :func:`~modules.data.financials.fetch_statements_batch`.
+    period:
+        Period type to use (``"annual"`` or ``"quarter"``).
+    statements:
+        Statements to combine, default all in ``data``.  A line item found
+        on several statements keeps the value of the first.
+    items:
+        Line items to keep, in this order.  Default: every numeric column
+        in order of first appearance.
+    align:
+        ``"fiscal"`` to align on fiscal year and period where available,
+        ``"date"`` to align on the fiscal date.
+
+    Returns
+    -------
+    StatementPanel
+        Tickers in input order, periods sorted ascending.
+
+    Raises
+    ------
+    ValueError
+        If ``align`` is not ``"fiscal"`` or ``"date"``.
+    """
+    if align not in ("fiscal", "date"):
+        raise ValueError(f"align must be 'fiscal' or 'date', not {align!r}")
+    frames: Dict[str, List[pd.DataFrame]] = {}
+    for ticker, stmts in data.items():
+        names = list(statements) if statements is not None else list(stmts)
+        frames[str(ticker).upper()] = _ticker_frames(stmts, names, period, align)
+    tickers = list(frames)
+
+    parts = [df for dfs in frames.values() for df in dfs]
+    periods = sorted({p for df in parts for p in df.index})
+    if items is None:
+        items = list(dict.fromkeys(c for df in parts for c in df.columns))
+    else:
+        items = list(items)
+    period_index = pd.Index(periods)
+    item_index = pd.Index(items)
+
+    values = np.full((len(tickers), len(periods), len(items)), np.nan)
+    for t, dfs in enumerate(frames.values()):
+        # Write the first statement last so its values win
+        for df in reversed(dfs):
+            rows = period_index.get_indexer(df.index)
+            cols = item_index.get_indexer(df.columns)
+            keep = cols >= 0
+            values[t][np.ix_(rows, cols[keep])] = df.to_numpy(dtype=float)[:, keep]
+    panel = StatementPanel(values, tickers, periods, items)
+    logger.debug("Built %r", panel)
+    return panel
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+"""Registry of data providers used by :mod:`modules.data.fetching`.
+
+yfinance and FMP register themselves when :mod:`modules.data.fetching` is
+imported.  Further providers can be registered in code or declared in
+``config/finance_api.yaml``; each provider states how many symbols it
+accepts per request, its rate limit and how many requests may run at once.
+
+A YAML provider maps response fields onto :data:`BASIC_FIELDS` with dotted
+paths (list indices are plain numbers)::
+
+    providers:
+      inhouse:
+        base_url: https://data.example.com/api
+        api_key: ${INHOUSE_API_KEY}
+        profile: /v1/profile/{symbol}   # {symbol} may hold comma-joined symbols
+        results: data                   # path to the record list in the response
+        symbol: symbol                  # path to the symbol inside a record
+        batch_size: 100
+        rate: 20
+        burst: 40
+        max_concurrency: 8
+        auto: true                      # join the provider="auto" chain
+        priority: 5                     # yfinance is 0, FMP 10
+        fields:
+          Name: profile.name
+          Sector: profile.sector
+          Current Price: quote.price
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+import pandas as pd
+import yaml
+
+from modules.config_utils import CONFIG_DIR
+from modules.utils import get_limiter, http_get, parse_number
+from modules.utils.circuit_breaker import get_breaker
+from modules.utils.concurrency import observe
+from modules.utils.latency import adaptive_timeout
+from modules.utils.rate_limit import set_default_rate
+
+from .term_mapper import resolve_term
+
+logger = logging.getLogger(__name__)
+
+FINANCE_API_PATH = CONFIG_DIR / "finance_api.yaml"
+DEFAULT_HTTP_TIMEOUT = 10
+
+Row = Dict[str, Any]
+
+
+@dataclass
+class Provider:
+    """A source of :data:`BASIC_FIELDS` rows.
+
+    Parameters
+    ----------
+    name:
+        Identifier passed as ``provider=`` and used for the cache, rate
+        limiter and circuit breaker.
+    fetch:
+        Return the row for one ticker, or ``None``/``{}`` without data.
+    fetch_many:
+        Optional multi-symbol lookup returning rows keyed by ticker.
+    label:
+        Human readable name used in error messages.
+    batch_size:
+        Symbols per :attr:`fetch_many` request.
+    rate, burst:
+        Default token bucket for the provider (``rate_limits`` in the
+        settings still takes precedence).
+    max_concurrency:
+        Maximum simultaneous requests; ``None`` for no limit.
+    auto:
+        Whether the provider takes part in ``provider="auto"``.
+    priority:
+        Position in the ``auto`` chain, lowest first.
+    """
+
+    name: str
+    fetch: Callable[[str], Row | None]
+    fetch_many: Callable[[Sequence[str]], Mapping[str, Row]] | None = None
+    label: str = ""
+    batch_size: int = 1
+    rate: float | None = None
+    burst: int | None = None
+    max_concurrency: int | None = None
+    auto: bool = False
+    priority: int = 100
+    _slots: threading.BoundedSemaphore | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.label = self.label or self.name
+        if self.max_concurrency:
+            self._slots = threading.BoundedSemaphore(int(self.max_concurrency))
+
+    def get(self, ticker: str) -> Row | None:
+        """Return the row for ``ticker`` within the concurrency limit."""
+        if self._slots is None:
+            return self.fetch(ticker)
+        with self._slots:
+            return self.fetch(ticker)
+
+    def get_many(self, tickers: Sequence[str]) -> Mapping[str, Row]:
+        """Return rows for ``tickers`` from one multi-symbol request."""
+        if self.fetch_many is None:
+            raise NotImplementedError(f"{self.name} has no multi-symbol lookup")
+        if self._slots is None:
+            return self.fetch_many(tickers)
+        with self._slots:
+            return self.fetch_many(tickers)
+
+
+_providers: Dict[str, Provider] = {}
+_lock = threading.Lock()
+_config_loaded = False
+
+
+def register_provider(provider: Provider) -> Provider:
+    """Add ``provider`` to the registry, replacing one with the same name."""
+    if provider.rate is not None:
+        set_default_rate(provider.name, provider.rate, provider.burst)
+    with _lock:
+        _providers[provider.name] = provider
+    return provider
+
+
+def unregister_provider(name: str) -> None:
+    """Remove provider ``name`` if it is registered."""
+    with _lock:
+        _providers.pop(name, None)
+
+
+def _ensure_config_loaded() -> None:
+    global _config_loaded
+    with _lock:
+        if _config_loaded:
+            return
+        _config_loaded = True
+    load_configured_providers()
+
+
+def get_provider(name: str) -> Provider:
+    """Return the registered provider ``name``.
+
+    Raises
+    ------
+    ValueError
+        If no such provider is registered.
+    """
+    _ensure_config_loaded()
+    with _lock:
+        provider = _providers.get(name)
+    if provider is None:
+        raise ValueError(f"Unknown provider: {name}")
+    return provider
+
+
+def provider_names() -> List[str]:
+    """Return the names of all registered providers."""
+    _ensure_config_loaded()
+    with _lock:
+        return sorted(_providers)
+
+
+def auto_providers() -> List[Provider]:
+    """Return the providers of the ``provider="auto"`` chain in order."""
+    _ensure_config_loaded()
+    with _lock:
+        chain = [p for p in _providers.values() if p.auto]
+    return sorted(chain, key=lambda p: p.priority)
+
+
+def _get_path(obj: Any, path: str) -> Any:
+    """Return the value at dotted ``path`` inside ``obj`` or ``None``."""
+    for part in str(path).split("."):
+        if isinstance(obj, Mapping):
+            obj = obj.get(part)
+        elif isinstance(obj, list) and part.isdigit() and int(part) < len(obj):
+            obj = obj[int(part)]
+        else:
+            return None
+        if obj is None:
+            return None
+    return obj
+
+
+def http_provider(name: str, conf: Mapping[str, Any]) -> Provider:
+    """Return a :class:`Provider` for a JSON HTTP API described by ``conf``.
+
+    See the module docstring for the accepted keys.  ``api_key`` may refer
+    to environment variables (``${VAR}``) and is sent as the
+    ``api_key_param`` query parameter (default ``apikey``) or, when
+    ``api_key_header`` is set, as that header.
+    """
+    base_url = str(conf["base_url"]).rstrip("/")
+    endpoint = conf.get("profile") or (conf.get("endpoints") or {})["profile"]
+    fields: Mapping[str, str] = conf["fields"]
+    api_key = os.path.expandvars(str(conf.get("api_key") or ""))
+    key_header = conf.get("api_key_header")
+    key_param = conf.get("api_key_param", "apikey")
+    results_path = conf.get("results")
+    symbol_path = conf.get("symbol", "symbol")
+    timeout = float(conf.get("timeout", DEFAULT_HTTP_TIMEOUT))
+
+    def _request(symbols: str) -> Any:
+        def _get() -> Any:
+            params, headers = {}, {}
+            if api_key and key_header:
+                headers[key_header] = api_key
+            elif api_key:
+                params[key_param] = api_key
+            get_limiter(name).acquire()
+            limit = adaptive_timeout(name, timeout)
+            with observe(name, timeout=limit):
+                resp = http_get(
+                    base_url + endpoint.format(symbol=symbols),
+                    params=params,
+                    headers=headers,
+                    timeout=limit,
+                )
+                resp.raise_for_status()
+            return resp.json()
+
+        return get_breaker(name).call(_get)
+
+    def _records(data: Any) -> List[Mapping[str, Any]]:
+        found = _get_path(data, results_path) if results_path else data
+        if isinstance(found, Mapping):
+            return [found]
+        return [r for r in found or [] if isinstance(r, Mapping)]
+
+    def _row(record: Mapping[str, Any], ticker: str) -> Row | None:
+        from .fetching import BASIC_FIELDS, STATIC_FIELDS
+
+        row: Row = {"Ticker": ticker.upper()}
+        for col in BASIC_FIELDS[1:]:
+            val = _get_path(record, fields[col]) if col in fields else None
+            if col in STATIC_FIELDS:
+                val = "" if val is None else str(val)
+                row[col] = resolve_term(val) if col != "Name" else val
+            else:
+                row[col] = parse_number(pd.NA if val is None else val)
+        return row if row["Name"] else None
+
+    def fetch(ticker: str) -> Row | None:
+        records = _records(_request(ticker))
+        return _row(records[0], ticker) if records else None
+
+    def fetch_many(tickers: Sequence[str]) -> Dict[str, Row]:
+        by_symbol = {
+            str(_get_path(r, symbol_path)).upper(): r
+            for r in _records(_request(",".join(tickers)))
+        }
+        rows = {}
+        for tk in tickers:
+            record = by_symbol.get(tk.upper())
+            row = _row(record, tk) if record is not None else None
+            if row is not None:
+                rows[tk] = row
+        return rows
+
+    batch_size = int(conf.get("batch_size", 1))
+    return Provider(
+        name,
+        fetch,
+        fetch_many if batch_size > 1 else None,
+        label=conf.get("label", name),
+        batch_size=batch_size,
+        rate=conf.get("rate"),
+        burst=conf.get("burst"),
+        max_concurrency=conf.get("max_concurrency"),
+        auto=bool(conf.get("auto", False)),
+        priority=int(conf.get("priority", 100)),
+    )
+
+
+def load_configured_providers(path: str | Path | None = None) -> List[str]:
+    """Register the HTTP providers declared in ``finance_api.yaml``.
+
+    Providers are read from the ``providers`` mapping.  A top-level
+    configuration with ``fields`` is registered as well, under its ``name``
+    (default ``finance_api``).  Entries without ``fields`` are ignored.
+
+    Returns
+    -------
+    list[str]
+        Names of the providers that were registered.
+    """
+    path = Path(path or FINANCE_API_PATH)
+    if not path.exists():
+        return []
+    try:
+        conf = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        logger.warning("Could not read %s: %s", path, exc)
+        return []
+
+    declared = dict(conf.get("providers") or {})
+    if "fields" in conf:
+        declared.setdefault(conf.get("name", "finance_api"), conf)
+    registered = []
+    for name, entry in declared.items():
+        if not isinstance(entry, Mapping) or "fields" not in entry:
+            continue
+        try:
+            register_provider(http_provider(name, entry))
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Skipping provider %s from %s: %s", name, path, exc)
+            continue
+        registered.append(name)
+    if registered:
+        logger.info("Registered providers from %s: %s", path, ", ".join(registered))
+    return registered
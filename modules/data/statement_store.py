@@ -0,0 +1,378 @@
+"""Local Parquet store for financial statements.
+
+Statements are kept under ``cache/statements`` (or ``statement_store.path``)
+partitioned by ticker, statement and period type::
+
+    ticker=AAPL/statement=income/period=annual/part-<ns>.parquet
+
+Every row is one fiscal date.  :meth:`StatementStore.ingest` hashes the
+incoming rows and appends a new part file holding only the fiscal dates
+that are new or whose values changed, so a nightly reload writes just the
+delta.  :meth:`StatementStore.read` returns the latest version of each row
+with optional column projection and date filtering; :meth:`compact`
+rewrites a partition into a single file.
+
+Requires ``pyarrow``.  Enable the store for
+:func:`modules.data.financials.fetch_and_store_statements` in
+``config/settings.json``::
+
+    {
+      "statement_store": {"enabled": true, "path": "cache/statements"}
+    }
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.config_utils import CACHE_DIR, PROJECT_ROOT, load_settings
+
+try:
+    import pyarrow.parquet as pq
+except Exception:
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = CACHE_DIR / "statements"
+
+KEY_COLUMNS = ["ticker", "statement", "period", "fiscal_date"]
+# Provider columns holding the fiscal date, preferred over the frame index
+DATE_COLUMNS = ("period_ending", "date")
+# Bookkeeping columns written with every row
+HASH_COLUMN = "_hash"
+LOADED_COLUMN = "_loaded_at"
+
+Partition = Tuple[str, str, str]
+
+
+class IngestResult(NamedTuple):
+    """Outcome of loading one statement frame into the store."""
+
+    added: int
+    changed: int
+    unchanged: int
+    delta: pd.DataFrame
+
+    def summary(self) -> Dict[str, int]:
+        return {"added": self.added, "changed": self.changed, "unchanged": self.unchanged}
+
+
+def _require_pyarrow() -> None:
+    if pq is None:
+        raise ImportError("The statement store requires pyarrow (pip install pyarrow)")
+
+
+def fiscal_date(val) -> str:
+    """Return the ``YYYY-MM-DD`` key of one statement row label.
+
+    Dates and timestamps are formatted, anything else is returned as string.
+    """
+    if isinstance(val, (datetime, date, pd.Timestamp)):
+        return pd.Timestamp(val).strftime("%Y-%m-%d")
+    return str(val)
+
+
+def fiscal_dates(df: pd.DataFrame) -> List[str]:
+    """Return the :func:`fiscal_date` of every row of a statement frame.
+
+    Taken from the first of :data:`DATE_COLUMNS` present, else the index.
+    """
+    for col in DATE_COLUMNS:
+        if col in df.columns:
+            return [fiscal_date(v) for v in df[col]]
+    return [fiscal_date(v) for v in df.index]
+
+
+def _canonical_values(col: pd.Series) -> pd.Series:
+    """Return ``col`` with numbers as ``float64`` and everything else as strings.
+
+    ``int64`` and ``float64`` columns of the same values, or numbers read back
+    as ``object``, thus hash alike.
+    """
+    if pd.api.types.is_bool_dtype(col.dtype):
+        return col.astype(object).map(str)
+    if pd.api.types.is_numeric_dtype(col.dtype):
+        return col.astype("float64")
+    if col.dtype == object and pd.api.types.infer_dtype(col, skipna=True) in (
+        "integer",
+        "floating",
+        "mixed-integer-float",
+        "decimal",
+    ):
+        return pd.to_numeric(col, errors="coerce").astype("float64")
+    return col.astype(object).map(str)
+
+
+def row_hashes(df: pd.DataFrame) -> pd.Series:
+    """Return a content hash per row of ``df``.
+
+    Each non-null ``(column, value)`` item is hashed on its own and the item
+    hashes are summed, so the result does not depend on column order, and
+    columns that are null in a row (including columns the row never had)
+    leave its hash unchanged.  Values are normalized by
+    :func:`_canonical_values` first.
+    """
+    total = np.zeros(len(df), dtype="uint64")
+    names = [str(c) for c in df.columns]
+    for i, name in enumerate(names):
+        col = df.iloc[:, i]
+        present = col.notna().to_numpy()
+        if not present.any():
+            continue
+        values = _canonical_values(col[present]).to_numpy()
+        key = pd.util.hash_array(np.array([name], dtype=object))[0]
+        total[present] += pd.util.hash_array(pd.util.hash_array(values) ^ key)
+    return pd.Series(total, index=df.index)
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with mixed-type object columns stored as strings."""
+    out = df.copy()
+    for col in out.columns:
+        if out[col].dtype != object:
+            continue
+        kind = pd.api.types.infer_dtype(out[col], skipna=True)
+        if kind.startswith("mixed"):
+            out[col] = out[col].map(lambda v: v if pd.isna(v) else str(v))
+    return out
+
+
+class StatementStore:
+    """Partitioned Parquet store of statement rows.
+
+    Parameters
+    ----------
+    root:
+        Directory holding the partitions.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_STORE_PATH) -> None:
+        _require_pyarrow()
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+    def _partition_dir(self, ticker: str, statement: str, period: str) -> Path:
+        return (
+            self.root
+            / f"ticker={ticker.upper()}"
+            / f"statement={statement}"
+            / f"period={period}"
+        )
+
+    def partitions(
+        self,
+        tickers: Iterable[str] | None = None,
+        statements: Iterable[str] | None = None,
+        periods: Iterable[str] | None = None,
+    ) -> List[Partition]:
+        """Return the stored ``(ticker, statement, period)`` partitions."""
+        wanted = [
+            None if values is None else {str(v) for v in values}
+            for values in (
+                None if tickers is None else [t.upper() for t in tickers],
+                statements,
+                periods,
+            )
+        ]
+        found: List[Partition] = []
+        for path in sorted(self.root.glob("ticker=*/statement=*/period=*")):
+            if not path.is_dir():
+                continue
+            key = tuple(part.split("=", 1)[1] for part in path.parts[-3:])
+            if all(w is None or k in w for w, k in zip(wanted, key)):
+                found.append(key)  # type: ignore[arg-type]
+        return found
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def _read_partition(
+        self, ticker: str, statement: str, period: str, columns: Sequence[str] | None = None
+    ) -> pd.DataFrame:
+        """Return the latest version of every row in one partition."""
+        frames = []
+        for path in sorted(self._partition_dir(ticker, statement, period).glob("*.parquet")):
+            wanted = None
+            if columns is not None:
+                names = pq.read_schema(path).names
+                needed = ["fiscal_date", HASH_COLUMN, LOADED_COLUMN, *columns]
+                wanted = [c for c in dict.fromkeys(needed) if c in names]
+            frames.append(pq.read_table(path, columns=wanted).to_pandas())
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        df = df.sort_values(LOADED_COLUMN, kind="stable")
+        return df.drop_duplicates("fiscal_date", keep="last").sort_values("fiscal_date")
+
+    def stored_hashes(self, ticker: str, statement: str, period: str) -> Dict[str, int]:
+        """Return the content hash of the latest version of each fiscal date."""
+        df = self._read_partition(ticker, statement, period, columns=[])
+        if df.empty:
+            return {}
+        return dict(zip(df["fiscal_date"], df[HASH_COLUMN].astype("uint64")))
+
+    def read(
+        self,
+        tickers: Iterable[str] | None = None,
+        statements: Iterable[str] | None = None,
+        periods: Iterable[str] | None = None,
+        *,
+        columns: Sequence[str] | None = None,
+        start: str | date | None = None,
+        end: str | date | None = None,
+    ) -> pd.DataFrame:
+        """Return stored statement rows.
+
+        Parameters
+        ----------
+        tickers, statements, periods:
+            Restrict the partitions read; ``None`` reads all.
+        columns:
+            Line items to load.  Only these columns are read from disk.
+        start, end:
+            Inclusive fiscal date bounds (``YYYY-MM-DD``).
+
+        Returns
+        -------
+        pandas.DataFrame
+            :data:`KEY_COLUMNS` followed by the line items, one row per
+            ticker, statement, period type and fiscal date.
+        """
+        start = fiscal_date(start) if start is not None else None
+        end = fiscal_date(end) if end is not None else None
+        frames = []
+        for ticker, statement, period in self.partitions(tickers, statements, periods):
+            df = self._read_partition(ticker, statement, period, columns)
+            if df.empty:
+                continue
+            if start is not None:
+                df = df[df["fiscal_date"] >= start]
+            if end is not None:
+                df = df[df["fiscal_date"] <= end]
+            frames.append(df.assign(ticker=ticker, statement=statement, period=period))
+        if not frames:
+            return pd.DataFrame(columns=KEY_COLUMNS + list(columns or []))
+        df = pd.concat(frames, ignore_index=True, sort=False)
+        data_cols = [c for c in df.columns if c not in KEY_COLUMNS + [HASH_COLUMN, LOADED_COLUMN]]
+        if columns is not None:
+            data_cols = [c for c in columns if c in df.columns]
+        return df[KEY_COLUMNS + data_cols].reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def ingest(self, ticker: str, statement: str, period: str, df: pd.DataFrame) -> IngestResult:
+        """Append the rows of ``df`` that are new or changed.
+
+        ``df`` is a statement frame as returned by
+        :func:`modules.data.financials.fetch_statements`; rows are keyed by
+        :func:`fiscal_dates`.  The returned :attr:`IngestResult.delta` holds the appended
+        rows with their original index.
+        """
+        if df is None or df.empty:
+            return IngestResult(0, 0, 0, pd.DataFrame())
+        dates = fiscal_dates(df)
+        keep = ~pd.Index(dates).duplicated(keep="last")
+        df, dates = df[keep], [d for d, k in zip(dates, keep) if k]
+        hashes = row_hashes(df).to_numpy()
+        with self._lock:
+            stored = self.stored_hashes(ticker, statement, period)
+            new = [d not in stored for d in dates]
+            changed = [d in stored and stored[d] != h for d, h in zip(dates, hashes)]
+            mask = [n or c for n, c in zip(new, changed)]
+            delta = df[mask]
+            if not delta.empty:
+                rows = _arrow_safe(delta.reset_index(drop=True))
+                rows.columns = list(map(str, rows.columns))
+                rows.insert(0, "fiscal_date", [d for d, m in zip(dates, mask) if m])
+                rows[HASH_COLUMN] = hashes[mask]
+                rows[LOADED_COLUMN] = time.time()
+                path = self._partition_dir(ticker, statement, period)
+                path.mkdir(parents=True, exist_ok=True)
+                rows.to_parquet(path / f"part-{time.time_ns()}.parquet", index=False)
+        result = IngestResult(sum(new), sum(changed), len(df) - sum(mask), delta)
+        logger.info("Stored %s %s %s: %s", ticker.upper(), statement, period, result.summary())
+        return result
+
+    def ingest_statements(
+        self, ticker: str, data: Dict[str, Dict[str, pd.DataFrame]]
+    ) -> Dict[str, Dict[str, IngestResult]]:
+        """Ingest :func:`~modules.data.financials.fetch_statements` output."""
+        return {
+            stmt: {period: self.ingest(ticker, stmt, period, df) for period, df in periods.items()}
+            for stmt, periods in data.items()
+        }
+
+    def compact(
+        self,
+        tickers: Iterable[str] | None = None,
+        statements: Iterable[str] | None = None,
+        periods: Iterable[str] | None = None,
+    ) -> int:
+        """Rewrite each partition as one file with its latest rows.
+
+        Returns the number of part files removed.
+        """
+        removed = 0
+        with self._lock:
+            for ticker, statement, period in self.partitions(tickers, statements, periods):
+                path = self._partition_dir(ticker, statement, period)
+                parts = sorted(path.glob("*.parquet"))
+                if len(parts) <= 1:
+                    continue
+                df = self._read_partition(ticker, statement, period)
+                df.to_parquet(path / f"part-{time.time_ns()}.parquet", index=False)
+                for part in parts:
+                    part.unlink()
+                removed += len(parts) - 1
+        return removed
+
+    def clear(self) -> None:
+        """Delete every stored statement."""
+        with self._lock:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+_store: StatementStore | None = None
+_store_lock = threading.Lock()
+
+
+def _store_settings() -> Dict:
+    return load_settings().get("statement_store", {}) or {}
+
+
+def statement_store_enabled() -> bool:
+    """Return ``True`` if ``statement_store.enabled`` is set in the settings."""
+    return bool(_store_settings().get("enabled", False))
+
+
+def get_statement_store() -> StatementStore:
+    """Return the process-wide :class:`StatementStore` configured from settings."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            path = Path(_store_settings().get("path", DEFAULT_STORE_PATH))
+            if not path.is_absolute():
+                path = PROJECT_ROOT / path
+            _store = StatementStore(path)
+        return _store
+
+
+def set_statement_store(store: StatementStore | None) -> None:
+    """Replace the process-wide store (``None`` rebuilds it from settings)."""
+    global _store
+    with _store_lock:
+        _store = store
@@ -3,87 +3,256 @@ from __future__ import annotations
 """Unified data fetching with prioritized fallbacks."""
 
 import logging
-from typing import Any, Dict, Iterable
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Sequence
 
 import pandas as pd
 
-from .fetching import fetch_basic_stock_data
+from modules.config_utils import load_settings
+
+from .compare import fetch_profile_openbb, fetch_profiles_openbb
+from .fetching import BASIC_FIELDS, fetch_basic_stock_data, plan_refresh, refresh_quotes
+from .fetch_cache import cache_enabled, get_cache
+from .merge import merge_records, merge_sources
 from .term_mapper import resolve_term
 from .directus_mapper import prepare_records
 from .directus_client import insert_items
-from modules.utils import get_openbb
+from modules.utils import progress_iter
+from modules.utils.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+def _openbb_row(df: pd.DataFrame, ticker: str) -> Dict[str, Any] | None:
+    """Convert an OpenBB profile frame into the :data:`BASIC_FIELDS` format."""
+    if df is None or df.empty:
+        logger.info("OpenBB returned no data for %s", ticker)
+        return None
+    row = df.iloc[0]
+    data = {
+        "Ticker": ticker.upper(),
+        "Name": row.get("name") or row.get("legal_name") or "",
+        "Sector": row.get("sector") or "",
+        "Industry": row.get("industry_category")
+        or row.get("industry_group")
+        or "",
+        "Current Price": row.get("last_price", pd.NA),
+        "Market Cap": row.get("market_cap", pd.NA),
+        "PE Ratio": row.get("pe_ratio", pd.NA),
+        "Dividend Yield": row.get("dividend_yield", pd.NA),
+    }
+    logger.info("Fetched data for %s from OpenBB", ticker)
+    return data
+
+
 def _from_openbb(ticker: str) -> Dict[str, Any] | None:
     """Return company data from OpenBB or ``None`` on error."""
     try:
-        obb = get_openbb()
-        df = obb.equity.profile(symbol=ticker).to_df()
-        if df.empty:
-            logger.info("OpenBB returned no data for %s", ticker)
-            return None
-        row = df.iloc[0]
-        data = {
-            "Ticker": ticker.upper(),
-            "Name": row.get("name") or row.get("legal_name") or "",
-            "Sector": row.get("sector") or "",
-            "Industry": row.get("industry_category")
-            or row.get("industry_group")
-            or "",
-            "Current Price": row.get("last_price", pd.NA),
-            "Market Cap": row.get("market_cap", pd.NA),
-            "PE Ratio": pd.NA,
-            "Dividend Yield": row.get("dividend_yield", pd.NA),
-        }
-        logger.info("Fetched data for %s from OpenBB", ticker)
-        return data
+        return _openbb_row(fetch_profile_openbb(ticker), ticker)
     except Exception as exc:  # pragma: no cover - network failure
         logger.warning("OpenBB fetch failed for %s: %s", ticker, exc)
         return None
 
 
+def _from_openbb_many(tickers: Iterable[str]) -> Dict[str, Dict[str, Any] | None]:
+    """Return OpenBB company data for ``tickers`` using multi-symbol requests."""
+    return {
+        tk: _openbb_row(df, tk) for tk, df in fetch_profiles_openbb(tickers).items()
+    }
+
+
 DEFAULT_USE_OPENBB = True
 
+# Seconds to wait for all sources before merging whatever has arrived
+FANOUT_DEADLINE = 20.0
+# Seconds OpenBB may answer alone before yfinance/FMP is queried as well
+OPENBB_HEAD_START = 0.0
+
+# Companies fetched in parallel and records per Directus insert in batch runs
+BATCH_WORKERS = 8
+INSERT_CHUNK_SIZE = 100
+REPORT_COLUMNS = ["Ticker", "Status", "Error"]
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _is_missing(val: Any) -> bool:
+    return val is pd.NA or val is None or val == ""
+
 
 def _log_missing(data: Dict[str, Any], fields: Iterable[str], ticker: str) -> None:
-    missing = []
-    for f in fields:
-        val = data.get(f)
-        if val is pd.NA or val is None or val == "":
-            missing.append(f)
+    missing = [f for f in fields if _is_missing(data.get(f))]
     if missing:
         logger.warning("%s missing fields: %s", ticker, ", ".join(missing))
 
 
-def fetch_company_data(ticker: str, *, use_openbb: bool | None = None) -> Dict[str, Any] | None:
-    """Return normalized company data using prioritized sources."""
+def _is_complete(data: Dict[str, Any] | None) -> bool:
+    """Return ``True`` if ``data`` has every field :func:`_log_missing` checks."""
+    return bool(data) and not any(_is_missing(data.get(f)) for f in BASIC_FIELDS)
+
+
+def _fanout_settings() -> Dict[str, Any]:
+    return load_settings().get("unified_fetcher", {}) or {}
+
+
+def _fanout_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="company")
+        return _executor
+
+
+def _openbb_result(fut: Future | None, ticker: str) -> Dict[str, Any] | None:
+    if fut is None or not fut.done():
+        return None
+    try:
+        return fut.result()
+    except Exception as exc:
+        logger.warning("OpenBB fetch failed for %s: %s", ticker, exc)
+        return None
+
+
+_inflight = SingleFlight("fetch_company_data")
+
+
+def fetch_company_data(
+    ticker: str,
+    *,
+    use_openbb: bool | None = None,
+    force: bool = False,
+    delta: bool = False,
+) -> Dict[str, Any] | None:
+    """Return normalized company data using prioritized sources.
+
+    OpenBB and yfinance/FMP are queried concurrently; their results are
+    merged once both answered or the ``unified_fetcher.deadline`` setting
+    (seconds) has passed.  With a positive ``unified_fetcher.openbb_head_start``
+    OpenBB is queried alone for that long and yfinance/FMP is skipped if it
+    returned every field, P/E included (only some OpenBB profile providers
+    report ``pe_ratio``).
+    Concurrent calls for the same ticker share one fetch.  When the fetch
+    cache is enabled, tickers for which every source failed are skipped with
+    exponential backoff unless ``force`` is ``True``.  With ``delta`` (and
+    the cache enabled) only stale fields are refetched: fresh data is served
+    from the field store and expired prices go through the quote endpoint
+    before falling back to the full fetch.
+    """
     if use_openbb is None:
         use_openbb = DEFAULT_USE_OPENBB
+    data = _inflight.do(
+        (ticker.upper(), use_openbb, force, delta),
+        _fetch_company_data,
+        ticker,
+        use_openbb,
+        force,
+        delta,
+    )
+    return dict(data) if data is not None else None
+
+
+def _from_field_store_many(tickers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Return the tickers that need no full fetch, refreshed from the field store."""
+    plan = plan_refresh(tickers)
+    served = [tk for tk in dict.fromkeys(tickers) if tk not in plan.full]
+    if not served:
+        return {}
+    rows = {row["Ticker"]: row for row in refresh_quotes(served).to_dict(orient="records")}
+    logger.info("Fetched %d companies from the field store (%s)", len(rows), plan.summary())
+    return rows
+
+
+def _from_field_store(ticker: str) -> Dict[str, Any] | None:
+    """Return ``ticker`` refreshed from the field store or ``None`` if a full fetch is needed."""
+    return _from_field_store_many([ticker]).get(ticker)
+
+
+def _fetch_company_data(
+    ticker: str,
+    use_openbb: bool,
+    force: bool = False,
+    delta: bool = False,
+) -> Dict[str, Any] | None:
+    """Uncoalesced implementation of :func:`fetch_company_data`."""
+    cache = get_cache() if cache_enabled() else None
+    failure = cache.get_failure("company", ticker) if cache is not None else None
+    if failure is not None and failure.blocked and not force:
+        cache.record_negative_hit()
+        logger.info(
+            "Skipping %s: failed %d time(s), next retry in %.0fs",
+            ticker,
+            failure.failures,
+            failure.retry_in,
+        )
+        return None
+
+    if delta and cache is not None:
+        data = _from_field_store(ticker)
+        if data is not None:
+            return data
+
+    # Query OpenBB and yfinance/FMP concurrently and merge once both have
+    # answered or the deadline has passed.
+    conf = _fanout_settings()
+    deadline = time.monotonic() + float(conf.get("deadline", FANOUT_DEADLINE))
+    ex = _fanout_executor()
+    openbb_fut = ex.submit(_from_openbb, ticker) if use_openbb else None
+    head_start = float(conf.get("openbb_head_start", OPENBB_HEAD_START))
+    if openbb_fut is not None and head_start > 0:
+        wait([openbb_fut], timeout=head_start)
+    basic_fut = None
+    if _is_complete(_openbb_result(openbb_fut, ticker)):
+        logger.info("OpenBB returned every field for %s; skipping yfinance/FMP", ticker)
+    else:
+        basic_fut = ex.submit(fetch_basic_stock_data, ticker, force=force)
+
+    pending = {f for f in (openbb_fut, basic_fut) if f is not None}
+    while pending:
+        _, pending = wait(
+            pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED
+        )
+        if pending and time.monotonic() >= deadline:
+            logger.warning("Deadline passed for %s; merging the sources that answered", ticker)
+            break
+
+    data = _openbb_result(openbb_fut, ticker)
+    basic, error = None, None
+    if basic_fut is not None:
+        if not basic_fut.done():
+            error = TimeoutError("yfinance/FMP did not answer before the deadline")
+        else:
+            try:
+                basic = basic_fut.result()
+            except Exception as exc:
+                error = exc
 
-    data = _from_openbb(ticker) if use_openbb else None
     source = "OpenBB" if data else "yfinance/FMP"
+    if data and cache is not None:
+        cache.set_fields(
+            ticker, {k: v for k, v in data.items() if not _is_missing(v)}, "openbb"
+        )
     if not data:
-        try:
-            data = fetch_basic_stock_data(ticker)
-        except Exception as exc:
-            logger.error("All fetchers failed for %s: %s", ticker, exc)
+        if basic is None:
+            logger.error("All fetchers failed for %s: %s", ticker, error)
+            if cache is not None:
+                cache.record_failure("company", ticker, str(error))
             return None
-    else:
+        data = basic
+    elif basic is not None:
         # fill missing fields with yfinance/FMP fallback
-        try:
-            yf_data = fetch_basic_stock_data(ticker)
-            cleaned = {}
-            for k, v in data.items():
-                if v is pd.NA or v is None or v == "":
-                    continue
-                cleaned[k] = v
-            merged = yf_data | cleaned
-            _log_missing(merged, yf_data.keys(), ticker)
-            data = merged
-        except Exception as exc:
-            logger.info("Fallback fetch failed for %s: %s", ticker, exc)
+        data, provenance = merge_records({"OpenBB": data, "yfinance/FMP": basic})
+        filled = [f for f, src in provenance.items() if src == "yfinance/FMP"]
+        if filled:
+            source = f"OpenBB (yfinance/FMP: {', '.join(filled)})"
+        _log_missing(data, basic.keys(), ticker)
+    elif basic_fut is not None:
+        logger.info("Fallback fetch failed for %s: %s", ticker, error)
+
+    if failure is not None:
+        cache.clear_failure("company", ticker)
 
     # Normalize sector/industry
     if data:
@@ -111,3 +280,206 @@ def fetch_and_store(
     except Exception as exc:  # pragma: no cover - network failure
         logger.error("Directus insertion failed: %s", exc)
     return record
+
+
+def _fetch_basic_many(
+    tickers: Sequence[str], *, force: bool, max_workers: int, progress: bool
+) -> tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+    """Return yfinance/FMP rows and errors for ``tickers`` fetched concurrently."""
+    rows: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, Exception] = {}
+    if not tickers:
+        return rows, errors
+
+    def _one(ticker: str) -> tuple[str, Dict[str, Any] | None, Exception | None]:
+        try:
+            return ticker, fetch_basic_stock_data(ticker, force=force, hedge=False), None
+        except Exception as exc:
+            return ticker, None, exc
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as ex:
+        done: Iterable[Future] = as_completed([ex.submit(_one, tk) for tk in tickers])
+        if progress:
+            done = progress_iter(done, description="Companies")
+        for fut in done:
+            ticker, row, error = fut.result()
+            if row:
+                rows[ticker] = {**row, "Ticker": ticker}
+            else:
+                errors[ticker] = error or ValueError("No data returned")
+    return rows, errors
+
+
+def _merge_batch(
+    tickers: Sequence[str],
+    openbb: Dict[str, Dict[str, Any] | None],
+    basic: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Merge OpenBB and yfinance/FMP rows of many tickers in one pass.
+
+    Each merged row keeps only the fields its own source rows had, as
+    :func:`fetch_company_data` does.
+    """
+    sources = {
+        "OpenBB": [openbb[tk] for tk in tickers if openbb.get(tk)],
+        "yfinance/FMP": [basic[tk] for tk in tickers if tk in basic],
+    }
+    frames = {name: pd.DataFrame(rows) for name, rows in sources.items() if rows}
+    if not frames:
+        return {}
+    result = merge_sources(frames)
+    columns = list(result.data.columns)
+    filled = result.provenance.drop(columns="Ticker").eq("yfinance/FMP").to_numpy()
+
+    terms: Dict[str, str] = {}
+    merged: Dict[str, Dict[str, Any]] = {}
+    for values, from_basic in zip(result.data.to_numpy(dtype=object), filled):
+        ticker = values[0]
+        fields = {**(basic.get(ticker) or {}), **(openbb.get(ticker) or {})}
+        data = {c: v for c, v in zip(columns, values) if c in fields}
+        for col in ("Sector", "Industry"):
+            if col in data:
+                term = str(data[col])
+                if term not in terms:
+                    terms[term] = resolve_term(term)
+                data[col] = terms[term]
+        merged[ticker] = data
+        if openbb.get(ticker) and ticker in basic:
+            names = [c for c, f in zip(columns[1:], from_basic) if f]
+            logger.debug("Fetched %s using OpenBB (yfinance/FMP: %s)", ticker, ", ".join(names))
+    return merged
+
+
+def fetch_company_data_batch(
+    tickers: Iterable[str],
+    *,
+    use_openbb: bool | None = None,
+    force: bool = False,
+    delta: bool = False,
+    max_workers: int = BATCH_WORKERS,
+    progress: bool = False,
+) -> Dict[str, Dict[str, Any] | None]:
+    """Return :func:`fetch_company_data` for many tickers.
+
+    OpenBB profiles are requested up front in multi-symbol chunks (see
+    :func:`modules.data.compare.fetch_profiles_openbb`), yfinance/FMP is
+    queried concurrently for the tickers OpenBB left incomplete and all rows
+    are merged in one :func:`~modules.data.merge.merge_sources` call.  The
+    fetch cache backoff and ``delta`` refresh work as in
+    :func:`fetch_company_data`; there is no per-ticker deadline.  The result
+    is keyed by upper-case ticker in input order; tickers for which every
+    source failed map to ``None``.
+    """
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+    if use_openbb is None:
+        use_openbb = DEFAULT_USE_OPENBB
+    cache = get_cache() if cache_enabled() else None
+
+    results: Dict[str, Dict[str, Any] | None] = {}
+    failed = set()
+    if cache is not None:
+        for tk in tickers:
+            failure = cache.get_failure("company", tk)
+            if failure is None:
+                continue
+            failed.add(tk)
+            if failure.blocked and not force:
+                cache.record_negative_hit()
+                logger.info("Skipping %s: next retry in %.0fs", tk, failure.retry_in)
+                results[tk] = None
+    need = [tk for tk in tickers if tk not in results]
+    if delta and cache is not None and need:
+        results.update(_from_field_store_many(need))
+        need = [tk for tk in need if tk not in results]
+
+    openbb = _from_openbb_many(need) if use_openbb and need else {}
+    if cache is not None:
+        for tk, row in openbb.items():
+            if row:
+                cache.set_fields(
+                    tk, {k: v for k, v in row.items() if not _is_missing(v)}, "openbb"
+                )
+    basic, errors = _fetch_basic_many(
+        [tk for tk in need if not _is_complete(openbb.get(tk))],
+        force=force,
+        max_workers=max_workers,
+        progress=progress,
+    )
+    merged = _merge_batch(need, openbb, basic)
+
+    for tk in need:
+        results[tk] = merged.get(tk)
+        if tk not in merged:
+            logger.error("All fetchers failed for %s: %s", tk, errors.get(tk))
+            if cache is not None:
+                cache.record_failure("company", tk, str(errors.get(tk)))
+        elif tk in failed:
+            cache.clear_failure("company", tk)
+    logger.info(
+        "Fetched %d of %d companies (%d via OpenBB, %d via yfinance/FMP)",
+        sum(1 for data in results.values() if data),
+        len(tickers),
+        sum(1 for row in openbb.values() if row),
+        len(basic),
+    )
+    return {tk: results.get(tk) for tk in tickers}
+
+
+def fetch_and_store_batch(
+    tickers: Iterable[str],
+    collection: str = "company_profiles",
+    *,
+    use_openbb: bool | None = None,
+    force: bool = False,
+    max_workers: int = BATCH_WORKERS,
+    chunk_size: int = INSERT_CHUNK_SIZE,
+    progress: bool = False,
+) -> pd.DataFrame:
+    """Fetch many tickers and insert them into Directus in bulk.
+
+    Records are mapped with a single :func:`prepare_records` call and
+    inserted ``chunk_size`` at a time.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per ticker with columns :data:`REPORT_COLUMNS`; ``Status`` is
+        ``"stored"``, ``"fetch_failed"`` or ``"insert_failed"``.
+    """
+    fetched = fetch_company_data_batch(
+        tickers,
+        use_openbb=use_openbb,
+        force=force,
+        max_workers=max_workers,
+        progress=progress,
+    )
+    status = {
+        tk: ("fetch_failed", "No data returned by any source")
+        for tk, data in fetched.items()
+        if not data
+    }
+    ok = [tk for tk, data in fetched.items() if data]
+    prepared = prepare_records(collection, [fetched[tk] for tk in ok]) if ok else []
+
+    for start in range(0, len(ok), max(1, int(chunk_size))):
+        chunk = ok[start : start + chunk_size]
+        error = "Directus returned no data"
+        try:
+            inserted = insert_items(collection, prepared[start : start + chunk_size])
+        except Exception as exc:  # pragma: no cover - network failure
+            inserted, error = None, str(exc)
+        if not inserted:
+            logger.error("Directus insertion failed for %d records: %s", len(chunk), error)
+        for tk in chunk:
+            status[tk] = ("stored", "") if inserted else ("insert_failed", error)
+
+    logger.info(
+        "Stored %d of %d companies in %s",
+        sum(1 for s, _ in status.values() if s == "stored"),
+        len(fetched),
+        collection,
+    )
+    return pd.DataFrame(
+        [{"Ticker": tk, "Status": status[tk][0], "Error": status[tk][1]} for tk in fetched],
+        columns=REPORT_COLUMNS,
+    )
@@ -32,7 +32,7 @@ from modules.interface import (
 SETTINGS = load_settings()
 
 import pandas as pd
-from modules.utils import parse_number
+from modules.utils import parse_number, parse_number_record
 from modules.data.term_mapper import resolve_term
 from modules.data.directus_client import fetch_items, insert_items
 from modules.data import prepare_records
@@ -258,9 +258,7 @@ def add_tickers_to_group(groups: pd.DataFrame, group_name: str) -> pd.DataFrame:
             fetched = manual_data
 
         # Prepend group name to the row data
-        row_data = {"Group": group_name}
-        for k, v in fetched.items():
-            row_data[k] = parse_number(v) if k in NUMERIC_FIELDS else v
+        row_data = {"Group": group_name, **parse_number_record(fetched, NUMERIC_FIELDS)}
 
         # Append via loc to avoid FutureWarning
         groups.loc[len(groups)] = row_data
@@ -13,7 +13,7 @@ from modules.interface import (
 )
 
 import pandas as pd
-from modules.utils import parse_number
+from modules.utils import parse_number_record
 from modules.data.term_mapper import resolve_term
 from modules.data.directus_client import fetch_items, insert_items
 from modules.data import prepare_records
@@ -68,9 +68,7 @@ def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
 def _append_row(df: pd.DataFrame, data: dict) -> pd.DataFrame:
     """Return ``df`` with ``data`` appended as a new row."""
-    for field in NUMERIC_FIELDS:
-        if field in data:
-            data[field] = parse_number(data[field])
+    data.update(parse_number_record(data, NUMERIC_FIELDS))
     new_row = pd.DataFrame([data], columns=COLUMNS)
     if df.empty:
         return new_row
@@ -252,12 +250,32 @@ def remove_ticker(portfolio: pd.DataFrame) -> pd.DataFrame:
     return portfolio
 
 
-def update_tickers(portfolio: pd.DataFrame) -> pd.DataFrame:
-    """Refresh data for each ticker via the unified fetcher."""
+def update_tickers(portfolio: pd.DataFrame, *, quotes_only: bool = False) -> pd.DataFrame:
+    """Refresh data for each ticker via the unified fetcher.
+
+    With ``quotes_only`` only prices and valuation figures are refreshed
+    through :func:`modules.data.fetching.refresh_quotes`, reusing cached
+    name, sector and industry.
+    """
     if portfolio.empty:
         print("Portfolio is empty.\n")
         return portfolio
 
+    if quotes_only:
+        from modules.data.fetching import refresh_quotes
+
+        fresh = refresh_quotes(portfolio["Ticker"].dropna().astype(str).tolist())
+        by_ticker = fresh.set_index("Ticker")
+        for idx, row in portfolio.iterrows():
+            tk = row["Ticker"]
+            if tk in by_ticker.index:
+                for col in COLUMNS[1:]:
+                    portfolio.at[idx, col] = by_ticker.at[tk, col]
+                print(f"  ✓ Updated {tk}")
+            else:
+                print(f"  × Could not update {tk}")
+        return portfolio
+
     for idx, row in portfolio.iterrows():
         tk = row["Ticker"]
         try:
@@ -302,6 +320,7 @@ def main():
             "View portfolio",
             "Add ticker(s)",
             "Update ticker data",
+            "Refresh prices only",
             "Remove ticker",
             "Exit",
         ]
@@ -320,10 +339,14 @@ def main():
             save_portfolio(portfolio)
 
         elif choice == "4":
-            portfolio = remove_ticker(portfolio)
+            portfolio = update_tickers(portfolio, quotes_only=True)
             save_portfolio(portfolio)
 
         elif choice == "5":
+            portfolio = remove_ticker(portfolio)
+            save_portfolio(portfolio)
+
+        elif choice == "6":
             print("Exiting Portfolio Manager.")
             break
 
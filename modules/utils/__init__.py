@@ -13,11 +13,16 @@ from .data_utils import (
     read_csv_if_exists,
     read_json_if_exists,
     parse_number,
+    parse_number_series,
+    parse_number_frame,
+    parse_number_record,
     parse_human_number,
 )
 from .math_utils import moving_average, percentage_change
 from .progress_utils import progress_iter
-from .openbb_utils import get_openbb
+from .openbb_utils import get_openbb, warm_up_openbb
+from .http_utils import get_session, http_request, http_get
+from .rate_limit import get_limiter, rate_limit_stats
 
 __all__ = [
     "strip_timezones",
@@ -25,9 +30,18 @@ __all__ = [
     "read_csv_if_exists",
     "read_json_if_exists",
     "parse_number",
+    "parse_number_series",
+    "parse_number_frame",
+    "parse_number_record",
     "parse_human_number",
     "moving_average",
     "percentage_change",
     "progress_iter",
     "get_openbb",
+    "warm_up_openbb",
+    "get_session",
+    "http_request",
+    "http_get",
+    "get_limiter",
+    "rate_limit_stats",
 ]
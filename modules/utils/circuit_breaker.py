@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+"""Per-provider circuit breakers.
+
+A breaker opens after ``failure_threshold`` consecutive failures.  While open,
+calls fail immediately with :class:`CircuitOpenError` so callers can move on
+to a fallback provider instead of waiting for another timeout.  After
+``cooldown`` seconds the breaker half-opens and lets a single probe call
+through; its outcome closes or re-opens the circuit.
+
+Only outages count as failures (see :func:`is_outage`): timeouts,
+connection errors and HTTP 429/5xx responses.  Other errors, such as a
+ticker without data, are re-raised without touching the breaker so one bad
+symbol cannot take a provider offline for everyone else.
+
+Thresholds can be tuned in the ``circuit_breakers`` section of
+``config/settings.json``::
+
+    {
+      "circuit_breakers": {
+        "yf": {"failure_threshold": 5, "cooldown": 60}
+      }
+    }
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+from modules.config_utils import load_settings
+
+from .concurrency import is_timeout
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 60.0  # seconds
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+def is_outage(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` means the provider, not the request, failed.
+
+    Timeouts, connection errors (``OSError`` without an HTTP response, which
+    covers requests and curl_cffi errors), HTTP 429/5xx responses and rate
+    limit errors count; a 404 or an empty result does not.  Exceptions
+    wrapping such an error (``raise ... from exc``) count as well.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, CircuitOpenError) or is_timeout(exc):
+            return True
+        if any("RateLimit" in cls.__name__ for cls in type(exc).__mro__):
+            return True
+        if isinstance(exc, OSError):
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            return status is None or status == 429 or status >= 500
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider.
+
+    Parameters
+    ----------
+    name:
+        Provider label used in log messages and statistics.
+    failure_threshold:
+        Consecutive failures that open the circuit.
+    cooldown:
+        Seconds to stay open before allowing a probe call.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._counters = {"successes": 0, "failures": 0, "rejected": 0, "opened": 0}
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once cooled down."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._probing = False
+            logger.info("Circuit %s half-open; probing provider", self.name)
+
+    def allow(self) -> bool:
+        """Return ``True`` if a call may proceed now."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._counters["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        """Reset the failure count and close the circuit."""
+        with self._lock:
+            self._counters["successes"] += 1
+            self._failures = 0
+            self._probing = False
+            if self._state != CLOSED:
+                logger.info("Circuit %s closed", self.name)
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        """Count a failure and open the circuit when the threshold is reached."""
+        with self._lock:
+            self._counters["failures"] += 1
+            self._failures += 1
+            self._probing = False
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._counters["opened"] += 1
+                logger.warning(
+                    "Circuit %s opened after %d consecutive failures; skipping for %.0fs",
+                    self.name,
+                    self._failures,
+                    self.cooldown,
+                )
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed, freeing the probe slot."""
+        with self._lock:
+            self._probing = False
+
+    def call(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        is_failure: Callable[[BaseException], bool] = is_outage,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``fn`` through the breaker.
+
+        Exceptions for which ``is_failure`` returns ``False`` are re-raised
+        without being counted.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the circuit is open and ``fn`` was not called.
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            if is_failure(exc):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current state and success/failure counters."""
+        with self._lock:
+            self._maybe_half_open()
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                **self._counters,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_lock = threading.Lock()
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Return the shared :class:`CircuitBreaker` for ``provider``."""
+    with _lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            conf = (load_settings().get("circuit_breakers") or {}).get(provider) or {}
+            breaker = CircuitBreaker(
+                provider,
+                failure_threshold=conf.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+                cooldown=conf.get("cooldown", DEFAULT_COOLDOWN),
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def reset_breakers() -> None:
+    """Drop all breakers so they are rebuilt from settings on next use."""
+    with _lock:
+        _breakers.clear()
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Return :meth:`CircuitBreaker.stats` for every breaker created so far."""
+    with _lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
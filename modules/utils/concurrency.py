@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+"""Adaptive per-provider concurrency limits (AIMD).
+
+Every provider call reports its duration and outcome through
+:func:`observe`.  The limit grows by roughly one slot per round of
+successful calls and is cut by ``backoff`` when a call fails, is throttled
+(HTTP 429) or takes more than ``latency_factor`` times the provider's
+typical latency, so the number of requests in flight settles near what the
+provider sustains.
+
+Batch fetches with ``max_workers="auto"`` take a :meth:`AdaptiveConcurrency.slot`
+before each call.  Bounds can be tuned in the ``adaptive_concurrency``
+section of ``config/settings.json``::
+
+    {
+      "adaptive_concurrency": {
+        "yf": {"initial": 4, "minimum": 1, "maximum": 16}
+      }
+    }
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from modules.config_utils import load_settings
+
+from .latency import get_tracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL = 4
+DEFAULT_MINIMUM = 1
+DEFAULT_MAXIMUM = 32
+DEFAULT_BACKOFF = 0.5  # multiplicative decrease on congestion
+DEFAULT_LATENCY_FACTOR = 3.0  # slower than this times the baseline counts as congestion
+BASELINE_WINDOW = 50
+BASELINE_MIN_SAMPLES = 5
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` signals an HTTP 429 / rate-limit response."""
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    text = str(exc)
+    return "429" in text or "Too Many Requests" in text
+
+
+def is_timeout(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` is a socket or HTTP client timeout."""
+    if isinstance(exc, TimeoutError):
+        return True
+    # requests.Timeout and curl_cffi's Timeout do not derive from TimeoutError
+    return any(cls.__name__.endswith("Timeout") for cls in type(exc).__mro__)
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease limit for one provider.
+
+    Parameters
+    ----------
+    name:
+        Provider label used in log messages and statistics.
+    initial, minimum, maximum:
+        Starting limit and its bounds.
+    backoff:
+        Factor applied to the limit on congestion.
+    latency_factor:
+        Calls slower than this multiple of the baseline latency (the 10th
+        percentile of recent calls) count as congestion.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial: int = DEFAULT_INITIAL,
+        minimum: int = DEFAULT_MINIMUM,
+        maximum: int = DEFAULT_MAXIMUM,
+        backoff: float = DEFAULT_BACKOFF,
+        latency_factor: float = DEFAULT_LATENCY_FACTOR,
+    ) -> None:
+        self.name = name
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.backoff = float(backoff)
+        self.latency_factor = float(latency_factor)
+        self._limit = float(min(self.maximum, max(self.minimum, initial)))
+        self._active = 0
+        self._since_decrease = 0
+        self._latencies: deque[float] = deque(maxlen=BASELINE_WINDOW)
+        self._cond = threading.Condition()
+        self._counters = {
+            "successes": 0,
+            "failures": 0,
+            "throttled": 0,
+            "slow": 0,
+            "decreases": 0,
+        }
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        with self._cond:
+            return int(self._limit)
+
+    def _baseline(self) -> float | None:
+        if len(self._latencies) < BASELINE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[len(ordered) // 10]
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until fewer than :attr:`limit` calls are in flight."""
+        with self._cond:
+            while self._active >= int(self._limit):
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def record(self, latency: float, *, ok: bool = True, throttled: bool = False) -> None:
+        """Adjust the limit after a call that took ``latency`` seconds."""
+        with self._cond:
+            baseline = self._baseline()
+            slow = ok and baseline is not None and latency > baseline * self.latency_factor
+            if ok:
+                self._latencies.append(latency)
+            self._since_decrease += 1
+            if throttled:
+                self._counters["throttled"] += 1
+            if not ok:
+                self._counters["failures"] += 1
+            elif slow:
+                self._counters["slow"] += 1
+            else:
+                self._counters["successes"] += 1
+
+            if throttled or not ok or slow:
+                # Decrease at most once per round of calls at the current limit
+                if self._since_decrease >= int(self._limit):
+                    old = int(self._limit)
+                    self._limit = max(self.minimum, self._limit * self.backoff)
+                    self._since_decrease = 0
+                    self._counters["decreases"] += 1
+                    logger.info(
+                        "Concurrency for %s lowered %d -> %d", self.name, old, int(self._limit)
+                    )
+            else:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit, calls in flight and outcome counters."""
+        with self._cond:
+            return {
+                "limit": int(self._limit),
+                "active": self._active,
+                "baseline": self._baseline(),
+                **self._counters,
+            }
+
+
+_controllers: Dict[str, AdaptiveConcurrency] = {}
+_lock = threading.Lock()
+
+
+def get_concurrency(provider: str) -> AdaptiveConcurrency:
+    """Return the shared :class:`AdaptiveConcurrency` for ``provider``."""
+    with _lock:
+        controller = _controllers.get(provider)
+        if controller is None:
+            conf = (load_settings().get("adaptive_concurrency") or {}).get(provider) or {}
+            controller = AdaptiveConcurrency(
+                provider,
+                initial=conf.get("initial", DEFAULT_INITIAL),
+                minimum=conf.get("minimum", DEFAULT_MINIMUM),
+                maximum=conf.get("maximum", DEFAULT_MAXIMUM),
+                backoff=conf.get("backoff", DEFAULT_BACKOFF),
+                latency_factor=conf.get("latency_factor", DEFAULT_LATENCY_FACTOR),
+            )
+            _controllers[provider] = controller
+        return controller
+
+
+def reset_concurrency() -> None:
+    """Drop all controllers so they are rebuilt from settings on next use."""
+    with _lock:
+        _controllers.clear()
+
+
+def concurrency_stats() -> Dict[str, Dict[str, Any]]:
+    """Return :meth:`AdaptiveConcurrency.stats` for every controller."""
+    with _lock:
+        controllers = dict(_controllers)
+    return {name: c.stats() for name, c in controllers.items()}
+
+
+@contextmanager
+def observe(provider: str, *, timeout: float | None = None) -> Iterator[None]:
+    """Time a provider call and report it to its latency tracker and controller.
+
+    Exceptions are recorded as failures (throttled for HTTP 429) and
+    re-raised.  A call that timed out also counts towards the latency
+    percentiles, as at least ``timeout`` seconds, so an adaptive timeout
+    that became too short can grow again.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as exc:
+        elapsed = time.perf_counter() - start
+        if is_timeout(exc):
+            get_tracker(provider).record(max(elapsed, timeout or 0.0))
+        get_concurrency(provider).record(elapsed, ok=False, throttled=is_throttled(exc))
+        raise
+    elapsed = time.perf_counter() - start
+    get_tracker(provider).record(elapsed)
+    get_concurrency(provider).record(elapsed)
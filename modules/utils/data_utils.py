@@ -13,10 +13,17 @@ so callers do not have to repeat error handling.  Typical usage::
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Optional, Any
 import json
+from itertools import repeat
+
+try:
+    import pyarrow
+except Exception:
+    pyarrow = None
 
 
 def strip_timezones(df: pd.DataFrame) -> pd.DataFrame:
@@ -76,6 +83,50 @@ def write_dataframe(
         df.to_json(json_path, orient="records", indent=2, date_format="iso")
 
 
+NUMBER_SUFFIXES = {
+    "T": 1_000_000_000_000,
+    "B": 1_000_000_000,
+    "M": 1_000_000,
+    "K": 1_000,
+}
+
+# Strings :func:`parse_number` certainly converts: optional blanks, a decimal
+# number with commas anywhere in the mantissa and an optional suffix.  Only
+# ASCII so Arrow and Python agree on what matches.
+_PLAIN_NUMBER = (
+    r"[ \t]*[+-]?,*(?:[0-9][0-9,]*(?:\.[0-9,]*)?|\.,*[0-9][0-9,]*)"
+    r"(?:[eE][+-]?[0-9]+)?[KMBTkmbt]?[ \t]*"
+)
+# Anything else can only be a number if it has a digit, "inf" or "nan";
+# non-ASCII characters may be digits of other scripts
+_MAYBE_NUMBER = r"(?i)[^\x00-\x7f]|[0-9]|inf|nan"
+# Fewer strings than this are parsed one by one: below it the fixed cost of
+# the ``.str`` methods outweighs the per-element savings
+_MIN_VECTOR_STRINGS = 2_000
+# Arrow strings run the ``.str`` methods in compiled code
+_STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else "string[python]"
+
+# ``infer_dtype`` results that rule out strings
+_NO_STRINGS = {
+    "empty",
+    "floating",
+    "integer",
+    "mixed-integer-float",
+    "decimal",
+    "complex",
+    "boolean",
+    "datetime64",
+    "datetime",
+    "date",
+    "timedelta64",
+    "timedelta",
+    "time",
+    "period",
+    "interval",
+    "bytes",
+}
+
+
 def parse_number(val: Any) -> Any:
     """Return numeric value parsed from ``val`` if possible.
 
@@ -88,15 +139,9 @@ def parse_number(val: Any) -> Any:
         return val
     if isinstance(val, str):
         s = val.strip().replace(",", "")
-        multipliers = {
-            "T": 1_000_000_000_000,
-            "B": 1_000_000_000,
-            "M": 1_000_000,
-            "K": 1_000,
-        }
         if s:
             last = s[-1].upper()
-            mult = multipliers.get(last)
+            mult = NUMBER_SUFFIXES.get(last)
             if mult:
                 try:
                     return float(s[:-1]) * mult
@@ -112,3 +157,186 @@ def parse_number(val: Any) -> Any:
 def parse_human_number(val: Any) -> Any:
     """Return numeric value parsed from ``val`` if possible."""
     return parse_number(val)
+
+
+def _to_float(text: pd.Series) -> np.ndarray:
+    """Return numeric strings cast to ``float64`` values, rounded like ``float()``."""
+    if pyarrow is not None:
+        try:
+            return text.astype(pd.ArrowDtype(pyarrow.float64())).to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    return text.to_numpy(dtype=object).astype(np.float64)
+
+
+def _plain_numbers(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the numbers of the strings :func:`parse_number` certainly converts.
+
+    The second array marks those strings: all of them if the object cast
+    (``float()`` per element) succeeds, else the ones matching
+    :data:`_PLAIN_NUMBER`.  Commas, blanks and suffixes of the latter are
+    handled with ``.str`` methods and the rest is cast to ``float64``; Arrow's
+    cast and ``float()`` both round correctly, so the numbers match the
+    scalar function exactly (:func:`pandas.to_numeric` rounds differently).
+    Other cells are ``NaN``/``False``.
+    """
+    numbers = np.full(len(values), np.nan)
+    plain = np.zeros(len(values), dtype=bool)
+    if pd.api.types.infer_dtype(values, skipna=True) in _NO_STRINGS:
+        return numbers, plain
+    is_str = np.fromiter(map(isinstance, values, repeat(str)), dtype=bool, count=len(values))
+    positions = np.flatnonzero(is_str)
+    if not len(positions):
+        return numbers, plain
+    try:
+        numbers[positions] = values[positions].astype(np.float64)
+        plain[positions] = True
+        return numbers, plain
+    except ValueError:
+        if len(positions) < _MIN_VECTOR_STRINGS:
+            return numbers, plain
+
+    text = pd.Series(values[positions], dtype=_STRING_DTYPE)
+    matched = text.str.fullmatch(_PLAIN_NUMBER).to_numpy(dtype=bool)
+    positions = positions[matched]
+    if not len(positions):
+        return numbers, plain
+    cleaned = text[matched].str.replace(",", "", regex=False).str.strip(" \t")
+    mult = np.ones(len(positions))
+    for suffix, factor in NUMBER_SUFFIXES.items():
+        for case in (suffix, suffix.lower()):
+            mult[cleaned.str.endswith(case).to_numpy(dtype=bool)] = factor
+    suffixed = mult != 1
+    found = np.empty(len(positions))
+    found[~suffixed] = _to_float(cleaned[~suffixed])
+    found[suffixed] = _to_float(cleaned[suffixed].str.slice(stop=-1)) * mult[suffixed]
+    numbers[positions] = found
+    plain[positions] = True
+    return numbers, plain
+
+
+def _parse_number_values(
+    values: np.ndarray,
+    numbers: np.ndarray | None = None,
+    plain: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return an object array with :func:`parse_number` applied to ``values``.
+
+    ``numbers`` and ``plain`` are the :func:`_plain_numbers` of ``values`` if
+    already computed.  Remaining strings go through :func:`parse_number` only
+    if they might be a number (see :data:`_MAYBE_NUMBER`); the rest are
+    returned unchanged without raising per element.
+    """
+    if numbers is None or plain is None:
+        numbers, plain = _plain_numbers(values)
+    result = values.astype(object, copy=True)
+    result[plain] = numbers[plain]
+    rest = np.flatnonzero(~plain)
+    if not len(rest) or pd.api.types.infer_dtype(result[rest], skipna=True) in _NO_STRINGS:
+        return result
+    rest = rest[np.fromiter(map(isinstance, result[rest], repeat(str)), dtype=bool, count=len(rest))]
+    if len(rest) < _MIN_VECTOR_STRINGS:
+        result[rest] = [parse_number(v) for v in result[rest]]
+    elif len(rest):
+        text = pd.Series(result[rest], dtype=_STRING_DTYPE)
+        retry = rest[text.str.contains(_MAYBE_NUMBER, regex=True).to_numpy(dtype=bool)]
+        result[retry] = [parse_number(v) for v in result[retry]]
+    return result
+
+
+def _map_dtype(parsed: pd.DataFrame) -> pd.DataFrame:
+    """Return ``parsed`` (object columns) with the dtypes ``map`` would infer."""
+    converted = parsed.infer_objects()
+    # ``map`` only converts to numeric and boolean dtypes
+    for i, dtype in enumerate(converted.dtypes):
+        if dtype.kind not in "biufc":
+            converted.isetitem(i, parsed.iloc[:, i])
+    return converted
+
+
+def _parse_typed(values: pd.Series) -> pd.Series:
+    """Apply :func:`parse_number` to a column that is not of object dtype."""
+    if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+        # Numbers and timestamps are returned unchanged
+        return values.copy()
+    return values.map(parse_number)
+
+
+def parse_number_series(values: pd.Series, *, infer: bool = True) -> pd.Series:
+    """Return ``values`` with :func:`parse_number` applied to every element.
+
+    Vectorized equivalent of ``values.map(parse_number)``: the same strings
+    are converted to the same floats, everything else is left unchanged and
+    the result dtype is inferred the same way.  With ``infer=False`` the
+    result keeps object dtype and holds exactly what :func:`parse_number`
+    returns for each element.
+    """
+    if values.dtype != object and infer:
+        return _parse_typed(values)
+    cells = values.to_numpy(dtype=object)
+    numbers, plain = _plain_numbers(cells)
+    if infer and len(cells) and plain.all():
+        return pd.Series(numbers, index=values.index, name=values.name)
+    parsed = _parse_number_values(cells, numbers, plain)
+    frame = pd.DataFrame({0: parsed}, index=values.index, dtype=object)
+    if not infer:
+        return frame[0].rename(values.name)
+    return _map_dtype(frame)[0].rename(values.name)
+
+
+def parse_number_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with :func:`parse_number` applied to every cell.
+
+    Vectorized equivalent of ``df.map(parse_number)``.  All object columns
+    are parsed in one pass; numeric and datetime columns are copied as is.
+    """
+    dtypes = list(df.dtypes)
+    pending = [i for i, dtype in enumerate(dtypes) if dtype == object]
+    result = df.copy()
+    for i, dtype in enumerate(dtypes):
+        if dtype != object and not (
+            pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_datetime64_any_dtype(dtype)
+        ):
+            result.isetitem(i, _parse_typed(df.iloc[:, i]))
+    if not pending:
+        return result
+
+    block = df.iloc[:, pending].to_numpy(dtype=object)
+    numbers, plain = (
+        a.reshape(block.shape, order="F") for a in _plain_numbers(block.ravel(order="F"))
+    )
+    # Columns holding only numeric strings become float64 without boxing
+    floats = plain.all(axis=0) & (len(block) > 0)
+    pieces = []
+    if floats.any():
+        columns = [pending[j] for j in np.flatnonzero(floats)]
+        pieces.append(pd.DataFrame(numbers[:, floats], index=df.index, columns=columns))
+    if not floats.all():
+        mixed = ~floats
+        parsed = _parse_number_values(
+            block[:, mixed].ravel(order="F"),
+            numbers[:, mixed].ravel(order="F"),
+            plain[:, mixed].ravel(order="F"),
+        ).reshape((len(block), int(mixed.sum())), order="F")
+        columns = [pending[j] for j in np.flatnonzero(mixed)]
+        pieces.append(
+            _map_dtype(pd.DataFrame(parsed, index=df.index, columns=columns, dtype=object))
+        )
+    others = [i for i, dtype in enumerate(dtypes) if dtype != object]
+    if others:
+        pieces.append(result.iloc[:, others].set_axis(others, axis=1))
+    # Reassemble by position so duplicate column labels survive
+    converted = pieces[0] if len(pieces) == 1 else pd.concat(pieces, axis=1)
+    converted = converted[list(range(df.shape[1]))]
+    converted.columns = df.columns
+    return converted
+
+
+def parse_number_record(record: dict, fields: Any = None) -> dict:
+    """Return a copy of ``record`` with :func:`parse_number` applied to its values.
+
+    Only the keys in ``fields`` are parsed when given.
+    """
+    return {
+        k: parse_number(v) if fields is None or k in fields else v for k, v in record.items()
+    }
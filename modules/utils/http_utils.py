@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+"""Shared HTTP session with connection pooling and retries.
+
+All outgoing provider and Directus calls go through one process-wide
+:class:`requests.Session` so TCP/TLS connections are kept alive and reused.
+Idempotent requests are retried with exponential backoff on connection
+errors and ``429``/``5xx`` responses, honouring ``Retry-After`` up to
+``max_retry_after`` seconds so a long server-requested pause cannot stall
+a worker thread.
+
+Pool sizes and retry behaviour are read from the ``http`` section of
+``config/settings.json``::
+
+    {
+      "http": {
+        "pool_size": 10,
+        "pool_sizes": {"financialmodelingprep.com": 20},
+        "retries": 3,
+        "backoff": 0.5,
+        "max_retry_after": 10
+      }
+    }
+
+Example::
+
+    from modules.utils import http_get
+
+    resp = http_get("https://example.com/api", timeout=10)
+"""
+
+import threading
+from typing import Any, Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules.config_utils import load_settings
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5  # seconds, doubled after every retry
+DEFAULT_MAX_RETRY_AFTER = 10.0  # seconds, longest Retry-After wait honoured
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# POST is not idempotent (Directus inserts) so it is never retried
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "PATCH", "DELETE"})
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+def _http_settings() -> Dict[str, Any]:
+    return load_settings().get("http", {}) or {}
+
+
+class CappedRetry(Retry):
+    """:class:`~urllib3.util.retry.Retry` waiting at most ``max_retry_after`` seconds.
+
+    A ``Retry-After`` header asking for a longer pause is clamped to the
+    limit instead of blocking the calling thread for the full duration.
+    """
+
+    def __init__(
+        self, *args: Any, max_retry_after: float = DEFAULT_MAX_RETRY_AFTER, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kw: Any) -> "CappedRetry":
+        kw.setdefault("max_retry_after", self.max_retry_after)
+        return super().new(**kw)
+
+    def get_retry_after(self, response: Any) -> float | None:
+        seconds = super().get_retry_after(response)
+        if seconds is None:
+            return None
+        return min(seconds, self.max_retry_after)
+
+
+def _retry(conf: Dict[str, Any]) -> Retry:
+    """Return the urllib3 retry policy described by ``conf``."""
+    return CappedRetry(
+        total=int(conf.get("retries", DEFAULT_RETRIES)),
+        backoff_factor=float(conf.get("backoff", DEFAULT_BACKOFF)),
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        max_retry_after=float(conf.get("max_retry_after", DEFAULT_MAX_RETRY_AFTER)),
+    )
+
+
+def _adapter(pool_size: int, conf: Dict[str, Any]) -> HTTPAdapter:
+    return HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=_retry(conf),
+    )
+
+
+def _build_session() -> requests.Session:
+    conf = _http_settings()
+    session = requests.Session()
+    default = _adapter(int(conf.get("pool_size", DEFAULT_POOL_SIZE)), conf)
+    session.mount("https://", default)
+    session.mount("http://", default)
+    for host, size in (conf.get("pool_sizes") or {}).items():
+        adapter = _adapter(int(size), conf)
+        session.mount(f"https://{host}", adapter)
+        session.mount(f"http://{host}", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use.
+
+    The session is created under a lock; the underlying urllib3 connection
+    pools are thread-safe so worker threads may share it.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def set_pool_size(host: str, size: int) -> None:
+    """Use a dedicated connection pool of ``size`` connections for ``host``."""
+    session = get_session()
+    adapter = _adapter(size, _http_settings())
+    with _lock:
+        session.mount(f"https://{host}", adapter)
+        session.mount(f"http://{host}", adapter)
+
+
+def reset_session() -> None:
+    """Close the shared session so the next call rebuilds it from settings."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def http_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send ``method`` to ``url`` through the shared session."""
+    return get_session().request(method, url, **kwargs)
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request to ``url`` through the shared session."""
+    return http_request("GET", url, **kwargs)
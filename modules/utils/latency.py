@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+"""Rolling latency statistics per provider.
+
+Example::
+
+    from modules.utils.latency import get_tracker
+
+    tracker = get_tracker("yf")
+    tracker.record(0.42)
+    tracker.percentile(95)
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Dict
+
+from modules.config_utils import load_settings
+
+DEFAULT_WINDOW = 200  # most recent samples kept per provider
+
+# Adaptive timeouts: ``multiplier`` times the ``percentile`` latency
+TIMEOUT_PERCENTILE = 99
+TIMEOUT_MULTIPLIER = 3.0
+TIMEOUT_MINIMUM = 2.0  # seconds
+TIMEOUT_MIN_SAMPLES = 20
+
+
+class LatencyTracker:
+    """Thread-safe window of the most recent call durations in seconds."""
+
+    def __init__(self, name: str, window: int = DEFAULT_WINDOW) -> None:
+        self.name = name
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add one observed duration."""
+        with self._lock:
+            self._samples.append(float(seconds))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the ``pct`` percentile (nearest rank) or ``None`` without samples."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(1, math.ceil(pct / 100 * len(samples)))
+        return samples[min(rank, len(samples)) - 1]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return sample count, mean and p50/p95/p99 latencies."""
+        with self._lock:
+            samples = list(self._samples)
+        return {
+            "count": len(samples),
+            "mean": sum(samples) / len(samples) if samples else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_lock = threading.Lock()
+
+
+def get_tracker(name: str) -> LatencyTracker:
+    """Return the shared :class:`LatencyTracker` for ``name``."""
+    with _lock:
+        tracker = _trackers.get(name)
+        if tracker is None:
+            tracker = LatencyTracker(name)
+            _trackers[name] = tracker
+        return tracker
+
+
+def reset_trackers() -> None:
+    """Discard all recorded latencies."""
+    with _lock:
+        _trackers.clear()
+
+
+def latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Return :meth:`LatencyTracker.stats` for every tracker."""
+    with _lock:
+        trackers = dict(_trackers)
+    return {name: tracker.stats() for name, tracker in trackers.items()}
+
+
+def adaptive_timeout(name: str, default: float) -> float:
+    """Return a request timeout for ``name`` derived from its recorded latency.
+
+    With ``adaptive_timeouts.enabled`` in the settings and enough samples the
+    timeout is ``multiplier`` times the ``percentile`` latency, kept between
+    ``minimum`` and ``default`` so hung requests are abandoned sooner without
+    cutting off normal ones.  Otherwise ``default`` is returned.
+    """
+    conf = load_settings().get("adaptive_timeouts") or {}
+    if not conf.get("enabled", False):
+        return default
+    tracker = get_tracker(name)
+    if len(tracker) < int(conf.get("min_samples", TIMEOUT_MIN_SAMPLES)):
+        return default
+    value = tracker.percentile(float(conf.get("percentile", TIMEOUT_PERCENTILE)))
+    value *= float(conf.get("multiplier", TIMEOUT_MULTIPLIER))
+    return min(float(default), max(float(conf.get("minimum", TIMEOUT_MINIMUM)), value))
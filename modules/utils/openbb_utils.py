@@ -1,28 +1,94 @@
 from __future__ import annotations
 
-"""Utility functions for accessing the OpenBB Platform."""
+"""Utility functions for accessing the OpenBB Platform.
 
+Importing ``openbb`` takes several seconds.  :func:`warm_up_openbb` starts
+that import (and the login) in a background thread so the first data action
+does not stall; :func:`get_openbb` waits for it if it is still running.
+"""
+
+import logging
 import os
+import threading
+import time
+from typing import Any, Dict
 
+logger = logging.getLogger(__name__)
 
 _obb = None
 _logged_in = False
+_login_checked = False  # login attempted or skipped for lack of a token
+_lock = threading.Lock()
+_warmup: threading.Thread | None = None
+_timings: Dict[str, float | None] = {"import": None, "login": None}
+
+
+def _login() -> None:
+    global _logged_in, _login_checked
+    token = os.getenv("OPENBB_TOKEN")
+    if not token:
+        print("OPENBB_TOKEN environment variable not set; skipping OpenBB login.")
+        _login_checked = True
+        return
+    start = time.perf_counter()
+    try:
+        _obb.account.login(pat=token)
+    except Exception as exc:  # pragma: no cover - network/login error
+        print(f"Warning: OpenBB login failed: {exc}")
+        return
+    _timings["login"] = time.perf_counter() - start
+    _logged_in = _login_checked = True
+    logger.info("OpenBB login took %.2fs", _timings["login"])
 
 
 def get_openbb():
-    """Return OpenBB module ensuring login via ``OPENBB_TOKEN`` if available."""
-    global _obb, _logged_in
-    if _obb is None:
-        from openbb import obb as _module
-        _obb = _module
-    if not _logged_in:
-        token = os.getenv("OPENBB_TOKEN")
-        if token:
-            try:
-                _obb.account.login(pat=token)
-                _logged_in = True
-            except Exception as exc:  # pragma: no cover - network/login error
-                print(f"Warning: OpenBB login failed: {exc}")
-        else:
-            print("OPENBB_TOKEN environment variable not set; skipping OpenBB login.")
+    """Return OpenBB module ensuring login via ``OPENBB_TOKEN`` if available.
+
+    Safe to call from several threads: the import and login happen once and
+    concurrent callers wait for them.  A failed login is retried on the next
+    call.
+    """
+    global _obb
+    if _obb is not None and _login_checked:
+        return _obb
+    with _lock:
+        if _obb is None:
+            start = time.perf_counter()
+            from openbb import obb as _module
+
+            _obb = _module
+            _timings["import"] = time.perf_counter() - start
+            logger.info("OpenBB import took %.2fs", _timings["import"])
+        if not _login_checked:
+            _login()
     return _obb
+
+
+def _warm_up() -> None:
+    try:
+        get_openbb()
+    except Exception as exc:  # pragma: no cover - OpenBB not installed
+        logger.warning("OpenBB warm-up failed: %s", exc)
+
+
+def warm_up_openbb() -> threading.Thread:
+    """Import OpenBB and log in on a background thread.
+
+    Returns the (daemon) warm-up thread; repeated calls return the same one.
+    """
+    global _warmup
+    with _lock:
+        if _warmup is None:
+            _warmup = threading.Thread(target=_warm_up, name="openbb-warmup", daemon=True)
+            _warmup.start()
+        return _warmup
+
+
+def openbb_stats() -> Dict[str, Any]:
+    """Return whether OpenBB is loaded and logged in plus import/login seconds."""
+    return {
+        "imported": _obb is not None,
+        "logged_in": _logged_in,
+        "import_seconds": _timings["import"],
+        "login_seconds": _timings["login"],
+    }
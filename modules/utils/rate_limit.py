@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+"""Process-wide token-bucket rate limiters for external providers.
+
+Every call to yfinance, FMP, OpenBB or Directus takes a token from the bucket
+of its provider first, so all worker threads together stay below the
+configured request rate.  Rates (tokens per second) and burst sizes can be
+overridden in the ``rate_limits`` section of ``config/settings.json``::
+
+    {
+      "rate_limits": {
+        "yf": {"rate": 2, "burst": 5},
+        "fmp": {"rate": 5, "burst": 10}
+      }
+    }
+
+A ``rate`` of ``0`` disables limiting for that provider.
+
+Example::
+
+    from modules.utils.rate_limit import get_limiter
+
+    get_limiter("fmp").acquire()
+    resp = http_get(url)
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+from modules.config_utils import load_settings
+
+logger = logging.getLogger(__name__)
+
+# provider -> (tokens per second, burst size)
+DEFAULT_RATES: Dict[str, tuple[float, int]] = {
+    "yf": (4.0, 8),
+    "fmp": (5.0, 10),
+    "openbb": (4.0, 8),
+    "directus": (20.0, 40),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Parameters
+    ----------
+    rate:
+        Tokens added per second.  ``0`` means unlimited.
+    burst:
+        Maximum number of tokens that can accumulate.
+    name:
+        Label used in log messages.
+    """
+
+    def __init__(self, rate: float, burst: int | None = None, *, name: str = "") -> None:
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.name = name
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket, sleeping until they are available.
+
+        Returns
+        -------
+        float
+            Seconds spent waiting for the tokens.
+        """
+        wait = 0.0
+        with self._lock:
+            if self.rate > 0:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._updated = now
+                self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+                # Reserve the tokens now; a negative balance queues later callers
+                self._tokens -= tokens
+                if self._tokens < 0:
+                    wait = -self._tokens / self.rate
+            self._calls += 1
+            if wait > 0:
+                self._waited += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+        if wait > 0:
+            logger.debug("Rate limiter %s waited %.3fs for a token", self.name, wait)
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counts and time spent waiting for tokens."""
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "calls": self._calls,
+                "waited": self._waited,
+                "total_wait": self._total_wait,
+                "mean_wait": self._total_wait / self._calls if self._calls else 0.0,
+                "max_wait": self._max_wait,
+            }
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> TokenBucket:
+    """Return the shared :class:`TokenBucket` for ``provider``."""
+    with _lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            rate, burst = DEFAULT_RATES.get(provider, (0.0, 1))
+            conf = (load_settings().get("rate_limits") or {}).get(provider) or {}
+            rate = float(conf.get("rate", rate))
+            burst = int(conf.get("burst", burst))
+            limiter = TokenBucket(rate, burst, name=provider)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def set_default_rate(provider: str, rate: float, burst: int | None = None) -> None:
+    """Set the default rate for ``provider`` and rebuild its limiter on next use.
+
+    Values in the ``rate_limits`` settings still take precedence.
+    """
+    with _lock:
+        DEFAULT_RATES[provider] = (float(rate), int(burst if burst is not None else max(1, rate)))
+        _limiters.pop(provider, None)
+
+
+def reset_limiters() -> None:
+    """Drop all limiters so they are rebuilt from settings on next use."""
+    with _lock:
+        _limiters.clear()
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Return :meth:`TokenBucket.stats` for every limiter created so far."""
+    with _lock:
+        limiters = dict(_limiters)
+    return {name: limiter.stats() for name, limiter in limiters.items()}
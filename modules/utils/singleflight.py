@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+"""Coalesce concurrent calls for the same key into one execution.
+
+When several threads ask for the same ticker at once only the first caller
+runs the fetch; the others wait for it and receive a copy of its result (or
+its exception).  Example::
+
+    _group = SingleFlight("quotes")
+
+    def fetch(ticker):
+        return _group.do(ticker.upper(), _fetch, ticker)
+"""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+_groups: Dict[str, "SingleFlight"] = {}
+_groups_lock = threading.Lock()
+
+
+class SingleFlight:
+    """Group of in-flight calls keyed by an arbitrary hashable key.
+
+    Parameters
+    ----------
+    name:
+        Label under which statistics are reported by :func:`singleflight_stats`.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._coalesced = 0
+        with _groups_lock:
+            _groups[name] = self
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Return ``fn(*args, **kwargs)`` sharing the result with concurrent callers.
+
+        Followers receive a shallow copy of the leader's result so they can
+        modify it without affecting each other.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executed += 1
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.copy(call.result)
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return executed and coalesced call counts."""
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+def singleflight_stats() -> Dict[str, Dict[str, int]]:
+    """Return :meth:`SingleFlight.stats` for every group."""
+    with _groups_lock:
+        groups = dict(_groups)
+    return {name: group.stats() for name, group in groups.items()}
@@ -306,15 +306,33 @@ def run_sync_fields_cli() -> None:
 
 
 def run_fetch_statements_cli() -> None:
-    """Fetch and store financial statements for a ticker."""
-    from modules.data.financials import fetch_and_store_statements
+    """Fetch and store financial statements for one or more tickers.
 
-    ticker = input("Ticker symbol: ").strip().upper()
-    if not ticker:
+    Several comma-separated tickers run as a resumable job, so an interrupted
+    load continues where it stopped when started again.
+    """
+    from modules.data.financials import (
+        JOB_WORKERS,
+        fetch_and_store_statements,
+        fetch_and_store_statements_job,
+    )
+
+    raw = input("Ticker symbol(s): ").strip().upper()
+    tickers = [t.strip() for t in raw.split(",") if t.strip()]
+    if not tickers:
         print("No ticker provided.\n")
         return
-    fetch_and_store_statements(ticker)
-    print("Statements fetched and stored.\n")
+    if len(tickers) == 1:
+        fetch_and_store_statements(tickers[0])
+        print("Statements fetched and stored.\n")
+        return
+    report = fetch_and_store_statements_job(
+        tickers, max_workers=JOB_WORKERS, progress=True
+    )
+    print(f"Statements job: {report.summary()}")
+    for tk, err in report.failed.items():
+        print(f"  × {tk}: {err}")
+    print("")
 
 
 def run_compare_profile_cli() -> None:
@@ -479,6 +497,9 @@ COMMAND_MAP: dict[str, Callable[[], None]] = {
     "compare-profile": run_compare_profile_cli,
 }
 
+# Commands that may use OpenBB; its slow import starts in the background for these
+OPENBB_COMMANDS = {"menu", "portfolio", "profile", "fetch-statements", "compare-profile"}
+
 COMMAND_HELP = {
     "portfolio": "Launch portfolio manager",
     "groups": "Launch group manager",
@@ -567,6 +588,10 @@ def main() -> None:
 
         unified_fetcher.DEFAULT_USE_OPENBB = False
     cmd = args.command or "menu"
+    if not args.no_openbb and cmd in OPENBB_COMMANDS:
+        from modules.utils import warm_up_openbb
+
+        warm_up_openbb()
     if cmd == "menu":
         interactive_menu()
         return
@@ -0,0 +1,105 @@
+"""Tests for provider circuit breakers."""
+
+import pytest
+import requests
+
+import modules.data.fetching as fetching
+import modules.utils.circuit_breaker as cb
+
+
+def test_breaker_opens_and_half_opens(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cb.time, "monotonic", lambda: now[0])
+    breaker = cb.CircuitBreaker("t", failure_threshold=2, cooldown=10)
+
+    def boom():
+        raise ConnectionError("down")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(boom)
+    assert breaker.state == cb.OPEN
+    with pytest.raises(cb.CircuitOpenError):
+        breaker.call(lambda: 1)
+
+    now[0] = 11.0
+    assert breaker.state == cb.HALF_OPEN
+    assert breaker.allow()
+    # only one probe at a time
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == cb.CLOSED
+    stats = breaker.stats()
+    assert stats["opened"] == 1
+    assert stats["rejected"] == 2
+
+
+def test_only_outages_trip_the_breaker():
+    breaker = cb.CircuitBreaker("t", failure_threshold=1)
+
+    def no_data():
+        raise ValueError("no statements for ETF")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            breaker.call(no_data)
+    assert breaker.state == cb.CLOSED
+    assert breaker.stats()["failures"] == 0
+
+    with pytest.raises(ValueError):
+        breaker.call(no_data, is_failure=lambda exc: True)
+    assert breaker.state == cb.OPEN
+
+
+def test_is_outage():
+    class Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+    def http_error(status):
+        exc = requests.HTTPError("x")
+        exc.response = Response(status)
+        return exc
+
+    assert cb.is_outage(requests.ConnectionError("x"))
+    assert cb.is_outage(requests.Timeout("x"))
+    assert cb.is_outage(http_error(429))
+    assert cb.is_outage(http_error(503))
+    assert not cb.is_outage(http_error(404))
+    assert not cb.is_outage(ValueError("empty"))
+    try:
+        try:
+            raise requests.ConnectionError("reset")
+        except OSError as exc:
+            raise RuntimeError("wrapped") from exc
+    except RuntimeError as wrapped:
+        assert cb.is_outage(wrapped)
+
+
+def test_failed_probe_reopens(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cb.time, "monotonic", lambda: now[0])
+    breaker = cb.CircuitBreaker("t", failure_threshold=1, cooldown=5)
+    breaker.record_failure()
+    now[0] = 6.0
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == cb.OPEN
+
+
+def test_open_yf_circuit_skips_to_fmp(monkeypatch):
+    cb.reset_breakers()
+    calls = []
+
+    class FailingTicker:
+        def get_info(self):
+            calls.append("yf")
+            raise ConnectionError("blocked")
+
+    monkeypatch.setattr(fetching.yf, "Ticker", lambda t: FailingTicker())
+    monkeypatch.setattr(fetching, "_fetch_from_fmp", lambda t: {"Ticker": t})
+    for _ in range(cb.DEFAULT_FAILURE_THRESHOLD + 3):
+        assert fetching.fetch_basic_stock_data("AAA", use_cache=False) == {"Ticker": "AAA"}
+    assert len(calls) == cb.DEFAULT_FAILURE_THRESHOLD
+    assert cb.breaker_stats()["yf"]["state"] == cb.OPEN
+    cb.reset_breakers()
@@ -0,0 +1,28 @@
+"""Tests for multi-symbol OpenBB profile requests."""
+import pandas as pd
+import modules.data.compare as cmp
+
+
+def test_fetch_profiles_openbb_batches_and_falls_back(monkeypatch):
+    requested = []
+
+    class Profile:
+        def __init__(self, symbols):
+            self.symbols = symbols
+
+        def to_df(self):
+            rows = [{"symbol": s, "name": s.lower()} for s in self.symbols.split(",") if s != "CCC"]
+            return pd.DataFrame(rows)
+
+    class OBB:
+        class equity:
+            @staticmethod
+            def profile(symbol):
+                requested.append(symbol)
+                return Profile(symbol)
+
+    monkeypatch.setattr(cmp, "get_openbb", lambda: OBB)
+    result = cmp.fetch_profiles_openbb(["aaa", "BBB", "CCC"], chunk_size=3)
+    assert requested == ["AAA,BBB,CCC", "CCC"]
+    assert result["BBB"].loc[0, "name"] == "bbb"
+    assert result["CCC"].empty
@@ -0,0 +1,109 @@
+"""Tests for adaptive concurrency limits and timeouts."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+import modules.data.fetching as fetching
+import modules.utils.concurrency as conc
+import modules.utils.latency as latency
+from modules.utils.concurrency import AdaptiveConcurrency, is_throttled
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    ctl = AdaptiveConcurrency("t", initial=4, minimum=1, maximum=8)
+    for _ in range(20):
+        ctl.record(0.1)
+    assert ctl.limit > 4
+    before = ctl.limit
+    ctl.record(0.1, ok=False, throttled=True)
+    assert ctl.limit == max(1, int(before * 0.5))
+    # a second failure in the same round does not cut again
+    ctl.record(0.1, ok=False)
+    assert ctl.limit == max(1, int(before * 0.5))
+    assert ctl.stats()["throttled"] == 1
+
+
+def test_slow_calls_count_as_congestion():
+    ctl = AdaptiveConcurrency("t", initial=8, maximum=8, latency_factor=3)
+    for _ in range(10):
+        ctl.record(0.1)
+    ctl.record(1.0)
+    assert ctl.limit == 4
+    assert ctl.stats()["slow"] == 1
+
+
+def test_slot_blocks_at_limit():
+    ctl = AdaptiveConcurrency("t", initial=2, maximum=2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with ctl.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+
+
+def test_is_throttled():
+    resp = requests.Response()
+    resp.status_code = 429
+    assert is_throttled(requests.HTTPError(response=resp))
+    assert is_throttled(RuntimeError("Too Many Requests. Rate limited."))
+    assert not is_throttled(ValueError("bad ticker"))
+
+
+def test_batch_auto_workers(monkeypatch):
+    conc.reset_concurrency()
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: {"Ticker": t, "Name": t})
+    df = fetching.fetch_basic_stock_data_batch(
+        ["AAA", "BBB", "CCC"], max_workers="auto", fallback=False
+    )
+    assert list(df["Ticker"]) == ["AAA", "BBB", "CCC"]
+    assert "yf" in conc.concurrency_stats()
+    conc.reset_concurrency()
+
+
+def test_adaptive_timeout(monkeypatch):
+    latency.reset_trackers()
+    settings = {"adaptive_timeouts": {"enabled": True, "min_samples": 3, "minimum": 1}}
+    monkeypatch.setattr(latency, "load_settings", lambda: settings)
+    assert latency.adaptive_timeout("svc", 10) == 10
+    for value in (0.5, 0.6, 0.7):
+        latency.get_tracker("svc").record(value)
+    assert latency.adaptive_timeout("svc", 10) == pytest.approx(2.1)
+    latency.get_tracker("svc").record(9.0)
+    assert latency.adaptive_timeout("svc", 10) == 10
+    settings["adaptive_timeouts"]["enabled"] = False
+    assert latency.adaptive_timeout("svc", 10) == 10
+    latency.reset_trackers()
+
+
+def test_observe_records_timeouts_as_latency():
+    latency.reset_trackers()
+    conc.reset_concurrency()
+    assert conc.is_timeout(requests.ReadTimeout("slow"))
+    assert conc.is_timeout(TimeoutError())
+    assert not conc.is_timeout(requests.ConnectionError("refused"))
+    with pytest.raises(requests.ReadTimeout):
+        with conc.observe("svc", timeout=2.0):
+            raise requests.ReadTimeout("slow")
+    with pytest.raises(requests.ConnectionError):
+        with conc.observe("svc", timeout=2.0):
+            raise requests.ConnectionError("refused")
+    assert latency.get_tracker("svc").percentile(100) == 2.0
+    assert len(latency.get_tracker("svc")) == 1
+    latency.reset_trackers()
+    conc.reset_concurrency()
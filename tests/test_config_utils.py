@@ -19,6 +19,26 @@ def test_load_settings_with_file(tmp_path, monkeypatch):
     assert result == data
 
 
+def test_load_settings_is_cached_until_the_file_changes(tmp_path, monkeypatch):
+    fake_path = tmp_path / "settings.json"
+    fake_path.write_text(json.dumps({"foo": {"a": 1}}))
+    monkeypatch.setattr(config_utils, "SETTINGS_PATH", fake_path)
+    reads = []
+    real_load = json.load
+    monkeypatch.setattr(config_utils.json, "load", lambda f: reads.append(1) or real_load(f))
+
+    first = config_utils.load_settings()
+    first["foo"]["a"] = 2  # callers get their own copy
+    assert config_utils.load_settings() == {"foo": {"a": 1}}
+    assert len(reads) == 1
+
+    config_utils.save_settings({"foo": {"a": 3}})
+    assert config_utils.load_settings() == {"foo": {"a": 3}}
+    fake_path.write_text(json.dumps({"foo": {"a": 40}}))
+    assert config_utils.load_settings() == {"foo": {"a": 40}}
+    assert len(reads) == 3
+
+
 def test_save_settings(tmp_path, monkeypatch):
     fake_path = tmp_path / "settings.json"
     monkeypatch.setattr(config_utils, "SETTINGS_PATH", fake_path)
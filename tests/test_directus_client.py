@@ -161,3 +161,43 @@ def test_insert_items_auto_creates(monkeypatch):
     res = dc.insert_items("col", [{"x": 1}])
     assert "called" in called
     assert res == {"id": 1}
+
+
+def test_fetch_items_query(monkeypatch):
+    monkeypatch.setattr(dc, "DIRECTUS_URL", "http://api")
+    captured = {}
+
+    def fake_request(method, path, **kw):
+        captured["params"] = kw.get("params")
+        return {"data": [{"id": 1}]}
+
+    monkeypatch.setattr(dc, "directus_request", fake_request)
+    items = dc.fetch_items_query("col", filter={"ticker": {"_eq": "A"}}, fields=["id", "row_hash"])
+    assert items == [{"id": 1}]
+    assert captured["params"] == {
+        "limit": -1,
+        "filter": '{"ticker": {"_eq": "A"}}',
+        "fields": "id,row_hash",
+    }
+
+    monkeypatch.setattr(dc, "directus_request", lambda *a, **k: {"data": []})
+    assert dc.fetch_items_query("col") == []
+    monkeypatch.setattr(dc, "directus_request", lambda *a, **k: None)
+    assert dc.fetch_items_query("col") is None
+
+
+def test_update_items(monkeypatch):
+    monkeypatch.setattr(dc, "DIRECTUS_URL", "http://api")
+    called = {}
+
+    def fake_request(method, path, **kw):
+        called.update(method=method, path=path, payload=kw.get("json"))
+        return {"data": kw.get("json")}
+
+    monkeypatch.setattr(dc, "directus_request", fake_request)
+    res = dc.update_items("col", [{"id": 1, "x": float("nan")}, {"id": 2, "x": "1K"}])
+    assert called["method"] == "PATCH"
+    assert called["path"] == "items/col"
+    assert called["payload"] == [{"id": 1, "x": None}, {"id": 2, "x": 1000.0}]
+    assert res == called["payload"]
+    assert dc.update_items("col", []) == []
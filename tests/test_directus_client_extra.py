@@ -32,3 +32,15 @@ def test_clean_record_nan_inf():
     assert cleaned["b"] is None
     assert cleaned["c"] is None
     assert cleaned["d"] is None
+
+
+def test_clean_records_batch():
+    records = [{"a": "1K", "b": float("nan")}, {"a": 2, "c": "x"}]
+    assert dc.clean_records(records) == [{"a": 1000.0, "b": None}, {"a": 2, "c": "x"}]
+
+
+def test_writes_keep_default_timeout(monkeypatch):
+    monkeypatch.setattr(dc, "adaptive_timeout", lambda name, default: 2.0)
+    assert dc._timeout("GET") == ("directus", 2.0)
+    assert dc._timeout("post") == ("directus_write", dc.DEFAULT_TIMEOUT)
+    assert dc._timeout("PATCH") == ("directus_write", dc.DEFAULT_TIMEOUT)
@@ -0,0 +1,269 @@
+"""Tests for the disk-backed fetch cache."""
+
+import pandas as pd
+import pytest
+import requests
+
+import modules.data.fetching as fetching
+from modules.data.fetch_cache import FetchCache
+
+
+ROW = {
+    "Ticker": "AAA",
+    "Name": "Alpha",
+    "Sector": "Tech",
+    "Industry": "Software",
+    "Current Price": 1.0,
+    "Market Cap": 10,
+    "PE Ratio": pd.NA,
+    "Dividend Yield": 0.01,
+}
+
+
+def test_roundtrip_and_stats(tmp_path):
+    cache = FetchCache(tmp_path / "c.sqlite", ttl={"yf": 60})
+    assert cache.lookup(["yf"], "AAA") is None
+    cache.set("yf", "aaa", ROW)
+    hit = cache.lookup(["yf"], "AAA")
+    assert hit["Name"] == "Alpha"
+    assert hit["PE Ratio"] is pd.NA
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_expired_row_is_a_miss(tmp_path):
+    cache = FetchCache(tmp_path / "c.sqlite", ttl={"yf": 0})
+    cache.set("yf", "AAA", ROW)
+    assert cache.lookup(["yf"], "AAA") is None
+
+
+def test_stale_while_revalidate(tmp_path):
+    cache = FetchCache(
+        tmp_path / "c.sqlite", ttl={"yf": 0}, stale_while_revalidate=True
+    )
+    cache.set("yf", "AAA", ROW)
+    calls = []
+
+    def refresh(ticker):
+        calls.append(ticker)
+        return ROW | {"Current Price": 2.0}
+
+    served = cache.lookup(["yf"], "AAA", refresh={"yf": refresh})
+    assert served["Current Price"] == 1.0
+    cache.wait_for_refreshes()
+    assert calls == ["AAA"]
+    assert cache.get("yf", "AAA").data["Current Price"] == 2.0
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_fetch_basic_stock_data_uses_cache(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite", ttl={"yf": 60})
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    calls = []
+
+    def fake_yf(ticker):
+        calls.append(ticker)
+        return dict(ROW)
+
+    monkeypatch.setattr(fetching, "_fetch_from_yf", fake_yf)
+    fetching.fetch_basic_stock_data("AAA", use_cache=True)
+    fetching.fetch_basic_stock_data("AAA", use_cache=True)
+    assert calls == ["AAA"]
+
+
+def test_failure_backoff_doubles(tmp_path):
+    cache = FetchCache(tmp_path / "c.sqlite", negative_ttl=10, negative_max_ttl=25)
+    first = cache.record_failure("auto", "bad", "no data")
+    assert first.failures == 1
+    assert 9 < first.retry_in <= 10
+    second = cache.record_failure("auto", "BAD", "no data")
+    assert 19 < second.retry_in <= 20
+    third = cache.record_failure("auto", "BAD", "no data")
+    assert third.retry_in <= 25
+    assert cache.get_failure("auto", "bad").blocked
+    cache.clear_failure("auto", "bad")
+    assert cache.get_failure("auto", "bad") is None
+
+
+def test_negative_cache_skips_and_force_retries(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    calls = []
+
+    def failing_yf(ticker):
+        calls.append(ticker)
+        return None
+
+    monkeypatch.setattr(fetching, "_fetch_from_yf", failing_yf)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            fetching.fetch_basic_stock_data("BAD", provider="yf", use_cache=True)
+    assert calls == ["BAD"]
+    assert cache.stats()["negative_hits"] == 1
+
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: dict(ROW))
+    row = fetching.fetch_basic_stock_data("BAD", provider="yf", use_cache=True, force=True)
+    assert row["Name"] == "Alpha"
+    assert cache.get_failure("yf", "BAD") is None
+
+
+def test_outage_is_not_negative_cached(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    calls = []
+
+    def down_yf(ticker):
+        calls.append(ticker)
+        raise requests.ConnectionError("connection refused")
+
+    def open_fmp(ticker):
+        raise fetching.CircuitOpenError("fmp circuit open")
+
+    monkeypatch.setattr(fetching, "_fetch_from_yf", down_yf)
+    monkeypatch.setattr(fetching, "_fetch_from_fmp", open_fmp)
+    for _ in range(2):
+        with pytest.raises(fetching.ProviderUnavailableError):
+            fetching.fetch_basic_stock_data("AAA", use_cache=True, hedge=False)
+    assert calls == ["AAA", "AAA"]
+    assert cache.get_failure("auto", "AAA") is None
+
+    monkeypatch.setattr(fetching, "_fetch_many_from_fmp", lambda t: open_fmp(t))
+    with pytest.raises(fetching.ProviderUnavailableError):
+        fetching.fetch_basic_stock_data_batch(["BBB"], use_cache=True)
+    assert cache.get_failure("auto", "BBB") is None
+
+
+def test_batch_fallback_skips_known_bad(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: None)
+    fmp_calls = []
+    monkeypatch.setattr(
+        fetching, "_fetch_many_from_fmp", lambda tickers: fmp_calls.append(list(tickers)) or {}
+    )
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            fetching.fetch_basic_stock_data_batch(["BAD"], use_cache=True)
+    assert fmp_calls == [["BAD"]]
+    assert cache.get_failure("auto", "BAD").blocked
+    assert cache.stats()["negative_hits"] == 1
+
+
+def test_refresh_quotes_uses_cheapest_path(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    monkeypatch.setattr(fetching, "resolve_term", lambda x: x)
+    cache.set("yf", "AAA", ROW)  # fresh static + volatile
+    cache.set("yf", "BBB", ROW | {"Ticker": "BBB", "Name": "Beta"})
+    quoted = []
+
+    def fake_quote_many(symbols):
+        quoted.extend(symbols)
+        return {s: {"symbol": s, "regularMarketPrice": 9.0} for s in symbols}
+
+    monkeypatch.setattr(fetching, "_yf_quote_many", fake_quote_many)
+    full = []
+    monkeypatch.setattr(
+        fetching,
+        "_fetch_from_yf",
+        lambda t: full.append(t) or ROW | {"Ticker": t, "Name": "Gamma"},
+    )
+
+    # prices of AAA/BBB expire immediately, static fields stay fresh
+    df = fetching.refresh_quotes(
+        ["AAA", "BBB", "CCC"], ttls={f: 0 for f in fetching.VOLATILE_FIELDS}
+    )
+    assert quoted == ["AAA", "BBB"]
+    assert full == ["CCC"]
+    assert list(df["Name"]) == ["Alpha", "Beta", "Gamma"]
+    assert df.loc[0, "Current Price"] == 9.0
+
+    # with the default TTLs the just-fetched quotes are served from cache
+    quoted.clear()
+    fetching.refresh_quotes(["AAA", "BBB"])
+    assert quoted == []
+
+
+def test_field_store_records_source_and_age(tmp_path):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    cache.set("yf", "AAA", ROW)
+    cache.set("yf_quote", "AAA", ROW | {"Current Price": 2.0}, fields=["Current Price"])
+    fields = cache.get_fields("aaa")
+    assert fields["Name"].source == "yf"
+    assert fields["Current Price"].source == "yf_quote"
+    assert fields["Current Price"].value == 2.0
+    assert fields["PE Ratio"].value is pd.NA
+    assert fields["Name"].age >= 0
+
+
+def test_plan_refresh_splits_by_stale_fields(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    cache.set("yf", "AAA", ROW)
+    cache.set("yf", "BBB", ROW | {"Ticker": "BBB"})
+    cache.set_fields("BBB", {"Current Price": 1.0}, "yf")
+
+    plan = fetching.plan_refresh(["AAA", "BBB", "CCC"])
+    assert plan.fresh == ["AAA", "BBB"]
+    assert plan.full == ["CCC"]
+
+    plan = fetching.plan_refresh(["AAA", "CCC"], ttls={"Current Price": 0})
+    assert plan.quote == ["AAA"]
+    assert plan.stale["AAA"] == ["Current Price"]
+    assert plan.summary() == {"fresh": 0, "quote": 1, "full": 1}
+
+
+def test_batch_delta_only_refetches_stale(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    cache.set("yf", "AAA", ROW)
+    calls = []
+    monkeypatch.setattr(fetching, "_yf_quote_many", lambda s: calls.append(s) or {})
+    monkeypatch.setattr(
+        fetching, "_fetch_from_yf", lambda t: calls.append(t) or ROW | {"Ticker": t}
+    )
+    df = fetching.fetch_basic_stock_data_batch(["AAA", "BBB"], delta=True)
+    assert list(df["Ticker"]) == ["AAA", "BBB"]
+    assert calls == ["BBB"]
+    assert cache.get_fields("BBB")["Name"].source == "yf"
+
+
+def test_batch_delta_honours_provider(tmp_path, monkeypatch):
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    cache.set("yf", "AAA", ROW)
+    monkeypatch.setattr(
+        fetching, "_yf_quote_many", lambda s: pytest.fail("yfinance quote requested")
+    )
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: pytest.fail("yfinance called"))
+    calls = []
+    monkeypatch.setattr(
+        fetching, "_fetch_from_fmp", lambda t: calls.append(t) or ROW | {"Ticker": t}
+    )
+    df = fetching.fetch_basic_stock_data_batch(
+        ["AAA", "BBB"], delta=True, provider="fmp", fallback=False
+    )
+    assert list(df["Ticker"]) == ["AAA", "BBB"]
+    assert calls == ["BBB"]
+
+    # expired prices take the FMP profile path instead of yfinance quotes
+    fetching.refresh_quotes(["AAA"], ttls={"Current Price": 0}, provider="fmp")
+    assert calls == ["BBB", "AAA"]
+
+    with pytest.raises(ValueError):
+        fetching.fetch_basic_stock_data_batch(["AAA"], delta=True, use_cache=False)
+
+
+def test_company_data_delta_serves_field_store(tmp_path, monkeypatch):
+    import modules.data.unified_fetcher as uf
+
+    cache = FetchCache(tmp_path / "c.sqlite")
+    monkeypatch.setattr(fetching, "get_cache", lambda: cache)
+    monkeypatch.setattr(uf, "get_cache", lambda: cache)
+    monkeypatch.setattr(uf, "cache_enabled", lambda: True)
+    monkeypatch.setattr(uf, "_from_openbb", lambda t: pytest.fail("unexpected fetch"))
+    cache.set("yf", "AAA", ROW)
+    data = uf.fetch_company_data("AAA", delta=True)
+    assert data["Name"] == "Alpha"
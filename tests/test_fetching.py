@@ -1,6 +1,7 @@
 """Tests for stock data fetching functions."""
 from unittest.mock import MagicMock, patch
 
+from modules.data.fetch_cache import FetchCache
 from modules.data.fetching import fetch_basic_stock_data, fetch_basic_stock_data_batch
 
 
@@ -66,7 +67,7 @@ def test_fetch_basic_stock_data_fmp_fallback():
     ]
 
     with patch("modules.data.fetching.yf.Ticker") as mock_ticker_cls, patch(
-        "modules.data.fetching.requests.get"
+        "modules.data.fetching.http_get"
     ) as mock_get, patch("modules.data.fetching.resolve_term", side_effect=lambda x: x):
         mock_ticker = MagicMock()
         mock_ticker.get_info.return_value = {}
@@ -129,7 +130,7 @@ def test_fetch_basic_stock_data_provider_fmp(monkeypatch):
         }
     ]
     mock_resp.raise_for_status.return_value = None
-    monkeypatch.setattr("modules.data.fetching.requests.get", lambda *a, **k: mock_resp)
+    monkeypatch.setattr("modules.data.fetching.http_get", lambda *a, **k: mock_resp)
     monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
 
     result = fetch_basic_stock_data("ACME", provider="fmp")
@@ -157,7 +158,7 @@ def test_fetch_from_fmp_uses_timeout(monkeypatch):
         called.update(kwargs)
         return mock_resp
 
-    monkeypatch.setattr("modules.data.fetching.requests.get", fake_get)
+    monkeypatch.setattr("modules.data.fetching.http_get", fake_get)
     monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
 
     fetch_basic_stock_data("ACME", provider="fmp")
@@ -254,3 +255,156 @@ def test_fetch_basic_stock_data_batch_dedup(monkeypatch):
 
     df = fetch_basic_stock_data_batch(["AAA", "AAA"], dedup=True)
     assert len(df) == 1
+
+
+def test_fetch_basic_stock_data_batch_bulk(tmp_path, monkeypatch):
+    # AAA has expired prices but cached static fields; the quote endpoint
+    # has no sector or industry
+    cache = FetchCache(tmp_path / "c.sqlite", ttl={"yf": 0})
+    cache.set(
+        "yf",
+        "AAA",
+        {"Ticker": "AAA", "Name": "Alpha", "Sector": "Tech", "Industry": "Software"},
+    )
+    quotes = {
+        "AAA": {
+            "symbol": "AAA",
+            "longName": "Alpha",
+            "regularMarketPrice": 1.0,
+            "marketCap": 10,
+            "trailingPE": 5.0,
+            "dividendYield": 0.01,
+        },
+        "BBB": {"symbol": "BBB", "longName": "Beta", "regularMarketPrice": 2.0},
+    }
+    chunks = []
+
+    def fake_quote_many(symbols):
+        chunks.append(list(symbols))
+        return {s: quotes[s] for s in symbols if s in quotes}
+
+    info_calls = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def get_info(self):
+            info_calls.append(self.symbol)
+            return {"longName": "Beta", "sector": "Health", "industry": "Biotech"}
+
+    monkeypatch.setattr("modules.data.fetching.get_cache", lambda: cache)
+    monkeypatch.setattr("modules.data.fetching._yf_quote_many", fake_quote_many)
+    monkeypatch.setattr("modules.data.fetching.yf.Ticker", lambda s: FakeTicker(s))
+    monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
+
+    df = fetch_basic_stock_data_batch(
+        ["AAA", "BBB", "CCC"], bulk=True, chunk_size=2, use_cache=True
+    )
+    # only the warm ticker is quoted, the cold ones take one get_info each
+    assert chunks == [["AAA"]]
+    assert info_calls == ["BBB", "CCC"]
+    assert list(df["Ticker"]) == ["AAA", "BBB", "CCC"]
+    assert df.loc[0, "Current Price"] == 1.0
+    assert df.loc[0, "Sector"] == "Tech"
+    assert df.loc[1, "Sector"] == "Health"
+
+
+def test_fetch_basic_stock_data_batch_bulk_without_cache(monkeypatch):
+    chunks = []
+    info_calls = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def get_info(self):
+            info_calls.append(self.symbol)
+            return {"longName": "Beta", "sector": "Health", "industry": "Biotech"}
+
+    monkeypatch.setattr(
+        "modules.data.fetching._yf_quote_many", lambda s: chunks.append(list(s)) or {}
+    )
+    monkeypatch.setattr("modules.data.fetching.yf.Ticker", lambda s: FakeTicker(s))
+    monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
+
+    fetch_basic_stock_data_batch(["AAA", "BBB"], bulk=True, use_cache=False)
+    assert chunks == []
+    assert info_calls == ["AAA", "BBB"]
+
+
+def test_fetch_basic_stock_data_batch_fmp_grouped(monkeypatch):
+    urls = []
+
+    def fake_get(url, **kwargs):
+        urls.append(url)
+        symbols = url.rsplit("/", 1)[-1].split("?")[0].split(",")
+        resp = MagicMock()
+        resp.raise_for_status.return_value = None
+        resp.json.return_value = [
+            {"symbol": s, "companyName": s.lower(), "price": 1.0} for s in symbols
+        ]
+        return resp
+
+    monkeypatch.setattr("modules.data.fetching.http_get", fake_get)
+    monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+
+    df = fetch_basic_stock_data_batch(
+        ["AAA", "BBB", "CCC"], provider="fmp", fmp_batch_size=2, use_cache=False
+    )
+    assert len(urls) == 2
+    assert urls[0].endswith("/AAA,BBB")
+    assert list(df["Name"]) == ["aaa", "bbb", "ccc"]
+
+
+def test_fetch_basic_stock_data_batch_auto_groups_fallback(monkeypatch):
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def get_info(self):
+            if self.symbol == "AAA":
+                return {"longName": "Alpha", "sector": "Tech", "industry": "Software"}
+            return {}
+
+    urls = []
+
+    def fake_get(url, **kwargs):
+        urls.append(url)
+        resp = MagicMock()
+        resp.raise_for_status.return_value = None
+        resp.json.return_value = [
+            {"symbol": "BBB", "companyName": "Beta"},
+            {"symbol": "CCC", "companyName": "Gamma"},
+        ]
+        return resp
+
+    monkeypatch.setattr("modules.data.fetching.yf.Ticker", lambda s: FakeTicker(s))
+    monkeypatch.setattr("modules.data.fetching.http_get", fake_get)
+    monkeypatch.setattr("modules.data.fetching.resolve_term", lambda x: x)
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+
+    df = fetch_basic_stock_data_batch(["AAA", "BBB", "CCC"], use_cache=False)
+    assert len(urls) == 1
+    assert list(df["Name"]) == ["Alpha", "Beta", "Gamma"]
+
+
+def test_iter_basic_stock_data_reports_errors(monkeypatch):
+    def fake_fetch(tk, **kwargs):
+        if tk == "BAD":
+            raise ValueError("no data")
+        return {"Ticker": tk, "Name": tk.lower()}
+
+    monkeypatch.setattr("modules.data.fetching.fetch_basic_stock_data", fake_fetch)
+    from modules.data.fetching import fetch_basic_stock_data_frames, iter_basic_stock_data
+
+    results = {r.ticker: r for r in iter_basic_stock_data(["AAA", "BAD"], max_workers=2)}
+    assert results["AAA"].row["Name"] == "aaa"
+    assert isinstance(results["BAD"].error, ValueError)
+    assert results["BAD"].elapsed >= 0
+
+    df, errors = fetch_basic_stock_data_frames(["BBB", "BAD", "AAA"], max_workers=2)
+    assert list(df["Ticker"]) == ["BBB", "AAA"]
+    assert list(errors["Ticker"]) == ["BAD"]
+    assert errors.loc[0, "Error"] == "no data"
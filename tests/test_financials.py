@@ -1,3 +1,7 @@
+import threading
+import time
+from types import SimpleNamespace
+
 import pandas as pd
 import modules.data.financials as fin
 
@@ -41,6 +45,33 @@ def test_store_statements(monkeypatch):
     assert captured["income_statement"][0]["period"] == "2024"
 
 
+def test_store_statements_fills_each_collection_serially(monkeypatch):
+    active = {}
+    overlaps = []
+    calls = []
+    lock = threading.Lock()
+
+    def fake_insert(col, rec):
+        with lock:
+            if active.get(col):
+                overlaps.append(col)
+            active[col] = True
+            calls.append(col)
+        time.sleep(0.02)
+        with lock:
+            active[col] = False
+
+    monkeypatch.setattr(fin, "prepare_records", lambda c, r: r)
+    monkeypatch.setattr(fin, "insert_items", fake_insert)
+    frame = pd.DataFrame({"A": [1]}, index=["2024"])
+    data = {
+        stmt: {"annual": frame, "quarter": frame} for stmt in ("income", "balance", "cash")
+    }
+    fin.store_statements(data)
+    assert len(calls) == 6
+    assert overlaps == []
+
+
 def test_fetch_and_store_statements(monkeypatch):
     df = pd.DataFrame({"A": [1]}, index=["2024"])
     obb = DummyOBB(df)
@@ -51,3 +82,152 @@ def test_fetch_and_store_statements(monkeypatch):
     fin.fetch_and_store_statements("ZZZ", statements=["income"])
     assert inserted["income_statement"][0]["A"] == 1
 
+
+def test_fetch_and_store_statements_job(monkeypatch, tmp_path):
+    stored = []
+
+    def fake_store(ticker, statements=None):
+        stored.append(ticker)
+        rows = 0 if ticker == "BAD" else 2
+        return {"income": {"annual": pd.DataFrame({"A": range(rows)})}}
+
+    monkeypatch.setattr(fin, "fetch_and_store_statements", fake_store)
+    report = fin.fetch_and_store_statements_job(["AAA", "BAD"], journal_dir=tmp_path)
+    assert report.results["AAA"] == {"income": {"annual": 2}}
+    assert "BAD" in report.failed
+    fin.fetch_and_store_statements_job(["AAA", "BAD"], journal_dir=tmp_path)
+    assert stored == ["AAA", "BAD", "BAD"]
+
+
+def test_fetch_statements_batch_concurrent(monkeypatch):
+    df = pd.DataFrame({"A": [1]}, index=["2024"])
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fn(symbol, period):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return Dummy(df.assign(A=[symbol]))
+
+    obb = DummyOBB(df)
+    obb.equity.fundamental.income = fn
+    obb.equity.fundamental.balance = fn
+    monkeypatch.setattr(fin, "get_openbb", lambda: obb)
+    monkeypatch.setattr(fin, "get_limiter", lambda name: SimpleNamespace(acquire=lambda: None))
+    result = fin.fetch_statements_batch(["AAA", "BBB"], ["income", "balance"])
+    assert list(result) == ["AAA", "BBB"]
+    assert list(result["BBB"]["balance"]) == ["annual", "quarter"]
+    assert result["BBB"]["balance"]["quarter"].iloc[0, 0] == "BBB"
+    assert max(peak) > 1
+
+
+def test_store_statements_parallel(monkeypatch):
+    threads = set()
+    monkeypatch.setattr(fin, "prepare_records", lambda c, r: r)
+
+    def insert(col, rec):
+        threads.add(threading.current_thread().name)
+        return rec
+
+    monkeypatch.setattr(fin, "insert_items", insert)
+    frame = pd.DataFrame({"A": [1]}, index=["2024"])
+    data = {
+        stmt: {"annual": frame, "quarter": frame} for stmt in fin.DEFAULT_STATEMENTS
+    }
+    fin.store_statements(data)
+    assert threading.main_thread().name not in threads
+    assert threads
+
+
+class FakeDirectus:
+    """In-memory stand-in for the Directus calls made by the upsert path."""
+
+    def __init__(self):
+        self.rows = {}
+        self.inserted = []
+        self.updated = []
+
+    def query(self, collection, *, filter, fields):
+        ticker = filter["ticker"]["_eq"]
+        period = filter["period_type"]["_eq"]
+        return [
+            {k: row[k] for k in fields}
+            for row in self.rows.values()
+            if row["ticker"] == ticker and row["period_type"] == period
+        ]
+
+    def insert(self, collection, items):
+        self.inserted.append(len(items))
+        for item in items:
+            item_id = len(self.rows) + 1
+            self.rows[item_id] = {**item, "id": item_id}
+
+    def update(self, collection, items):
+        self.updated.append(len(items))
+        for item in items:
+            self.rows[item["id"]].update(item)
+
+
+def test_upsert_statements_idempotent(monkeypatch):
+    fake = FakeDirectus()
+    monkeypatch.setattr(fin, "prepare_records", lambda c, r: r)
+    monkeypatch.setattr(fin, "_ensure_upsert_fields", lambda c: None)
+    monkeypatch.setattr(fin, "fetch_items_query", fake.query)
+    monkeypatch.setattr(fin, "insert_items", fake.insert)
+    monkeypatch.setattr(fin, "update_items", fake.update)
+    index = pd.to_datetime(["2023-12-31", "2024-12-31"])
+    frame = pd.DataFrame({"A": [1.0, 2.0]}, index=index)
+    data = {"income": {"annual": frame, "quarter": pd.DataFrame()}}
+
+    first = fin.upsert_statements("aaa", data)
+    assert first["income"]["annual"] == (2, 0, 0)
+    assert {r["fiscal_date"] for r in fake.rows.values()} == {"2023-12-31", "2024-12-31"}
+    assert all(r["ticker"] == "AAA" for r in fake.rows.values())
+
+    assert fin.upsert_statements("AAA", data)["income"]["annual"] == (0, 0, 2)
+
+    changed = pd.DataFrame({"A": [1.0, 5.0, 7.0]}, index=index.append(pd.to_datetime(["2025-12-31"])))
+    result = fin.upsert_statements("AAA", {"income": {"annual": changed}})
+    assert result["income"]["annual"].summary() == {"inserted": 1, "updated": 1, "unchanged": 1}
+    assert fake.inserted == [2, 1]
+    assert fake.updated == [1]
+    assert len(fake.rows) == 3
+    assert sorted(r["A"] for r in fake.rows.values()) == [1.0, 5.0, 7.0]
+
+    report = fin.upsert_report(result)
+    assert report.to_dict("records") == [
+        {"statement": "income", "period": "annual", "inserted": 1, "updated": 1, "unchanged": 1}
+    ]
+
+
+def test_upsert_skips_when_stored_rows_cannot_be_read(monkeypatch):
+    fake = FakeDirectus()
+    monkeypatch.setattr(fin, "prepare_records", lambda c, r: r)
+    monkeypatch.setattr(fin, "_ensure_upsert_fields", lambda c: None)
+    monkeypatch.setattr(fin, "fetch_items_query", lambda *a, **k: None)
+    monkeypatch.setattr(fin, "insert_items", fake.insert)
+    monkeypatch.setattr(fin, "update_items", fake.update)
+    frame = pd.DataFrame({"A": [1.0]}, index=pd.to_datetime(["2024-12-31"]))
+
+    result = fin.upsert_statements("AAA", {"income": {"annual": frame}})
+    assert result == {"income": {}}
+    assert fake.inserted == [] and fake.updated == []
+    assert fin.upsert_report(result).empty
+
+
+def test_fetch_and_store_statements_upsert(monkeypatch):
+    df = pd.DataFrame({"A": [1]}, index=["2024"])
+    monkeypatch.setattr(fin, "get_openbb", lambda: DummyOBB(df))
+    calls = []
+    monkeypatch.setattr(fin, "upsert_statements", lambda t, data: calls.append(t))
+    monkeypatch.setattr(fin, "store_statements", lambda data: calls.append("insert"))
+    fin.fetch_and_store_statements("ZZZ", statements=["income"], upsert=True)
+    monkeypatch.setattr(fin, "load_settings", lambda: {"financials": {"upsert": True}})
+    fin.fetch_and_store_statements("ZZZ", statements=["income"])
+    fin.fetch_and_store_statements("ZZZ", statements=["income"], upsert=False)
+    assert calls == ["ZZZ", "ZZZ", "insert"]
@@ -0,0 +1,47 @@
+"""Tests for hedged yfinance/FMP lookups and latency tracking."""
+
+import threading
+
+import modules.data.fetching as fetching
+from modules.utils.latency import LatencyTracker
+
+
+def test_latency_percentiles():
+    tracker = LatencyTracker("t")
+    assert tracker.percentile(95) is None
+    for ms in range(1, 101):
+        tracker.record(ms / 1000)
+    assert tracker.percentile(50) == 0.05
+    assert tracker.percentile(95) == 0.095
+    assert tracker.stats()["count"] == 100
+
+
+def test_slow_primary_is_hedged(monkeypatch):
+    release = threading.Event()
+
+    def slow_yf(ticker):
+        release.wait(2)
+        return {"Ticker": ticker, "Name": "from yf"}
+
+    monkeypatch.setattr(fetching, "_fetch_from_yf", slow_yf)
+    monkeypatch.setattr(fetching, "_fetch_from_fmp", lambda t: {"Ticker": t, "Name": "from fmp"})
+    monkeypatch.setattr(fetching, "_hedge_delay", lambda: 0.01)
+    before = fetching.hedge_stats()
+
+    row = fetching.fetch_basic_stock_data("AAA", use_cache=False, hedge=True)
+    release.set()
+    assert row["Name"] == "from fmp"
+    after = fetching.hedge_stats()
+    assert after["hedged"] == before["hedged"] + 1
+    assert after["secondary_wins"] == before["secondary_wins"] + 1
+
+
+def test_fast_primary_is_not_hedged(monkeypatch):
+    calls = []
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: {"Ticker": t, "Name": "yf"})
+    monkeypatch.setattr(fetching, "_fetch_from_fmp", lambda t: calls.append(t))
+    monkeypatch.setattr(fetching, "_hedge_delay", lambda: 1.0)
+
+    row = fetching.fetch_basic_stock_data("BBB", use_cache=False, hedge=True)
+    assert row["Name"] == "yf"
+    assert calls == []
@@ -0,0 +1,64 @@
+"""Tests for the shared HTTP session helpers."""
+
+import json
+
+import modules.config_utils as config_utils
+import modules.utils.http_utils as hu
+
+
+def test_session_is_shared(monkeypatch, tmp_path):
+    monkeypatch.setattr(config_utils, "SETTINGS_PATH", tmp_path / "settings.json")
+    hu.reset_session()
+    assert hu.get_session() is hu.get_session()
+    hu.reset_session()
+
+
+def test_session_uses_settings(monkeypatch, tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(
+        json.dumps({"http": {"retries": 5, "pool_sizes": {"api.example.com": 25}}})
+    )
+    monkeypatch.setattr(config_utils, "SETTINGS_PATH", path)
+    hu.reset_session()
+    session = hu.get_session()
+
+    adapter = session.get_adapter("https://api.example.com/v1/items")
+    assert adapter._pool_maxsize == 25
+    retry = adapter.max_retries
+    assert retry.total == 5
+    assert retry.respect_retry_after_header
+    assert 429 in retry.status_forcelist
+    assert "POST" not in retry.allowed_methods
+
+    default = session.get_adapter("https://other.example.com/")
+    assert default._pool_maxsize == hu.DEFAULT_POOL_SIZE
+    hu.reset_session()
+
+
+def test_retry_after_is_capped():
+    from urllib3 import HTTPResponse
+
+    retry = hu._retry({"max_retry_after": 2})
+    long_wait = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+    short_wait = HTTPResponse(status=429, headers={"Retry-After": "1"})
+    assert retry.get_retry_after(long_wait) == 2
+    assert retry.get_retry_after(short_wait) == 1
+    assert retry.get_retry_after(HTTPResponse(status=503)) is None
+
+    # The limit survives the copies urllib3 makes after every attempt
+    after = retry.increment("GET", "/x", response=long_wait)
+    assert after.total == retry.total - 1
+    assert after.get_retry_after(long_wait) == 2
+
+
+def test_http_get_uses_session(monkeypatch):
+    calls = []
+
+    class FakeSession:
+        def request(self, method, url, **kwargs):
+            calls.append((method, url, kwargs))
+            return "resp"
+
+    monkeypatch.setattr(hu, "get_session", lambda: FakeSession())
+    assert hu.http_get("http://x", timeout=3) == "resp"
+    assert calls == [("GET", "http://x", {"timeout": 3})]
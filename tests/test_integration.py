@@ -98,3 +98,45 @@ def test_portfolio_manager_add_tickers(monkeypatch):
     assert set(result["Ticker"]) == {"AAA", "BBB"}
     counts = sector_counts(result)
     assert set(counts["Sector"]) == {"Tech", "Health"}
+
+
+def test_update_tickers_quotes_only(monkeypatch):
+    requested = []
+
+    def fake_refresh(tickers):
+        requested.extend(tickers)
+        return pd.DataFrame(
+            [{"Ticker": "AAA", "Name": "Alpha Inc", "Sector": "Tech", "Industry": "Software",
+              "Current Price": 11.0, "Market Cap": 110, "PE Ratio": 21.0, "Dividend Yield": 0.01}],
+            columns=fetching.BASIC_FIELDS,
+        )
+
+    def full_fetch(tk):
+        raise AssertionError(f"full fetch for {tk}")
+
+    monkeypatch.setattr(fetching, "refresh_quotes", fake_refresh)
+    monkeypatch.setattr(pm, "fetch_from_unified", full_fetch)
+    df = pd.DataFrame(
+        [
+            {"Ticker": "AAA", "Name": "Alpha", "Sector": "Tech", "Industry": "Software",
+             "Current Price": 10.0},
+            {"Ticker": "ZZZ", "Name": "Zeta", "Sector": "Energy", "Industry": "Oil",
+             "Current Price": 5.0},
+        ],
+        columns=pm.COLUMNS,
+    )
+    result = pm.update_tickers(df, quotes_only=True)
+    assert requested == ["AAA", "ZZZ"]
+    assert result.loc[0, "Current Price"] == 11.0
+    assert result.loc[1, "Current Price"] == 5.0
+
+
+def test_portfolio_menu_refreshes_prices(monkeypatch):
+    calls = []
+    monkeypatch.setattr(pm, "load_portfolio", lambda: pd.DataFrame(columns=pm.COLUMNS))
+    monkeypatch.setattr(pm, "save_portfolio", lambda df: None)
+    monkeypatch.setattr(pm, "update_tickers", lambda df, **kw: calls.append(kw) or df)
+    inputs = iter(["4", "6"])
+    monkeypatch.setattr("builtins.input", lambda *_args: next(inputs))
+    pm.main()
+    assert calls == [{"quotes_only": True}]
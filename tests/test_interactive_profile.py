@@ -36,4 +36,3 @@ def test_interactive_profile_openbb_only(monkeypatch):
     monkeypatch.setattr(cmp, "fetch_profile_yf", lambda s: pd.DataFrame())
     result = cmp.interactive_profile("AAA")
     assert result.equals(obb_df)
-
@@ -0,0 +1,78 @@
+"""Tests for the resumable job runner."""
+
+import pandas as pd
+import pytest
+
+import modules.data.fetching as fetching
+from modules.data.jobs import JobJournal, job_status, run_job
+
+
+def test_resume_skips_completed_and_retries_failed(tmp_path):
+    calls = []
+
+    def flaky(tk):
+        calls.append(tk)
+        if tk == "BBB":
+            raise ValueError("boom")
+        return {"value": len(calls)}
+
+    report = run_job("demo", ["aaa", "BBB", "CCC"], flaky, journal_dir=tmp_path)
+    assert report.completed == ["AAA", "CCC"]
+    assert report.failed == {"BBB": "boom"}
+    assert report.remaining == ["BBB"]
+
+    calls.clear()
+    report = run_job("demo", ["AAA", "BBB", "CCC"], lambda tk: calls.append(tk) or 1,
+                     journal_dir=tmp_path)
+    assert calls == ["BBB"]
+    assert report.skipped == ["AAA", "CCC"]
+    assert report.results["AAA"] == {"value": 1}
+    assert report.remaining == [] and report.failed == {}
+
+
+def test_interrupt_keeps_finished_tickers(tmp_path):
+    def interrupt(tk):
+        if tk == "CCC":
+            raise KeyboardInterrupt
+        return tk.lower()
+
+    with pytest.raises(KeyboardInterrupt):
+        run_job("demo", ["AAA", "BBB", "CCC", "DDD"], interrupt, journal_dir=tmp_path)
+    status = job_status("demo", ["AAA", "BBB", "CCC", "DDD"], journal_dir=tmp_path)
+    assert status.skipped == ["AAA", "BBB"]
+    assert status.remaining == ["CCC", "DDD"]
+
+
+def test_freshness_window_and_corrupt_line(tmp_path):
+    journal = JobJournal.for_job("demo", tmp_path)
+    journal.record("AAA", result=pd.NA)
+    with journal.path.open("a") as fh:
+        fh.write('{"ticker": "BB')  # truncated by a crash
+    assert journal.entries()["AAA"].result is None
+    assert job_status("demo", ["AAA"], journal_dir=tmp_path).skipped == ["AAA"]
+    assert job_status("demo", ["AAA"], fresh_for=-1, journal_dir=tmp_path).remaining == ["AAA"]
+
+
+def test_fetch_basic_stock_data_job(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_fetch(tk, **kwargs):
+        calls.append(tk)
+        return {"Ticker": tk, "Name": tk.lower(), "PE Ratio": pd.NA}
+
+    monkeypatch.setattr(fetching, "fetch_basic_stock_data", fake_fetch)
+    df, report = fetching.fetch_basic_stock_data_job(["AAA", "BBB"], journal_dir=tmp_path)
+    df, report = fetching.fetch_basic_stock_data_job(["AAA", "BBB"], journal_dir=tmp_path)
+    assert calls == ["AAA", "BBB"]
+    assert list(df["Name"]) == ["aaa", "bbb"]
+    assert df.loc[0, "PE Ratio"] is pd.NA
+    assert report.skipped == ["AAA", "BBB"]
+
+
+def test_fetch_basic_stock_data_job_accepts_generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetching, "fetch_basic_stock_data", lambda tk, **kw: {"Ticker": tk})
+    df, report = fetching.fetch_basic_stock_data_job(
+        (t for t in ["aaa", "bbb"]), journal_dir=tmp_path
+    )
+    assert report.completed == ["AAA", "BBB"]
+    assert list(df["Ticker"]) == ["AAA", "BBB"]
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from modules.data import merge
+
+
+def test_merge_sources_priority_and_provenance():
+    obb = pd.DataFrame(
+        [
+            {"Ticker": "aaa", "Name": "Acme", "Sector": "", "PE Ratio": pd.NA},
+            {"Ticker": "BBB", "Name": "Beta", "Sector": "Tech", "PE Ratio": pd.NA},
+        ]
+    )
+    yf = pd.DataFrame(
+        [
+            {"Ticker": "BBB", "Name": "Beta Inc", "Sector": "Technology", "PE Ratio": 12.0},
+            {"Ticker": "CCC", "Name": "Gamma", "Sector": "", "PE Ratio": None},
+        ]
+    )
+    result = merge.merge_sources(
+        {"openbb": obb, "yf": yf}, priority={"Sector": ["yf"]}
+    )
+    data = result.data.set_index("Ticker")
+    prov = result.provenance.set_index("Ticker")
+
+    assert list(data.index) == ["AAA", "BBB", "CCC"]
+    assert data.loc["BBB", "Name"] == "Beta"
+    assert data.loc["BBB", "Sector"] == "Technology"
+    assert data.loc["BBB", "PE Ratio"] == 12.0
+    assert data.loc["AAA", "Sector"] == ""
+    assert prov.loc["BBB", "Name"] == "openbb"
+    assert prov.loc["BBB", "Sector"] == "yf"
+    assert prov.loc["BBB", "PE Ratio"] == "yf"
+    assert pd.isna(prov.loc["AAA", "Sector"])
+    assert pd.isna(prov.loc["CCC", "PE Ratio"])
+
+    summary = merge.provenance_summary(result.provenance)
+    assert summary.loc["Name"].to_dict() == {"openbb": 2, "yf": 1, "missing": 0}
+    assert summary.loc["PE Ratio", "missing"] == 2
+
+
+def test_merge_sources_priority_from_settings(monkeypatch):
+    monkeypatch.setattr(
+        merge, "load_settings", lambda: {"merge": {"priority": {"Name": ["b"]}}}
+    )
+    a = pd.DataFrame([{"Ticker": "AAA", "Name": "A"}])
+    b = pd.DataFrame([{"Ticker": "AAA", "Name": "B"}])
+    result = merge.merge_sources({"a": a, "b": b})
+    assert result.data.loc[0, "Name"] == "B"
+    assert result.provenance.loc[0, "Name"] == "b"
+
+
+def test_merge_sources_requires_key():
+    with pytest.raises(ValueError):
+        merge.merge_sources({})
+    with pytest.raises(ValueError):
+        merge.merge_sources({"a": pd.DataFrame([{"Name": "A"}])})
+
+
+def test_merge_records_keeps_na():
+    row, sources = merge.merge_records(
+        {
+            "OpenBB": {"Ticker": "AAA", "Name": "Acme", "PE Ratio": pd.NA},
+            "yfinance/FMP": None,
+        }
+    )
+    assert row["Name"] == "Acme"
+    assert row["PE Ratio"] is pd.NA
+    assert sources == {"Name": "OpenBB", "PE Ratio": None}
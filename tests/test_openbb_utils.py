@@ -1,5 +1,7 @@
 import importlib
 import sys
+import threading
+import time
 from types import SimpleNamespace
 
 import modules.utils.openbb_utils as ou
@@ -40,3 +42,38 @@ def test_get_openbb_no_token(monkeypatch, capsys):
     assert "OPENBB_TOKEN environment variable not set" in out
     assert calls == []
     assert obb is dummy
+
+
+def test_get_openbb_concurrent_single_login(monkeypatch):
+    calls = []
+
+    def login(pat):
+        time.sleep(0.05)
+        calls.append(pat)
+
+    dummy = setup_dummy(monkeypatch, login)
+    monkeypatch.setenv("OPENBB_TOKEN", "tok")
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(ou.get_openbb())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [dummy] * 8
+    assert calls == ["tok"]
+    stats = ou.openbb_stats()
+    assert stats["imported"] and stats["logged_in"]
+    assert stats["login_seconds"] >= 0.05
+
+
+def test_warm_up_openbb(monkeypatch, capsys):
+    calls = []
+    dummy = setup_dummy(monkeypatch, calls.append)
+    monkeypatch.delenv("OPENBB_TOKEN", raising=False)
+    thread = ou.warm_up_openbb()
+    assert ou.warm_up_openbb() is thread
+    thread.join(1)
+    assert ou.openbb_stats()["imported"]
+    assert ou.get_openbb() is dummy
+    out = capsys.readouterr().out
+    assert out.count("OPENBB_TOKEN environment variable not set") == 1
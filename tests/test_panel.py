@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data.panel import StatementPanel, build_statement_panel
+
+
+def _income(dates, years, revenue, gross):
+    return pd.DataFrame(
+        {
+            "fiscal_year": years,
+            "fiscal_period": ["FY"] * len(years),
+            "revenue": revenue,
+            "gross_profit": gross,
+            "currency": ["USD"] * len(years),
+        },
+        index=pd.to_datetime(dates),
+    )
+
+
+@pytest.fixture
+def data():
+    return {
+        "aaa": {
+            "income": {"annual": _income(["2023-09-30", "2024-09-28"], [2023, 2024], [100.0, 200.0], [40.0, 90.0])},
+            "balance": {"annual": pd.DataFrame({"total_assets": [500.0]}, index=pd.to_datetime(["2024-09-28"]))},
+        },
+        "BBB": {
+            "income": {"annual": _income(["2024-06-30"], [2024], [0.0], [10.0])},
+            "balance": {"annual": pd.DataFrame()},
+        },
+    }
+
+
+def test_build_statement_panel_aligns_fiscal_periods(data):
+    panel = build_statement_panel(data)
+    assert list(panel.tickers) == ["AAA", "BBB"]
+    assert list(panel.periods) == ["2023-FY", "2024-FY"]
+    assert list(panel.items) == ["revenue", "gross_profit", "total_assets"]
+    assert panel.shape == (2, 2, 3)
+    assert panel.get("aaa", "2024-FY", "revenue") == 200.0
+    assert panel.mask[panel.ticker_index("BBB"), panel.period_index("2023-FY")].all()
+    # The balance sheet has no fiscal year columns and takes the income label
+    assert panel.get("AAA", "2024-FY", "total_assets") == 500.0
+
+
+def test_build_statement_panel_date_alignment(data):
+    panel = build_statement_panel(data, statements=["income"], align="date")
+    assert list(panel.periods) == ["2023-09-30", "2024-06-30", "2024-09-28"]
+    assert list(panel.items) == ["revenue", "gross_profit"]
+
+
+def test_build_statement_panel_prefers_date_column():
+    # Provider frames with a RangeIndex key periods by their date column
+    df = pd.DataFrame(
+        {"period_ending": pd.to_datetime(["2023-12-31", "2024-12-31"]), "revenue": [1.0, 2.0]}
+    )
+    panel = build_statement_panel({"CCC": {"income": {"annual": df}}}, align="date")
+    assert list(panel.periods) == ["2023-12-31", "2024-12-31"]
+    assert list(panel.items) == ["revenue"]
+    assert panel.get("CCC", "2024-12-31", "revenue") == 2.0
+
+
+def test_panel_slices_and_ratio(data):
+    panel = build_statement_panel(data, statements=["income"])
+    margins = panel.ratio("gross_profit", "revenue")
+    assert margins.loc["AAA", "2024-FY"] == 0.45
+    assert np.isnan(margins.loc["BBB", "2024-FY"])  # zero revenue
+    assert panel.item_frame("revenue").loc["AAA"].tolist() == [100.0, 200.0]
+    assert panel.period_frame("2024-FY").loc["BBB", "gross_profit"] == 10.0
+    assert panel.ticker_frame("AAA").shape == (2, 2)
+    assert panel.latest("revenue").to_dict() == {"AAA": 200.0, "BBB": 0.0}
+    assert panel.coverage()["revenue"] == 0.75
+    assert len(panel.to_frame()) == 3
+
+
+def test_panel_select(data):
+    panel = build_statement_panel(data).select(tickers=["bbb"], items=["gross_profit"])
+    assert panel.shape == (1, 2, 1)
+    assert panel.get("BBB", "2024-FY", "gross_profit") == 10.0
+    with pytest.raises(KeyError):
+        panel.select(items=["missing"])
+
+
+def test_statement_panel_shape_check():
+    with pytest.raises(ValueError):
+        StatementPanel(np.zeros((1, 2, 3)), ["A"], ["p"], ["x", "y", "z"])
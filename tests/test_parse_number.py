@@ -1,5 +1,21 @@
+import math
+
+import numpy as np
 import pandas as pd
-from modules.utils import parse_number, parse_human_number
+from modules.utils import (
+    parse_number,
+    parse_human_number,
+    parse_number_frame,
+    parse_number_record,
+    parse_number_series,
+)
+
+SAMPLES = [
+    "1", "1.5K", " 2,000 ", "3b", "1e3M", "-.5t", "inf", "-Infinity", "NaN",
+    "nanK", "K", "", "  ", "N/A", "1_000", "1__0", "1.", ".e5", "USD",
+    "2024-01-01", "1 K", "+5", "--5", "1e", "1.2.3M", "1\x00", "x" * 100,
+    None, pd.NA, np.nan, 3, 2.5, True, np.int64(4), pd.Timestamp("2024-01-01"),
+]
 
 
 def test_parse_number_numeric():
@@ -21,3 +37,78 @@ def test_parse_number_invalid():
 
 def test_parse_human_number_alias():
     assert parse_human_number("1M") == 1_000_000
+
+
+def _same(a, b):
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return type(a) is type(b) and (a is b or a == b)
+
+
+def test_parse_number_series_matches_scalar():
+    values = pd.Series(SAMPLES, dtype=object)
+    result = parse_number_series(values, infer=False)
+    for raw, got in zip(SAMPLES, result):
+        assert _same(parse_number(raw), got), raw
+    pd.testing.assert_series_equal(parse_number_series(values), values.map(parse_number))
+
+
+def test_parse_number_frame_matches_map():
+    df = pd.DataFrame(
+        {
+            "num": ["1.5B", "2,000", "3"],
+            "float": [1.0, 2.0, np.nan],
+            "text": ["USD", "USD", "EUR"],
+            "when": pd.date_range("2024-01-01", periods=3),
+            "mixed": [1.0, None, "2K"],
+        },
+        index=["2022", "2023", "2024"],
+    )
+    result = parse_number_frame(df)
+    pd.testing.assert_frame_equal(result, df.map(parse_number))
+    assert result["num"].dtype == float
+
+
+def test_parse_number_frame_matches_map_large():
+    # Enough strings for the column-wise path, including all-numeric columns
+    rng = np.random.default_rng(1)
+    rows = 3000
+    df = pd.DataFrame(
+        {
+            "samples": [SAMPLES[i % len(SAMPLES)] for i in range(rows)],
+            "suffixed": [f"{x:,.2f}{rng.choice(list('KMBTkmbt '))}" for x in rng.random(rows) * 1e4],
+            "plain": [f"{x:.6f}" for x in rng.random(rows)],
+            "text": ["USD"] * rows,
+        }
+    )
+    result = parse_number_frame(df)
+    pd.testing.assert_frame_equal(result, df.map(parse_number))
+    assert result["suffixed"].dtype == float and result["plain"].dtype == float
+    pd.testing.assert_series_equal(parse_number_series(df["suffixed"]), df["suffixed"].map(parse_number))
+
+
+def test_parse_number_record():
+    record = {"Ticker": "AAA", "Price": "1.5K", "Shares": "N/A"}
+    assert parse_number_record(record, ["Price", "Shares"]) == {
+        "Ticker": "AAA",
+        "Price": 1500.0,
+        "Shares": "N/A",
+    }
+
+
+def test_parse_number_series_matches_scalar_fuzz():
+    rng = np.random.default_rng(0)
+    alphabet = list("0123456789.,+-eEkKmMbBtT _ \t\n\x00nainfy")
+    fuzz = ["".join(rng.choice(alphabet, size=rng.integers(1, 8))) for _ in range(5000)]
+    fuzz += ["5\x00 ", "1\x00T", "2\x00k", "8e1\x00\n", "\x005", "1,0\x00"]
+    # Values pandas' own parser rounds or rejects differently from ``float()``
+    fuzz += ["0.30000000000000004", "3.14159265358979323846M", "123,456.123456789",
+             "2e308", "-2e308k", "1_000", "1_5K", "\u0661\u0662", "Infinity", "nanB", "USD"]
+    values = pd.Series(fuzz, dtype=object)
+    result = parse_number_series(values, infer=False)
+    for raw, got in zip(fuzz, result):
+        assert _same(parse_number(raw), got), repr(raw)
+    # Same inputs through the all-numeric fast path
+    numeric = [v for v in fuzz if isinstance(parse_number(v), float) and "," not in v]
+    for raw, got in zip(numeric, parse_number_series(pd.Series(numeric, dtype=object), infer=False)):
+        assert _same(parse_number(raw), got), repr(raw)
@@ -0,0 +1,104 @@
+"""Tests for the provider registry and YAML-configured HTTP providers."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import modules.data.fetching as fetching
+import modules.data.providers as providers
+from modules.data.providers import Provider, register_provider, unregister_provider
+
+YAML = """
+providers:
+  inhouse:
+    base_url: https://data.example.com/api
+    api_key: secret
+    profile: /v1/profile/{symbol}
+    results: data
+    batch_size: 2
+    auto: true
+    priority: 5
+    fields:
+      Name: profile.name
+      Sector: profile.sector
+      Current Price: quote.0.price
+"""
+
+
+@pytest.fixture
+def inhouse(tmp_path, monkeypatch):
+    path = tmp_path / "finance_api.yaml"
+    path.write_text(YAML)
+    monkeypatch.setattr(providers, "resolve_term", lambda x: x)
+    assert providers.load_configured_providers(path) == ["inhouse"]
+    yield providers.get_provider("inhouse")
+    unregister_provider("inhouse")
+
+
+def _record(symbol):
+    return {
+        "symbol": symbol,
+        "profile": {"name": f"{symbol} Inc", "sector": "Tech"},
+        "quote": [{"price": "1.5K"}],
+    }
+
+
+def test_yaml_provider_maps_field_paths(inhouse, monkeypatch):
+    urls = []
+
+    def fake_get(url, **kwargs):
+        urls.append((url, kwargs["params"]))
+        symbols = url.rsplit("/", 1)[1].split(",")
+        resp = MagicMock()
+        resp.json.return_value = {"data": [_record(s) for s in symbols if s != "NONE"]}
+        return resp
+
+    monkeypatch.setattr(providers, "http_get", fake_get)
+    row = fetching.fetch_basic_stock_data("AAA", provider="inhouse")
+    assert row["Name"] == "AAA Inc"
+    assert row["Current Price"] == 1500
+    assert row["Industry"] == ""
+    assert urls[0] == ("https://data.example.com/api/v1/profile/AAA", {"apikey": "secret"})
+
+    urls.clear()
+    df = fetching.fetch_basic_stock_data_batch(["AAA", "BBB", "CCC"], provider="inhouse")
+    assert list(df["Name"]) == ["AAA Inc", "BBB Inc", "CCC Inc"]
+    assert [u.rsplit("/", 1)[1] for u, _ in urls] == ["AAA,BBB", "CCC"]
+
+
+def test_auto_chain_follows_priority(inhouse, monkeypatch):
+    monkeypatch.setattr(fetching, "_fetch_from_yf", lambda t: None)
+    monkeypatch.setattr(inhouse, "fetch", lambda t: {"Ticker": t, "Name": "in-house"})
+    monkeypatch.setattr(fetching, "_fetch_from_fmp", lambda t: pytest.fail("FMP called"))
+    assert [p.name for p in providers.auto_providers()] == ["yf", "inhouse", "fmp"]
+    assert fetching.fetch_basic_stock_data("AAA", hedge=False)["Name"] == "in-house"
+
+
+def test_unknown_provider_lists_registered():
+    with pytest.raises(ValueError, match="fmp, yf"):
+        fetching.fetch_basic_stock_data("AAA", provider="nope")
+
+
+def test_max_concurrency_limits_parallel_calls():
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow(ticker):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        return {"Ticker": ticker, "Name": ticker}
+
+    register_provider(Provider("slow", slow, max_concurrency=2))
+    try:
+        fetching.fetch_basic_stock_data_batch(
+            [f"T{i}" for i in range(6)], provider="slow", max_workers=6
+        )
+    finally:
+        unregister_provider("slow")
+    assert peak[0] == 2
@@ -0,0 +1,38 @@
+"""Tests for the provider token-bucket rate limiters."""
+
+import json
+
+import modules.config_utils as config_utils
+import modules.utils.rate_limit as rl
+
+
+def test_burst_then_wait(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(rl.time, "sleep", lambda s: sleeps.append(s))
+    bucket = rl.TokenBucket(10, 2, name="t")
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    waited = bucket.acquire()
+    assert 0 < waited <= 0.1
+    assert sleeps == [waited]
+    stats = bucket.stats()
+    assert stats["calls"] == 3
+    assert stats["waited"] == 1
+    assert stats["max_wait"] == waited
+
+
+def test_zero_rate_is_unlimited():
+    bucket = rl.TokenBucket(0)
+    assert all(bucket.acquire() == 0 for _ in range(100))
+
+
+def test_get_limiter_reads_settings(monkeypatch, tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"rate_limits": {"fmp": {"rate": 1, "burst": 3}}}))
+    monkeypatch.setattr(config_utils, "SETTINGS_PATH", path)
+    rl.reset_limiters()
+    limiter = rl.get_limiter("fmp")
+    assert limiter is rl.get_limiter("fmp")
+    assert (limiter.rate, limiter.burst) == (1.0, 3.0)
+    assert "fmp" in rl.rate_limit_stats()
+    rl.reset_limiters()
@@ -0,0 +1,49 @@
+"""Tests for in-flight request coalescing."""
+
+import threading
+
+import pytest
+
+from modules.utils.singleflight import SingleFlight, singleflight_stats
+
+
+def test_concurrent_callers_share_one_call():
+    group = SingleFlight("test-share")
+    release = threading.Event()
+    calls = []
+
+    def slow(tk):
+        calls.append(tk)
+        release.wait(2)
+        return {"Ticker": tk}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(group.do("AAA", slow, "AAA")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    while group.stats()["coalesced"] < 3:
+        pass
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert calls == ["AAA"]
+    assert results == [{"Ticker": "AAA"}] * 4
+    # followers get copies, not the leader's object
+    assert len({id(r) for r in results}) == 4
+    assert singleflight_stats()["test-share"]["executed"] == 1
+
+
+def test_errors_are_shared_and_key_released():
+    group = SingleFlight("test-error")
+
+    def boom():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        group.do("k", boom)
+    assert group.do("k", lambda: 1) == 1
+    assert group.stats()["in_flight"] == 0
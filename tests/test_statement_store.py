@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import modules.data.financials as fin
+from modules.data import statement_store as ss
+
+
+def _income(revenue):
+    return pd.DataFrame(
+        {"revenue": revenue, "net_income": [1.0, 2.0, 3.0][: len(revenue)]},
+        index=pd.to_datetime(["2022-12-31", "2023-12-31", "2024-12-31"][: len(revenue)]),
+    )
+
+
+def test_ingest_appends_only_delta(tmp_path):
+    store = ss.StatementStore(tmp_path)
+    first = store.ingest("aaa", "income", "annual", _income([10.0, 20.0]))
+    assert first.summary() == {"added": 2, "changed": 0, "unchanged": 0}
+
+    again = store.ingest("AAA", "income", "annual", _income([10.0, 20.0]))
+    assert again.summary() == {"added": 0, "changed": 0, "unchanged": 2}
+    assert again.delta.empty
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+    update = store.ingest("AAA", "income", "annual", _income([10.0, 25.0, 30.0]))
+    assert update.summary() == {"added": 1, "changed": 1, "unchanged": 1}
+    assert list(update.delta["revenue"]) == [25.0, 30.0]
+
+    df = store.read(["AAA"])
+    assert list(df["fiscal_date"]) == ["2022-12-31", "2023-12-31", "2024-12-31"]
+    assert list(df["revenue"]) == [10.0, 25.0, 30.0]
+    assert list(df.columns[:4]) == ss.KEY_COLUMNS
+
+    assert store.compact() == 1
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+    pd.testing.assert_frame_equal(store.read(["AAA"]), df)
+
+
+def test_row_hashes_ignore_dtype_and_null_columns():
+    df = pd.DataFrame({"revenue": [10, 20], "name": ["a", None]})
+    same = pd.DataFrame(
+        {"name": ["a", None], "revenue": [10.0, 20.0], "new_item": [None, None]}
+    )
+    assert list(ss.row_hashes(df)) == list(ss.row_hashes(same))
+    assert list(ss.row_hashes(df)) == list(ss.row_hashes(df.astype(object)))
+
+    # a column filled only for later rows leaves earlier hashes alone
+    wider = df.assign(new_item=[None, 5.0])
+    hashes, wider_hashes = ss.row_hashes(df), ss.row_hashes(wider)
+    assert hashes[0] == wider_hashes[0]
+    assert hashes[1] != wider_hashes[1]
+
+    swapped = pd.DataFrame({"revenue": [20, 10], "name": ["a", None]})
+    assert ss.row_hashes(swapped)[0] != hashes[0]
+
+
+def test_read_projects_and_filters(tmp_path):
+    store = ss.StatementStore(tmp_path)
+    store.ingest("AAA", "income", "annual", _income([10.0, 20.0, 30.0]))
+    store.ingest("BBB", "income", "quarter", _income([1.0]))
+    store.ingest("BBB", "balance", "annual", pd.DataFrame({"assets": [5.0]}, index=["2024"]))
+
+    df = store.read(statements=["income"], columns=["revenue"], start="2023-01-01")
+    assert list(df.columns) == ss.KEY_COLUMNS + ["revenue"]
+    assert list(zip(df["ticker"], df["fiscal_date"])) == [
+        ("AAA", "2023-12-31"),
+        ("AAA", "2024-12-31"),
+    ]
+    assert store.partitions(tickers=["bbb"]) == [
+        ("BBB", "balance", "annual"),
+        ("BBB", "income", "quarter"),
+    ]
+    assert store.read(["ZZZ"]).empty
+
+
+def test_fetch_and_store_sends_only_delta(monkeypatch, tmp_path):
+    store = ss.StatementStore(tmp_path)
+    monkeypatch.setattr(fin, "statement_store_enabled", lambda: True)
+    monkeypatch.setattr(fin, "get_statement_store", lambda: store)
+    frames = {"income": {"annual": _income([10.0, 20.0]), "quarter": pd.DataFrame()}}
+    monkeypatch.setattr(fin, "fetch_statements", lambda t, s=None: frames)
+    sent = []
+    monkeypatch.setattr(fin, "store_statements", lambda data: sent.append(data))
+
+    fin.fetch_and_store_statements("AAA")
+    fin.fetch_and_store_statements("AAA")
+    assert len(sent[0]["income"]["annual"]) == 2
+    assert sent[1]["income"]["annual"].empty
@@ -1,3 +1,5 @@
+import time
+
 import pandas as pd
 import pytest
 from modules.data import unified_fetcher as uf
@@ -15,7 +17,7 @@ def test_openbb_success(monkeypatch):
         "Dividend Yield": 0.0,
     }
     monkeypatch.setattr(uf, "_from_openbb", lambda t: sample)
-    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t: sample)
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: sample)
     monkeypatch.setattr(uf, "resolve_term", lambda x: x)
     result = uf.fetch_company_data("AAA")
     assert result == sample
@@ -43,7 +45,7 @@ def test_openbb_partial(monkeypatch):
         "Dividend Yield": 0.1,
     }
     monkeypatch.setattr(uf, "_from_openbb", lambda t: openbb)
-    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t: yf)
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: yf)
     monkeypatch.setattr(uf, "resolve_term", lambda x: x)
     result = uf.fetch_company_data("AAA")
     assert result["Sector"] == "Tech"
@@ -53,14 +55,14 @@ def test_openbb_partial(monkeypatch):
 def test_yf_fallback(monkeypatch):
     data = {"Ticker": "AAA"}
     monkeypatch.setattr(uf, "_from_openbb", lambda t: None)
-    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t: data)
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: data)
     monkeypatch.setattr(uf, "resolve_term", lambda x: x)
     assert uf.fetch_company_data("AAA") == data
 
 
 def test_all_fail(monkeypatch):
     monkeypatch.setattr(uf, "_from_openbb", lambda t: None)
-    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t: (_ for _ in ()).throw(Exception("bad")))
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: (_ for _ in ()).throw(Exception("bad")))
     monkeypatch.setattr(uf, "resolve_term", lambda x: x)
     assert uf.fetch_company_data("AAA") is None
 
@@ -70,6 +72,206 @@ def test_no_openbb(monkeypatch):
     def boom(t):
         raise AssertionError("should not call openbb")
     monkeypatch.setattr(uf, "_from_openbb", boom)
-    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t: data)
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: data)
     monkeypatch.setattr(uf, "resolve_term", lambda x: x)
     assert uf.fetch_company_data("AAA", use_openbb=False) == data
+
+
+def _full(name):
+    return {
+        "Ticker": "AAA",
+        "Name": name,
+        "Sector": "Tech",
+        "Industry": "Software",
+        "Current Price": 1.0,
+        "Market Cap": 10,
+        "PE Ratio": 5.0,
+        "Dividend Yield": 0.01,
+    }
+
+
+def test_sources_fetched_concurrently(monkeypatch):
+    def slow(value):
+        def fetch(t, **k):
+            time.sleep(0.2)
+            return value
+        return fetch
+
+    monkeypatch.setattr(uf, "_from_openbb", slow({"Ticker": "AAA", "Name": "OpenBB"}))
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", slow(_full("yf")))
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    start = time.perf_counter()
+    data = uf.fetch_company_data("AAA")
+    assert time.perf_counter() - start < 0.35
+    assert data["Name"] == "OpenBB"
+    assert data["PE Ratio"] == 5.0
+
+
+def test_deadline_merges_available_sources(monkeypatch):
+    monkeypatch.setattr(uf, "_from_openbb", lambda t: {"Ticker": "AAA", "Name": "OpenBB"})
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: time.sleep(0.5) or _full("yf"))
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    monkeypatch.setattr(uf, "load_settings", lambda: {"unified_fetcher": {"deadline": 0.05}})
+    data = uf.fetch_company_data("AAA")
+    assert data == {"Ticker": "AAA", "Name": "OpenBB"}
+
+
+def _profile(ticker, **extra):
+    return pd.DataFrame(
+        [
+            {
+                "symbol": ticker,
+                "name": "OpenBB",
+                "sector": "Tech",
+                "industry_category": "Software",
+                "last_price": 1.0,
+                "market_cap": 10,
+                "dividend_yield": 0.01,
+                **extra,
+            }
+        ]
+    )
+
+
+def test_complete_openbb_skips_yf(monkeypatch):
+    monkeypatch.setattr(uf, "fetch_profile_openbb", lambda t: _profile(t, pe_ratio=5.0))
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: pytest.fail("yf called"))
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    monkeypatch.setattr(
+        uf, "load_settings", lambda: {"unified_fetcher": {"openbb_head_start": 1}}
+    )
+    data = uf.fetch_company_data("AAA")
+    assert data["Name"] == "OpenBB"
+    assert data["PE Ratio"] == 5.0
+
+
+def test_openbb_without_pe_queries_yf(monkeypatch):
+    calls = []
+    monkeypatch.setattr(uf, "fetch_profile_openbb", _profile)
+    monkeypatch.setattr(
+        uf, "fetch_basic_stock_data", lambda t, **k: calls.append(t) or _full("yf")
+    )
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    monkeypatch.setattr(
+        uf, "load_settings", lambda: {"unified_fetcher": {"openbb_head_start": 1}}
+    )
+    data = uf.fetch_company_data("AAA")
+    assert calls == ["AAA"]
+    assert data["Name"] == "OpenBB"
+    assert data["PE Ratio"] == 5.0
+
+
+def test_batch_never_hedges(monkeypatch):
+    kwargs = []
+    monkeypatch.setattr(uf, "_from_openbb_many", lambda tickers: {})
+    monkeypatch.setattr(
+        uf,
+        "fetch_basic_stock_data",
+        lambda t, **k: kwargs.append(k) or _full("yf") | {"Ticker": t},
+    )
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    uf.fetch_company_data_batch(["AAA", "BBB"])
+    assert [k.get("hedge") for k in kwargs] == [False, False]
+
+
+def test_batch_skips_yf_for_complete_openbb(monkeypatch):
+    monkeypatch.setattr(
+        uf,
+        "fetch_profiles_openbb",
+        lambda tickers: {
+            "AAA": _profile("AAA", pe_ratio=5.0),
+            "BBB": _profile("BBB"),
+        },
+    )
+    calls = []
+    monkeypatch.setattr(
+        uf,
+        "fetch_basic_stock_data",
+        lambda t, **k: calls.append(t) or _full("yf") | {"Ticker": t},
+    )
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    result = uf.fetch_company_data_batch(["AAA", "BBB"])
+    assert calls == ["BBB"]
+    assert result["AAA"]["PE Ratio"] == 5.0
+    assert result["BBB"]["PE Ratio"] == 5.0
+
+
+def test_fetch_and_store_batch_reports_status(monkeypatch):
+    monkeypatch.setattr(uf, "_from_openbb_many", lambda tickers: {})
+
+    def fake_basic(t, **k):
+        if t == "BAD":
+            raise ValueError("no data")
+        return {"Ticker": t, "Name": t.lower()}
+
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", fake_basic)
+    prepared = []
+    monkeypatch.setattr(uf, "prepare_records", lambda c, r: prepared.append(len(r)) or list(r))
+    inserted = []
+
+    def fake_insert(collection, records):
+        inserted.append([r["Ticker"] for r in records])
+        return [] if "CCC" in inserted[-1] else records
+
+    monkeypatch.setattr(uf, "insert_items", fake_insert)
+    report = uf.fetch_and_store_batch(["aaa", "BAD", "BBB", "CCC"], chunk_size=2)
+    assert prepared == [3]
+    assert inserted == [["AAA", "BBB"], ["CCC"]]
+    assert dict(zip(report["Ticker"], report["Status"])) == {
+        "AAA": "stored",
+        "BAD": "fetch_failed",
+        "BBB": "stored",
+        "CCC": "insert_failed",
+    }
+
+
+def test_batch_uses_multi_symbol_openbb(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        uf, "_from_openbb_many", lambda tickers: calls.append(list(tickers)) or {
+            t: {"Ticker": t, "Name": f"{t} obb"} for t in tickers
+        }
+    )
+    monkeypatch.setattr(uf, "_from_openbb", lambda t: pytest.fail("per-ticker OpenBB call"))
+    monkeypatch.setattr(uf, "fetch_basic_stock_data", lambda t, **k: _full("yf") | {"Ticker": t})
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x)
+    result = uf.fetch_company_data_batch(["AAA", "BBB"])
+    assert calls == [["AAA", "BBB"]]
+    assert result["BBB"]["Name"] == "BBB obb"
+    assert result["BBB"]["PE Ratio"] == 5.0
+
+
+def test_batch_merges_all_tickers_at_once(monkeypatch):
+    monkeypatch.setattr(
+        uf,
+        "_from_openbb_many",
+        lambda tickers: {
+            "AAA": {"Ticker": "AAA", "Name": "A obb", "Sector": "", "Current Price": 1.0},
+            "BBB": None,
+        },
+    )
+    monkeypatch.setattr(
+        uf,
+        "fetch_basic_stock_data",
+        lambda t, **k: {"Ticker": t, "Name": f"{t} yf", "Sector": "Tech", "PE Ratio": 5.0},
+    )
+    monkeypatch.setattr(uf, "resolve_term", lambda x: x.upper())
+    calls = []
+    merge = uf.merge_sources
+    monkeypatch.setattr(uf, "merge_sources", lambda frames: calls.append(frames) or merge(frames))
+    monkeypatch.setattr(uf, "merge_records", lambda *a, **k: pytest.fail("per-ticker merge"))
+
+    result = uf.fetch_company_data_batch(["aaa", "bbb"])
+    assert len(calls) == 1
+    assert {n: list(df["Ticker"]) for n, df in calls[0].items()} == {
+        "OpenBB": ["AAA"],
+        "yfinance/FMP": ["AAA", "BBB"],
+    }
+    assert result["AAA"] == {
+        "Ticker": "AAA",
+        "Name": "A obb",
+        "Sector": "TECH",
+        "Current Price": 1.0,
+        "PE Ratio": 5.0,
+    }
+    assert result["BBB"] == {"Ticker": "BBB", "Name": "BBB yf", "Sector": "TECH", "PE Ratio": 5.0}